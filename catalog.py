@@ -0,0 +1,231 @@
+import os
+import json
+import time
+import sqlite3
+import threading
+import requests
+from gamebanana_api import client as api_client
+from search_index import tokenize, record_category_id
+
+CATALOG_DB_PATH = os.path.join("cache", "catalog.sqlite3")
+CATALOG_SYNC_PAGE_SIZE = 50
+CATALOG_SYNC_PAGE_DELAY = 0.5
+CATALOG_SYNC_MAX_PAGES = 40
+CATALOG_MISSING_STATUS_CODES = (404, 410)
+CATALOG_FULL_SYNC_INTERVAL = 7 * 24 * 3600
+CATALOG_SORTS = {
+    "new": "date_added DESC",
+    "updated": "date_modified DESC",
+    "default": "MAX(date_added, date_modified) DESC",
+    "likes": "likes DESC",
+    "views": "views DESC",
+}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS mods (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL DEFAULT '',
+    author TEXT NOT NULL DEFAULT '',
+    category_id INTEGER,
+    category_name TEXT NOT NULL DEFAULT '',
+    date_added INTEGER NOT NULL DEFAULT 0,
+    date_modified INTEGER NOT NULL DEFAULT 0,
+    likes INTEGER NOT NULL DEFAULT 0,
+    views INTEGER NOT NULL DEFAULT 0,
+    nsfw INTEGER NOT NULL DEFAULT 0,
+    record TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS mods_date_added ON mods(date_added);
+CREATE INDEX IF NOT EXISTS mods_date_modified ON mods(date_modified);
+CREATE INDEX IF NOT EXISTS mods_likes ON mods(likes);
+CREATE INDEX IF NOT EXISTS mods_views ON mods(views);
+CREATE INDEX IF NOT EXISTS mods_category ON mods(category_id);
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE IF NOT EXISTS sync_seen (id INTEGER PRIMARY KEY);
+"""
+
+FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS mods_fts USING fts5(name, author, category_name, content='mods', content_rowid='id',
+                                                      tokenize='{tokenizer}');
+CREATE TRIGGER IF NOT EXISTS mods_fts_insert AFTER INSERT ON mods BEGIN
+    INSERT INTO mods_fts(rowid, name, author, category_name) VALUES (new.id, new.name, new.author, new.category_name);
+END;
+CREATE TRIGGER IF NOT EXISTS mods_fts_delete AFTER DELETE ON mods BEGIN
+    INSERT INTO mods_fts(mods_fts, rowid, name, author, category_name) VALUES ('delete', old.id, old.name, old.author, old.category_name);
+END;
+CREATE TRIGGER IF NOT EXISTS mods_fts_update AFTER UPDATE ON mods BEGIN
+    INSERT INTO mods_fts(mods_fts, rowid, name, author, category_name) VALUES ('delete', old.id, old.name, old.author, old.category_name);
+    INSERT INTO mods_fts(rowid, name, author, category_name) VALUES (new.id, new.name, new.author, new.category_name);
+END;
+"""
+FTS_TOKENIZERS = ("unicode61 remove_diacritics 2", "unicode61 remove_diacritics 1")
+
+UPSERT_SQL = """
+INSERT INTO mods (id, name, author, category_id, category_name, date_added, date_modified, likes, views, nsfw, record)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT(id) DO UPDATE SET
+    name = excluded.name, author = excluded.author, category_id = excluded.category_id, category_name = excluded.category_name,
+    date_added = excluded.date_added, date_modified = excluded.date_modified, likes = excluded.likes, views = excluded.views,
+    nsfw = excluded.nsfw, record = excluded.record
+WHERE mods.record != excluded.record
+"""
+
+
+class ModCatalog:
+    def __init__(self, path=CATALOG_DB_PATH):
+        directory = os.path.dirname(path)
+        if directory: os.makedirs(directory, exist_ok=True)
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript(SCHEMA)
+        self.has_fts = False
+        for tokenizer in FTS_TOKENIZERS:
+            try:
+                self.conn.executescript(FTS_SCHEMA.format(tokenizer=tokenizer))
+                self.has_fts = True
+                break
+            except sqlite3.OperationalError as e:
+                error = e
+        if not self.has_fts:
+            print(f"FTS5 not available, catalog search will use LIKE: {error}")
+        self.conn.commit()
+        self._ready = self._get_meta("last_full_sync") is not None
+
+    def is_ready(self):
+        return self._ready
+
+    def _get_meta(self, key):
+        with self.lock:
+            row = self.conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def _set_meta(self, key, value):
+        with self.lock, self.conn:
+            if value is None: self.conn.execute("DELETE FROM meta WHERE key = ?", (key,))
+            else: self.conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, str(value)))
+
+    def upsert_records(self, records):
+        changed = 0
+        with self.lock, self.conn:
+            for record in records:
+                if record.get('_idRow') is None: continue
+                cursor = self.conn.execute(UPSERT_SQL, (
+                    record['_idRow'], record.get('_sName') or '', (record.get('_aSubmitter') or {}).get('_sName') or '',
+                    record_category_id(record), (record.get('_aRootCategory') or {}).get('_sName') or '',
+                    record.get('_tsDateAdded') or 0, record.get('_tsDateModified') or 0,
+                    record.get('_nLikeCount') or 0, record.get('_nViewCount') or 0,
+                    int(bool(record.get('_bHasContentRatings', False))), json.dumps(record, ensure_ascii=False, sort_keys=True)))
+                changed += cursor.rowcount
+        return changed
+
+    def _mark_seen(self, records):
+        with self.lock, self.conn:
+            self.conn.executemany("INSERT OR IGNORE INTO sync_seen (id) VALUES (?)",
+                                  ((record['_idRow'],) for record in records if record.get('_idRow') is not None))
+
+    def _reset_seen(self):
+        with self.lock, self.conn:
+            self.conn.execute("DELETE FROM sync_seen")
+
+    def _delete_missing(self, cancel_token):
+        with self.lock:
+            unseen = [row[0] for row in self.conn.execute("SELECT id FROM mods WHERE id NOT IN (SELECT id FROM sync_seen)")]
+        deleted = 0
+        for mod_id in unseen:
+            try:
+                api_client.mod_profile(mod_id, properties="_idRow", cancel_token=cancel_token, cached=False)
+            except requests.HTTPError as e:
+                if e.response is None or e.response.status_code not in CATALOG_MISSING_STATUS_CODES: continue
+                with self.lock, self.conn:
+                    deleted += self.conn.execute("DELETE FROM mods WHERE id = ?", (mod_id,)).rowcount
+            except requests.RequestException:
+                continue
+            time.sleep(CATALOG_SYNC_PAGE_DELAY)
+        self._reset_seen()
+        return deleted
+
+    @staticmethod
+    def _fetch_page(game_id, page, cancel_token):
+        params = {'_nPage': page, '_nPerpage': CATALOG_SYNC_PAGE_SIZE, '_sSort': 'Generic_LatestModified',
+                  '_aFilters[Generic_Game]': game_id}
+        return api_client.mod_index(params, cancel_token=cancel_token, cached=False)
+
+    def _sync_recent(self, game_id, watermark, mark_seen, cancel_token):
+        newest, changed, page = watermark, 0, 1
+        while True:
+            data = self._fetch_page(game_id, page, cancel_token)
+            records = data.get('_aRecords', [])
+            changed += self.upsert_records(records)
+            if mark_seen: self._mark_seen(records)
+            modified = [record.get('_tsDateModified') or 0 for record in records]
+            newest = max([newest] + modified)
+            if not records or data.get('_aMetadata', {}).get('_bIsComplete') or min(modified) < watermark: break
+            page += 1
+            time.sleep(CATALOG_SYNC_PAGE_DELAY)
+        return newest, changed
+
+    def sync(self, game_id, cancel_token=None, on_progress=None):
+        watermark = int(self._get_meta("last_modified_ts") or 0)
+        walk_page = self._get_meta("full_sync_page")
+        if walk_page is None and time.time() - float(self._get_meta("last_full_sync") or 0) > CATALOG_FULL_SYNC_INTERVAL:
+            self._reset_seen()
+            walk_page = 1
+        newest, changed = watermark, 0
+        if watermark:
+            newest, changed = self._sync_recent(game_id, watermark, walk_page is not None, cancel_token)
+
+        if walk_page is not None:
+            page = max(1, int(walk_page) - 1)
+            for fetched in range(1, CATALOG_SYNC_MAX_PAGES + 1):
+                data = self._fetch_page(game_id, page, cancel_token)
+                records = data.get('_aRecords', [])
+                changed += self.upsert_records(records)
+                self._mark_seen(records)
+                newest = max([newest] + [record.get('_tsDateModified') or 0 for record in records])
+                metadata = data.get('_aMetadata', {})
+                walk_complete = not records or metadata.get('_bIsComplete')
+                if on_progress:
+                    synced = (page - 1) * CATALOG_SYNC_PAGE_SIZE + len(records)
+                    on_progress(synced, max(synced, metadata.get('_nRecordCount') or 0))
+                page += 1
+                if walk_complete or fetched == CATALOG_SYNC_MAX_PAGES: break
+                time.sleep(CATALOG_SYNC_PAGE_DELAY)
+            if walk_complete:
+                newest, recent_changed = self._sync_recent(game_id, newest, True, cancel_token)
+                changed += recent_changed + self._delete_missing(cancel_token)
+                self._set_meta("last_full_sync", time.time())
+                self._set_meta("full_sync_page", None)
+            else:
+                self._set_meta("full_sync_page", page)
+        self._set_meta("last_modified_ts", newest)
+        became_ready = not self._ready and self._get_meta("last_full_sync") is not None
+        if became_ready: self._ready = True
+        return changed > 0 or became_ready
+
+    def sync_pending(self):
+        return self._get_meta("full_sync_page") is not None
+
+    def has_category(self, category_id):
+        with self.lock:
+            return self.conn.execute("SELECT 1 FROM mods WHERE category_id = ? LIMIT 1", (category_id,)).fetchone() is not None
+
+    def query(self, search="", category_id=None, include_nsfw=False, sort="new", limit=50, offset=0):
+        clauses, args = [], []
+        tokens = tokenize(search)
+        if tokens and self.has_fts:
+            clauses.append("id IN (SELECT rowid FROM mods_fts WHERE mods_fts MATCH ?)")
+            args.append(" ".join(f'"{token}"*' for token in tokens))
+        for token in (tokens if not self.has_fts else []):
+            clauses.append("(name LIKE ? OR author LIKE ? OR category_name LIKE ?)")
+            args.extend([f"%{token}%"] * 3)
+        if category_id is not None:
+            clauses.append("category_id = ?")
+            args.append(category_id)
+        if not include_nsfw:
+            clauses.append("nsfw = 0")
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        sql = f"SELECT record FROM mods{where} ORDER BY {CATALOG_SORTS.get(sort, CATALOG_SORTS['new'])}, id DESC LIMIT ? OFFSET ?"
+        with self.lock:
+            rows = self.conn.execute(sql, args + [limit, offset]).fetchall()
+        return [json.loads(row[0]) for row in rows]
@@ -0,0 +1,101 @@
+import os
+import json
+import threading
+
+DISK_USAGE_CACHE_PATH = os.path.join("cache", "disk_usage.json")
+
+
+class DiskUsageScanner:
+    def __init__(self, path=DISK_USAGE_CACHE_PATH):
+        self.path = path
+        self.lock = threading.Lock()
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                self.directories = json.load(f)
+        except (OSError, ValueError):
+            self.directories = {}
+        self._visited = set()
+        self._changed = False
+
+    def _scan_directory(self, path):
+        try: mtime = os.stat(path).st_mtime
+        except OSError: return 0, 0
+        self._visited.add(path)
+        entry = self.directories.get(path)
+        if entry is None or entry["mtime"] != mtime:
+            size = files = 0
+            subdirs = []
+            try:
+                with os.scandir(path) as items:
+                    for item in items:
+                        try:
+                            if item.is_dir(follow_symlinks=False):
+                                subdirs.append(item.name)
+                            elif item.is_file(follow_symlinks=False):
+                                size += item.stat(follow_symlinks=False).st_size
+                                files += 1
+                        except OSError: pass
+            except OSError:
+                return 0, 0
+            entry = self.directories[path] = {"mtime": mtime, "size": size, "files": files, "dirs": subdirs}
+            self._changed = True
+        size, files = entry["size"], entry["files"]
+        for name in entry["dirs"]:
+            sub_size, sub_files = self._scan_directory(os.path.join(path, name))
+            size += sub_size
+            files += sub_files
+        return size, files
+
+    def _measure_children(self, root):
+        usage = {}
+        try:
+            with os.scandir(root) as iterator:
+                items = list(iterator)
+        except OSError:
+            return usage
+        for item in items:
+            try:
+                if item.is_dir(follow_symlinks=False): size, files = self._scan_directory(item.path)
+                else: size, files = item.stat(follow_symlinks=False).st_size, 1
+            except OSError: continue
+            usage[item.name] = {"size": size, "files": files}
+        return usage
+
+    def scan(self, roots, itemized=()):
+        result = {"totals": {}, "items": {}}
+        with self.lock:
+            self._visited = set()
+            for key, paths in roots.items():
+                total = {"size": 0, "files": 0}
+                items = {}
+                for path in paths:
+                    if key in itemized:
+                        children = self._measure_children(path)
+                        items.update(children)
+                        parts = children.values()
+                    else:
+                        size, files = self._scan_directory(path)
+                        parts = [{"size": size, "files": files}]
+                    for usage in parts:
+                        total["size"] += usage["size"]
+                        total["files"] += usage["files"]
+                result["totals"][key] = total
+                if key in itemized:
+                    result["items"][key] = items
+            if len(self._visited) != len(self.directories):
+                self.directories = {path: entry for path, entry in self.directories.items() if path in self._visited}
+                self._changed = True
+            if self._changed:
+                self._save()
+        return result
+
+    def _save(self):
+        try:
+            directory = os.path.dirname(self.path)
+            if directory: os.makedirs(directory, exist_ok=True)
+            with open(self.path + ".tmp", 'w', encoding='utf-8') as f:
+                json.dump(self.directories, f, ensure_ascii=False)
+            os.replace(self.path + ".tmp", self.path)
+            self._changed = False
+        except OSError as e:
+            print(f"Could not write disk usage cache: {e}")
@@ -1,23 +1,78 @@
 import os
 import re
+import json
+import time
+import heapq
+import hashlib
+import itertools
 import requests
 import threading
 import urllib.parse
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from urllib3.exceptions import ProtocolError, ReadTimeoutError
 from datetime import datetime
 
-from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QScrollArea, QGridLayout, QLabel,
-                             QFrame, QPushButton, QMessageBox, QDialog, QListWidget,
+from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QLabel, QListView, QStyledItemDelegate, QStyle,
+                             QFrame, QMessageBox, QDialog, QListWidget,
                              QListWidgetItem, QDialogButtonBox, QHBoxLayout, QLineEdit,
                              QComboBox, QCheckBox, QSpacerItem, QSizePolicy)
-from PyQt6.QtCore import Qt, pyqtSignal, QObject, QUrl, QSize
-from PyQt6.QtGui import QPixmap, QDesktopServices
+from PyQt6.QtCore import (Qt, pyqtSignal, QObject, QUrl, QSize, QTimer, QAbstractListModel, QModelIndex,
+                          QRect, QRectF, QPoint, QPointF, QEvent)
+from PyQt6.QtGui import QPixmap, QImage, QDesktopServices, QPainter, QColor, QPen, QFont, QFontMetrics, QStaticText
 
 from translation import Translator
+from gamebanana_api import client as api_client, RateLimiter, CancelToken, RequestCancelled
+from search_index import ModSearchIndex
+from catalog import ModCatalog
+from image_loader import image_loader, preview_image_url, device_pixel_ratio, device_size, IMAGE_PRIORITY_PREFETCH
+from pixmap_cache import pixmap_cache
 
 SPARKING_ZERO_GAMEBANANA_ID = 21179
 DOWNLOADS_DIR = "downloads"
 MODS_PER_PAGE = 18
 API_MODS_PER_CALL = 18
+CHECKSUM_RETRIES = 1
+DOWNLOAD_MAX_RETRIES = 5
+DOWNLOAD_BACKOFF_BASE = 1.0
+DOWNLOAD_BACKOFF_MAX = 30.0
+PART_SUFFIX = ".part"
+PART_META_SAVE_INTERVAL = 4 * 1024 * 1024
+DEFAULT_DOWNLOAD_SEGMENTS = 1
+MAX_DOWNLOAD_SEGMENTS = 8
+SEGMENTED_MIN_SIZE = 16 * 1024 * 1024
+DEFAULT_MAX_CONCURRENT_DOWNLOADS = 2
+DOWNLOAD_PRIORITY_HIGH = 0
+DOWNLOAD_PRIORITY_NORMAL = 1
+MIN_DOWNLOAD_CHUNK_SIZE = 64 * 1024
+MAX_DOWNLOAD_CHUNK_SIZE = 4 * 1024 * 1024
+CHUNK_TARGET_SECONDS = 0.25
+PROGRESS_MIN_INTERVAL = 0.1
+PROGRESS_REFRESH_INTERVAL = 1.0
+SPEED_SMOOTHING = 0.3
+BROWSE_LISTINGS_LIMIT = 8
+SEARCH_DEBOUNCE_MS = 300
+CARD_MIN_WIDTH = 280
+CARD_SPACING = 15
+CARD_PADDING = 10
+CARD_SECTION_SPACING = 5
+CARD_SECTIONS = (("name", 42), ("author", 16), ("link", 18), ("image", 146), ("stats", 20), ("date", 16))
+CARD_BUTTON_HEIGHT = 32
+CARD_HEIGHT = 2 * CARD_PADDING + sum(height + CARD_SECTION_SPACING for _, height in CARD_SECTIONS) + CARD_SECTION_SPACING + CARD_BUTTON_HEIGHT
+CARD_IMAGE_SIZE = QSize(260, 146)
+CARD_THUMBNAIL_SIZE = (CARD_IMAGE_SIZE.width(), CARD_IMAGE_SIZE.height())
+GAMEBANANA_LOGO_URL = "https://images.gamebanana.com/static/img/logo.png"
+GAMEBANANA_LOGO_SIZE = (230, 30)
+IMAGE_CANCEL_DELAY_MS = 150
+MOD_INFO_ROLE = Qt.ItemDataRole.UserRole
+MOD_IMAGE_ROLE = Qt.ItemDataRole.UserRole + 1
+DOWNLOAD_STATE_ROLE = Qt.ItemDataRole.UserRole + 2
+DOWNLOAD_BUTTON_TEXTS = {None: "mod_card.download_install", "searching": "mod_card.searching_files", "downloading": "mod_card.downloading",
+                         "installing": "mod_card.installing", "installed": "mod_card.installed", "retry": "mod_card.retry_download"}
+DOWNLOAD_BUTTON_ENABLED_STATES = (None, "retry")
+CATALOG_SYNC_INTERVAL_MS = 30 * 60 * 1000
+CATALOG_SYNC_CONTINUE_MS = 60 * 1000
+MOD_INDEX_SORTS = {"new": "Generic_Newest", "updated": "Generic_LatestModified", "default": "Generic_NewAndUpdated"}
 
 def format_timestamp(ts, translator: Translator):
     now = datetime.now()
@@ -40,63 +95,401 @@ def format_timestamp(ts, translator: Translator):
         
     return translator.get("time.seconds_ago")
 
-def _extract_category_id_from_url(url):
-    if not url: return None
-    match = re.search(r'/cats/(\d+)', url)
-    if match: return int(match.group(1))
-    return None
+def format_size(size_bytes):
+    if size_bytes > 1024 ** 3: return f"{size_bytes / 1024 ** 3:.2f} GB"
+    return f"{size_bytes / (1024 * 1024):.2f} MB" if size_bytes > (1024 * 1024) else f"{size_bytes / 1024:.2f} KB"
 
+def format_duration(seconds):
+    hours, remainder = divmod(int(seconds), 3600)
+    minutes, seconds = divmod(remainder, 60)
+    return f"{hours}:{minutes:02}:{seconds:02}" if hours else f"{minutes}:{seconds:02}"
 
-class Downloader(QObject):
-    finished = pyqtSignal(str, str, dict)
-    error = pyqtSignal(str)
-    progress_updated = pyqtSignal(str, int)
+class ChecksumMismatchError(Exception):
+    pass
 
-    def run(self):
-        try:
-            os.makedirs(DOWNLOADS_DIR, exist_ok=True)
-            safe_file_name = re.sub(r'[/*?:"<>|]', "", self.file_name)
-            final_path = os.path.join(DOWNLOADS_DIR, safe_file_name)
 
-            with requests.get(self.url, stream=True, timeout=30) as r:
-                r.raise_for_status()
-                total_size = int(r.headers.get('content-length', 0))
-                downloaded_size = 0
-                
-                with open(final_path, 'wb') as f:
-                    for chunk in r.iter_content(chunk_size=8192):
-                        f.write(chunk)
-                        if total_size > 0:
-                            downloaded_size += len(chunk)
-                            progress = int((downloaded_size * 100) / total_size)
-                            self.progress_updated.emit(self.mod_name, progress)
-            
-            self.progress_updated.emit(self.mod_name, 100)
-            self.finished.emit(final_path, self.mod_name, self.mod_info)
+class IncompleteDownloadError(Exception):
+    pass
 
-        except Exception as e:
-            self.error.emit(str(e))
 
-    def __init__(self, url, file_name, mod_name, mod_info):
+class RangeNotSupportedError(Exception):
+    pass
+
+
+class Downloader(QObject):
+    finished = pyqtSignal(str, str, dict)
+    error = pyqtSignal(str)
+    progress_updated = pyqtSignal(str, int, float, float)
+
+    def __init__(self, url, file_name, mod_name, mod_info, expected_md5=None, segments=DEFAULT_DOWNLOAD_SEGMENTS):
         super().__init__()
         self.url = url
         self.file_name = file_name
         self.mod_name = mod_name
         self.mod_info = mod_info
+        self.expected_md5 = expected_md5.lower() if expected_md5 else None
+        self.segments = segments
+        self._meta_lock = threading.Lock()
+        self._downloaded_size = 0
+        self._progress_lock = threading.Lock()
+        self._start_progress(0)
+        self.throttle = None
 
     def run(self):
         try:
             os.makedirs(DOWNLOADS_DIR, exist_ok=True)
             safe_file_name = re.sub(r'[/*?:"<>|]', "", self.file_name)
             final_path = os.path.join(DOWNLOADS_DIR, safe_file_name)
-            with requests.get(self.url, stream=True, timeout=30) as r:
-                r.raise_for_status()
-                with open(final_path, 'wb') as f:
-                    for chunk in r.iter_content(chunk_size=8192): f.write(chunk)
+
+            for attempt in range(CHECKSUM_RETRIES + 1):
+                actual_md5 = self._download_with_retries(final_path)
+                if self.expected_md5 is None or actual_md5 == self.expected_md5:
+                    break
+                print(f"Checksum mismatch for {safe_file_name} (attempt {attempt + 1}): expected {self.expected_md5}, got {actual_md5}")
+                os.remove(final_path)
+            else:
+                raise ChecksumMismatchError(
+                    f"Checksum mismatch for '{safe_file_name}' (expected {self.expected_md5}, got {actual_md5}). "
+                    "The corrupted file was discarded, please retry the download."
+                )
+
+            self.progress_updated.emit(self.mod_name, 100, 0.0, 0.0)
             self.finished.emit(final_path, self.mod_name, self.mod_info)
+
         except Exception as e:
             self.error.emit(str(e))
 
+    def _download_with_retries(self, final_path):
+        part_path = final_path + PART_SUFFIX
+        download = self._stream_to_part
+        if self.segments > 1:
+            probe = self._probe_ranges()
+            if probe:
+                download = lambda path: self._download_segmented(path, *probe)
+
+        retry = 0
+        while True:
+            try:
+                actual_md5 = download(part_path)
+                break
+            except RangeNotSupportedError:
+                print(f"Server ignored range requests for {self.file_name}, falling back to a single stream.")
+                self._remove_part_meta(part_path)
+                download = self._stream_to_part
+            except Exception as e:
+                if retry >= DOWNLOAD_MAX_RETRIES or not self._is_retryable(e):
+                    raise
+                delay = min(DOWNLOAD_BACKOFF_BASE * (2 ** retry), DOWNLOAD_BACKOFF_MAX)
+                print(f"Download of {self.file_name} interrupted ({e}), retrying in {delay:.0f}s...")
+                time.sleep(delay)
+                retry += 1
+
+        os.replace(part_path, final_path)
+        self._remove_part_meta(part_path)
+        return actual_md5
+
+    def _probe_ranges(self):
+        try:
+            with api_client.download_session.get(self.url, stream=True, timeout=15, headers={'Range': 'bytes=0-0'}) as r:
+                if r.status_code != 206:
+                    return None
+                match = re.match(r'bytes 0-0/(\d+)', r.headers.get('Content-Range', ''))
+                if not match or int(match.group(1)) < SEGMENTED_MIN_SIZE:
+                    return None
+                validators = {"etag": r.headers.get('ETag'), "last_modified": r.headers.get('Last-Modified')}
+                return r.url, int(match.group(1)), validators
+        except requests.RequestException as e:
+            print(f"Range probe failed for {self.file_name}: {e}")
+            return None
+
+    def _download_segmented(self, part_path, resolved_url, total_size, validators):
+        meta = self._load_part_meta(part_path)
+        can_resume = (meta.get("url") == self.url and meta.get("segments") and meta.get("total_size") == total_size
+                      and meta.get("etag") == validators["etag"] and os.path.exists(part_path))
+        if not can_resume:
+            segment_size = -(-total_size // self.segments)
+            meta = {"url": self.url, "total_size": total_size, **validators,
+                    "segments": [[start, min(start + segment_size, total_size) - 1, 0] for start in range(0, total_size, segment_size)]}
+            with open(part_path, 'wb') as f:
+                f.truncate(total_size)
+            self._save_part_meta(part_path, meta)
+
+        self._downloaded_size = sum(segment[2] for segment in meta["segments"])
+        self._start_progress(self._downloaded_size)
+        cancel_token = CancelToken()
+        first_error = None
+        with ThreadPoolExecutor(max_workers=len(meta["segments"])) as pool:
+            futures = [pool.submit(self._fetch_segment, part_path, resolved_url, segment, meta, total_size, cancel_token)
+                       for segment in meta["segments"]]
+            for future in as_completed(futures):
+                if future.exception() is not None and first_error is None:
+                    first_error = future.exception()
+                    cancel_token.cancel()
+        if first_error is not None:
+            raise first_error
+
+        if os.path.getsize(part_path) != total_size:
+            raise IncompleteDownloadError(f"Expected {total_size} bytes, file has {os.path.getsize(part_path)}")
+        md5 = hashlib.md5()
+        with open(part_path, 'rb') as f:
+            for block in iter(lambda: f.read(1024 * 1024), b''):
+                md5.update(block)
+        return md5.hexdigest()
+
+    def _fetch_segment(self, part_path, url, segment, meta, total_size, cancel_token):
+        start, end, done = segment
+        position = start + done
+        if position > end:
+            return
+
+        headers = {'Range': f"bytes={position}-{end}"}
+        validator = meta.get("etag") or meta.get("last_modified")
+        if validator: headers['If-Range'] = validator
+
+        cancel_token.raise_if_cancelled()
+        with api_client.download_session.get(url, stream=True, timeout=30, headers=headers) as r:
+            cancel_token.track(r)
+            try:
+                r.raise_for_status()
+                if r.status_code != 206:
+                    raise RangeNotSupportedError(url)
+                with open(part_path, 'r+b') as f:
+                    f.seek(position)
+                    unsaved_bytes = 0
+                    try:
+                        for chunk in self._iter_adaptive_chunks(r):
+                            cancel_token.raise_if_cancelled()
+                            chunk = chunk[:end + 1 - position]
+                            if self.throttle: self.throttle(len(chunk))
+                            f.write(chunk)
+                            position += len(chunk)
+                            unsaved_bytes += len(chunk)
+                            with self._meta_lock:
+                                self._downloaded_size += len(chunk)
+                                downloaded_size = self._downloaded_size
+                            self._report_progress(downloaded_size, total_size)
+                            if unsaved_bytes >= PART_META_SAVE_INTERVAL:
+                                f.flush()
+                                self._commit_segment(part_path, meta, segment, position - start)
+                                unsaved_bytes = 0
+                            if position > end:
+                                break
+                    finally:
+                        f.flush()
+                        self._commit_segment(part_path, meta, segment, position - start)
+            finally:
+                cancel_token.untrack(r)
+
+        if position <= end:
+            raise IncompleteDownloadError(f"Segment {start}-{end} stopped at {position}")
+
+    def _commit_segment(self, part_path, meta, segment, done):
+        with self._meta_lock:
+            segment[2] = done
+            self._save_part_meta(part_path, meta)
+
+    @staticmethod
+    def _is_retryable(error):
+        if isinstance(error, requests.HTTPError):
+            status = error.response.status_code if error.response is not None else 0
+            return status == 429 or status >= 500
+        return isinstance(error, (requests.ConnectionError, requests.Timeout,
+                                  requests.exceptions.ChunkedEncodingError, IncompleteDownloadError))
+
+    def _stream_to_part(self, part_path):
+        md5 = hashlib.md5()
+        meta = self._load_part_meta(part_path)
+        offset = 0
+        if meta.get("url") == self.url and os.path.exists(part_path):
+            offset = min(meta.get("offset", 0), os.path.getsize(part_path))
+
+        if offset > 0 and offset == meta.get("total_size"):
+            with open(part_path, 'rb') as f:
+                for block in iter(lambda: f.read(1024 * 1024), b''):
+                    md5.update(block)
+            return md5.hexdigest()
+
+        headers = {}
+        if offset > 0:
+            headers['Range'] = f"bytes={offset}-"
+            validator = meta.get("etag") or meta.get("last_modified")
+            if validator: headers['If-Range'] = validator
+
+        with api_client.download_session.get(self.url, stream=True, timeout=30, headers=headers) as r:
+            r.raise_for_status()
+            if offset > 0 and r.status_code == 206:
+                total_size = meta.get("total_size", 0)
+                with open(part_path, 'r+b') as f:
+                    f.truncate(offset)
+                    for block in iter(lambda: f.read(1024 * 1024), b''):
+                        md5.update(block)
+                mode = 'ab'
+            else:
+                offset = 0
+                total_size = int(r.headers.get('content-length', 0))
+                meta = {"url": self.url, "total_size": total_size, "offset": 0,
+                        "etag": r.headers.get('ETag'), "last_modified": r.headers.get('Last-Modified')}
+                self._save_part_meta(part_path, meta)
+                mode = 'wb'
+
+            downloaded_size = offset
+            unsaved_bytes = 0
+            self._start_progress(downloaded_size)
+            with open(part_path, mode) as f:
+                try:
+                    for chunk in self._iter_adaptive_chunks(r):
+                        if self.throttle: self.throttle(len(chunk))
+                        f.write(chunk)
+                        md5.update(chunk)
+                        downloaded_size += len(chunk)
+                        unsaved_bytes += len(chunk)
+                        if unsaved_bytes >= PART_META_SAVE_INTERVAL:
+                            f.flush()
+                            meta["offset"] = downloaded_size
+                            self._save_part_meta(part_path, meta)
+                            unsaved_bytes = 0
+                        if total_size > 0:
+                            self._report_progress(downloaded_size, total_size)
+                finally:
+                    f.flush()
+                    meta["offset"] = downloaded_size
+                    self._save_part_meta(part_path, meta)
+
+        if total_size > 0 and downloaded_size < total_size:
+            raise IncompleteDownloadError(f"Received {downloaded_size} of {total_size} bytes")
+        return md5.hexdigest()
+
+    def _iter_adaptive_chunks(self, response):
+        chunk_size = MIN_DOWNLOAD_CHUNK_SIZE
+        while True:
+            started = time.monotonic()
+            try:
+                chunk = response.raw.read(chunk_size, decode_content=True)
+            except ProtocolError as e:
+                raise requests.exceptions.ChunkedEncodingError(e)
+            except ReadTimeoutError as e:
+                raise requests.ConnectionError(e)
+            if not chunk:
+                return
+            yield chunk
+            throughput = len(chunk) / max(time.monotonic() - started, 0.001)
+            chunk_size = int(min(MAX_DOWNLOAD_CHUNK_SIZE, max(MIN_DOWNLOAD_CHUNK_SIZE, throughput * CHUNK_TARGET_SECONDS)))
+
+    def _start_progress(self, downloaded_size):
+        with self._progress_lock:
+            self._progress_time = time.monotonic()
+            self._progress_bytes = downloaded_size
+            self._last_percentage = -1
+            self._speed = 0.0
+
+    def _report_progress(self, downloaded_size, total_size):
+        now = time.monotonic()
+        with self._progress_lock:
+            elapsed = now - self._progress_time
+            percentage = int((downloaded_size * 100) / total_size)
+            if elapsed < PROGRESS_MIN_INTERVAL or (percentage == self._last_percentage and elapsed < PROGRESS_REFRESH_INTERVAL):
+                return
+            sample = (downloaded_size - self._progress_bytes) / elapsed
+            self._speed = sample if self._speed == 0 else self._speed + SPEED_SMOOTHING * (sample - self._speed)
+            self._progress_time, self._progress_bytes, self._last_percentage = now, downloaded_size, percentage
+            speed = self._speed
+        eta = (total_size - downloaded_size) / speed if speed > 0 else -1.0
+        self.progress_updated.emit(self.mod_name, percentage, speed, eta)
+
+    @staticmethod
+    def _load_part_meta(part_path):
+        try:
+            with open(part_path + ".json", 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    @staticmethod
+    def _save_part_meta(part_path, meta):
+        with open(part_path + ".json", 'w', encoding='utf-8') as f:
+            json.dump(meta, f)
+
+    @staticmethod
+    def _remove_part_meta(part_path):
+        if os.path.exists(part_path + ".json"): os.remove(part_path + ".json")
+
+class DownloadManager(QObject):
+    def __init__(self, max_concurrent=DEFAULT_MAX_CONCURRENT_DOWNLOADS, bandwidth_limit_kbps=0, segments=DEFAULT_DOWNLOAD_SEGMENTS, parent=None):
+        super().__init__(parent)
+        self.max_concurrent = max_concurrent
+        self.segments = segments
+        self.bandwidth_limiter = None
+        self.jobs = {}
+        self.queue = []
+        self.active_count = 0
+        self._sequence = itertools.count()
+        self.set_bandwidth_limit(bandwidth_limit_kbps)
+
+    def configure(self, max_concurrent, bandwidth_limit_kbps, segments=DEFAULT_DOWNLOAD_SEGMENTS):
+        self.max_concurrent = max(1, max_concurrent)
+        self.segments = min(max(1, segments), MAX_DOWNLOAD_SEGMENTS)
+        self.set_bandwidth_limit(bandwidth_limit_kbps)
+        self._start_next()
+
+    def set_bandwidth_limit(self, bandwidth_limit_kbps):
+        if bandwidth_limit_kbps <= 0:
+            self.bandwidth_limiter = None
+            return
+        bytes_per_second = bandwidth_limit_kbps * 1024
+        if self.bandwidth_limiter:
+            self.bandwidth_limiter.set_rate(bytes_per_second, bytes_per_second)
+        else:
+            self.bandwidth_limiter = RateLimiter(bytes_per_second, bytes_per_second)
+
+    def submit(self, url, file_name, mod_name, mod_info, expected_md5=None, priority=DOWNLOAD_PRIORITY_NORMAL,
+               on_finished=None, on_error=None, on_progress=None):
+        job = self.jobs.get(url)
+        if job is None:
+            downloader = Downloader(url, file_name, mod_name, mod_info, expected_md5=expected_md5, segments=self.segments)
+            downloader.throttle = self._throttle
+            downloader.finished.connect(self._on_job_done)
+            downloader.error.connect(self._on_job_done)
+            job = {"downloader": downloader, "priority": priority, "started": False, "listeners": set()}
+            self.jobs[url] = job
+            heapq.heappush(self.queue, (priority, next(self._sequence), url))
+        else:
+            print(f"{file_name} is already queued or downloading, attaching to the existing transfer.")
+            if not job["started"] and priority < job["priority"]:
+                job["priority"] = priority
+                heapq.heappush(self.queue, (priority, next(self._sequence), url))
+
+        for signal_name, slot in (("finished", on_finished), ("error", on_error), ("progress_updated", on_progress)):
+            if slot is not None and (signal_name, slot) not in job["listeners"]:
+                job["listeners"].add((signal_name, slot))
+                getattr(job["downloader"], signal_name).connect(slot)
+
+        self._start_next()
+        return job["downloader"]
+
+    def _start_next(self):
+        while self.queue and self.active_count < self.max_concurrent:
+            priority, _, url = heapq.heappop(self.queue)
+            job = self.jobs.get(url)
+            if job is None or job["started"] or job["priority"] != priority:
+                continue
+            job["started"] = True
+            self.active_count += 1
+            threading.Thread(target=job["downloader"].run, daemon=True).start()
+
+    def _on_job_done(self, *args):
+        downloader = self.sender()
+        job = self.jobs.get(downloader.url) if downloader else None
+        if job is None or job["downloader"] is not downloader:
+            return
+        del self.jobs[downloader.url]
+        self.active_count -= 1
+        self._start_next()
+
+    def _throttle(self, byte_count):
+        limiter = self.bandwidth_limiter
+        if limiter:
+            limiter.acquire(byte_count)
+
 class FileSelectionDialog(QDialog):
     def __init__(self, files_data, translator: Translator, parent=None):
         super().__init__(parent)
@@ -124,7 +517,7 @@ class FileSelectionDialog(QDialog):
         self.list_widget = QListWidget()
         for file_info in files_data:
             size_bytes = file_info.get('_nFilesize', 0)
-            size_str = f"{size_bytes / (1024 * 1024):.2f} MB" if size_bytes > (1024 * 1024) else f"{size_bytes / 1024:.2f} KB"
+            size_str = format_size(size_bytes)
             download_count = file_info.get('_nDownloadCount', 0)
             download_text = self.translator.get("file_dialog.downloads").format(count=download_count)
             item_text = f"{file_info['_sFile']} ({size_str}) - {download_text}"
@@ -157,152 +550,286 @@ class FileSelectionDialog(QDialog):
             self.selected_file_info = selected_item.data(Qt.ItemDataRole.UserRole)
         super().accept()
 
-class ModCard(QFrame):
-    mod_ready_to_install = pyqtSignal(str, str, dict)
-    
-    def __init__(self, mod_info, parent_tab, translator: Translator):
-        super().__init__()
+def _card_mod_info(mod_record):
+    return {
+        '_idRow': mod_record.get('_idRow'),
+        '_sName': mod_record.get('_sName') or 'Nombre no disponible',
+        'author_name': (mod_record.get('_aSubmitter') or {}).get('_sName') or 'Autor desconocido',
+        'image_url': preview_image_url(mod_record, CARD_THUMBNAIL_SIZE),
+        'views': mod_record.get('_nViewCount', 0),
+        'likes': mod_record.get('_nLikeCount', 0),
+        '_tsDateAdded': mod_record.get('_tsDateAdded', 0),
+        '_tsDateModified': mod_record.get('_tsDateModified', 0),
+        '_sProfileUrl': mod_record.get('_sProfileUrl', ''),
+        'update_available': False
+    }
+
+
+class ModListModel(QAbstractListModel):
+    image_requested = pyqtSignal(int, str)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.mods = []
+        self._rows = {}
+        self._failed_images = set()
+        self._requested_images = set()
+        self.download_states = {}
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.mods)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid(): return None
+        mod_info = self.mods[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole: return mod_info['_sName']
+        if role == MOD_INFO_ROLE: return mod_info
+        if role == MOD_IMAGE_ROLE: return pixmap_cache.get(mod_info['image_url'], CARD_IMAGE_SIZE)
+        if role == DOWNLOAD_STATE_ROLE: return self.download_states.get(mod_info['_idRow'])
+        return None
+
+    def request_images(self, rows):
+        for row in rows:
+            mod_info = self.mods[row]
+            mod_id = mod_info['_idRow']
+            if not mod_info['image_url'] or mod_id in self._failed_images or mod_id in self._requested_images: continue
+            if pixmap_cache.get(mod_info['image_url'], CARD_IMAGE_SIZE) is not None: continue
+            self._requested_images.add(mod_id)
+            self.image_requested.emit(mod_id, mod_info['image_url'])
+
+    def set_mods(self, mod_records):
+        self.beginResetModel()
+        self.mods = [_card_mod_info(mod_record) for mod_record in mod_records]
+        self._rows = {mod_info['_idRow']: row for row, mod_info in enumerate(self.mods)}
+        self._requested_images.clear()
+        self._failed_images.clear()
+        self.endResetModel()
+
+    def append_mods(self, mod_records):
+        if not mod_records: return
+        first_row = len(self.mods)
+        self.beginInsertRows(QModelIndex(), first_row, first_row + len(mod_records) - 1)
+        for mod_record in mod_records:
+            mod_info = _card_mod_info(mod_record)
+            self._rows[mod_info['_idRow']] = len(self.mods)
+            self.mods.append(mod_info)
+        self.endInsertRows()
+
+    def mod_info(self, mod_id):
+        row = self._rows.get(mod_id)
+        return self.mods[row] if row is not None else None
+
+    def row_for_id(self, mod_id):
+        return self._rows.get(mod_id)
+
+    def forget_image_request(self, mod_id):
+        self._requested_images.discard(mod_id)
+
+    def set_image(self, mod_id, pixmap):
+        self._requested_images.discard(mod_id)
+        mod_info = self.mod_info(mod_id)
+        if mod_info is None: return
+        if pixmap.isNull():
+            self._failed_images.add(mod_id)
+        else:
+            pixmap_cache.put(mod_info['image_url'], CARD_IMAGE_SIZE, pixmap)
+        self._emit_row_changed(mod_id)
+
+    def set_download_state(self, mod_id, state):
+        self.download_states[mod_id] = state
+        self._emit_row_changed(mod_id)
+
+    def _emit_row_changed(self, mod_id):
+        row = self._rows.get(mod_id)
+        if row is not None:
+            index = self.index(row)
+            self.dataChanged.emit(index, index)
+
+
+class ModCardDelegate(QStyledItemDelegate):
+    download_clicked = pyqtSignal(int)
+    profile_clicked = pyqtSignal(str)
+
+    def __init__(self, translator: Translator, parent=None):
+        super().__init__(parent)
         self.translator = translator
         self.t = self.translator.get
-        self.mod_info = {
-            '_idRow': mod_info.get('_idRow', mod_info.get('id')),
-            '_sName': mod_info.get('_sName', mod_info.get('name', 'Nombre no disponible')),
-            'author_name': mod_info.get('_aSubmitter', {}).get('_sName', mod_info.get('author', 'Autor desconocido')),
-            'image_url': mod_info.get('image_url'),
-            'views': mod_info.get('_nViewCount', mod_info.get('views', 0)),
-            'likes': mod_info.get('_nLikeCount', mod_info.get('likes', 0)),
-            '_tsDateAdded': mod_info.get('_tsDateAdded', mod_info.get('created', 0)),
-            '_tsDateModified': mod_info.get('_tsDateModified', mod_info.get('last_updated', 0)),
-            '_sProfileUrl': mod_info.get('_sProfileUrl', mod_info.get('profile_url', '')),
-            'update_available': False
-        }
-        self.parent_tab = parent_tab
-        self.setObjectName("ModCard")
-        self.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Preferred)
+        self.card_width = CARD_MIN_WIDTH
 
-        main_layout = QVBoxLayout(self)
-        main_layout.setSpacing(5)
-        main_layout.setContentsMargins(10, 10, 10, 10)
-
-        self.name_label = QLabel(self.mod_info['_sName'])
-        self.name_label.setObjectName("ModCardName")
-        self.name_label.setWordWrap(True)
-        self.name_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        main_layout.addWidget(self.name_label)
-        
-        self.author_label = QLabel(self.t("mod_card.author_prefix").format(author=self.mod_info['author_name']))
-        self.author_label.setObjectName("ModCardAuthor")
-        self.author_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        main_layout.addWidget(self.author_label)
-
-        self.url_label = QLabel(f'<a href="{self.mod_info["_sProfileUrl"]}" style="color: #00a2d4;">{self.t("mod_card.go_to_gb")}</a>')
-        self.url_label.setObjectName("ModCardUrl")
-        self.url_label.setOpenExternalLinks(True)
-        self.url_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.url_label.setWordWrap(True)
-        main_layout.addWidget(self.url_label)
-        
-        self.image_label = QLabel()
-        self.image_label.setFixedSize(260, 146)
-        self.image_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.image_label.setObjectName("ModCardImage")
-        main_layout.addWidget(self.image_label, 0, Qt.AlignmentFlag.AlignCenter)
-        
-        self.load_image(self.mod_info.get('image_url'))
-
-        stats_layout = QHBoxLayout()
-        stats_layout.addStretch()
-        stats_layout.addWidget(QLabel(f"👁️ {self.mod_info['views']}"))
-        stats_layout.addWidget(QLabel(f"❤️ {self.mod_info['likes']}"))
-        stats_layout.addStretch()
-        main_layout.addLayout(stats_layout)
-
-        created_ts = self.mod_info.get('_tsDateAdded', 0)
-        last_updated_ts = self.mod_info.get('_tsDateModified', 0)
-        is_update = last_updated_ts != created_ts
-        status_text = self.t("mod_card.date_updated") if is_update else self.t("mod_card.date_published")
-        timestamp = last_updated_ts if is_update else created_ts
-        self.date_label = QLabel(f"{status_text}: {format_timestamp(timestamp, self.translator)}")
-        self.date_label.setObjectName("ModCardDate")
-        self.date_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        main_layout.addWidget(self.date_label)
+    def sizeHint(self, option, index):
+        return QSize(self.card_width, CARD_HEIGHT)
 
-        main_layout.addSpacerItem(QSpacerItem(0, 0, QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Expanding))
-        
-        self.download_button = QPushButton(self.t("mod_card.download_install"))
-        self.download_button.setObjectName("DownloadButton")
-        self.download_button.clicked.connect(self.select_file_to_download)
-        main_layout.addWidget(self.download_button)
-
-    def load_image(self, url):
-        if url:
-            threading.Thread(target=ModCard._fetch_image_threaded,
-                             args=(url, self.mod_info['_idRow'], self.parent_tab.mod_image_loaded_signal),
-                             daemon=True).start()
-        else:
-            self.image_label.setText(self.t("mod_card.no_image"))
-            self.parent_tab.mod_image_loaded_signal.emit(self.mod_info['_idRow'], QPixmap())
+    @staticmethod
+    def _section_rects(rect):
+        inner = rect.adjusted(CARD_PADDING, CARD_PADDING, -CARD_PADDING, -CARD_PADDING)
+        rects, y = {}, inner.top()
+        for name, height in CARD_SECTIONS:
+            rects[name] = QRect(inner.left(), y, inner.width(), height)
+            y += height + CARD_SECTION_SPACING
+        image_section = rects["image"]
+        rects["image"] = QRect(image_section.center().x() - CARD_IMAGE_SIZE.width() // 2, image_section.top(),
+                               CARD_IMAGE_SIZE.width(), CARD_IMAGE_SIZE.height())
+        rects["button"] = QRect(inner.left(), inner.bottom() - CARD_BUTTON_HEIGHT + 1, inner.width(), CARD_BUTTON_HEIGHT)
+        return rects
 
     @staticmethod
-    def _fetch_image_threaded(url, mod_id, signal_to_report_to):
-        try:
-            response = requests.get(url, timeout=10)
-            response.raise_for_status()
-            pixmap = QPixmap()
-            pixmap.loadFromData(response.content)
-            signal_to_report_to.emit(mod_id, pixmap)
-        except Exception:
-            signal_to_report_to.emit(mod_id, QPixmap())
-
-    def select_file_to_download(self):
-        self.download_button.setEnabled(False)
-        self.download_button.setText(self.t("mod_card.searching_files"))
-        threading.Thread(target=self._fetch_files_and_show_dialog, args=(self.mod_info.get('_idRow'),), daemon=True).start()
-
-    def _fetch_files_and_show_dialog(self, mod_id):
-        try:
-            api_url = f"https://gamebanana.com/apiv11/Mod/{mod_id}/Files"
-            response = requests.get(api_url, timeout=15)
-            response.raise_for_status()
-            files_data = response.json()
-            if not files_data: raise ValueError("No files found for this mod.")
-            self.parent_tab.show_file_dialog_signal.emit(files_data, self)
-        except Exception as e:
-            self.on_download_error(self.t("mod_card.get_files_error").format(error=e))
-
-    def start_download(self, file_info):
-        self.download_button.setText(self.t("mod_card.downloading"))
-        downloader = Downloader(file_info['_sDownloadUrl'], file_info['_sFile'], self.mod_info['_sName'], self.mod_info)
-        downloader.finished.connect(self.on_download_finished)
-        downloader.error.connect(self.on_download_error)
-        threading.Thread(target=downloader.run, daemon=True).start()
-
-    def on_download_finished(self, file_path, mod_name, mod_info):
-        self.download_button.setText(self.t("mod_card.installing"))
-        self.mod_ready_to_install.emit(file_path, mod_name, mod_info)
-        self.download_button.setText(self.t("mod_card.installed"))
-        self.download_button.setEnabled(False)
-
-    def on_download_error(self, error_msg):
-        self.download_button.setEnabled(True)
-        self.download_button.setText(self.t("mod_card.retry_download"))
-        if error_msg: 
-            self.parent_tab.show_error_message_signal.emit(
-                self.t("mod_card.download_error_dialog_title"),
-                self.t("mod_card.download_error_dialog_text").format(error=error_msg)
-            )
+    def _font(base, pixel_size, bold=False, italic=False):
+        font = QFont(base)
+        font.setPixelSize(pixel_size)
+        font.setBold(bold)
+        font.setItalic(italic)
+        return font
+
+    def _draw_text(self, painter, rect, text, font, color, flags=Qt.AlignmentFlag.AlignCenter):
+        painter.setFont(font)
+        painter.setPen(QColor(color))
+        if not flags & Qt.TextFlag.TextWordWrap:
+            text = QFontMetrics(font).elidedText(text, Qt.TextElideMode.ElideRight, rect.width())
+        painter.drawText(rect, flags, text)
+
+    def paint(self, painter, option, index):
+        mod_info = index.data(MOD_INFO_ROLE)
+        rects = self._section_rects(option.rect)
+        hovered = bool(option.state & QStyle.StateFlag.State_MouseOver)
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+
+        painter.setPen(QPen(QColor("#00a2d4" if hovered else "#4a3a6a"), 1))
+        painter.setBrush(QColor("#2c1f4d"))
+        painter.drawRoundedRect(QRectF(option.rect).adjusted(0.5, 0.5, -0.5, -0.5), 8, 8)
+
+        self._draw_text(painter, rects["name"], mod_info['_sName'], self._font(option.font, 16, bold=True), "#f0f0f0",
+                        Qt.AlignmentFlag.AlignCenter | Qt.TextFlag.TextWordWrap)
+        author_text = QStaticText(self.t("mod_card.author_prefix").format(author=mod_info['author_name']))
+        author_text.setTextFormat(Qt.TextFormat.RichText)
+        painter.setFont(self._font(option.font, 11, italic=True))
+        painter.setPen(QColor("#a090c0"))
+        author_text.prepare(painter.transform(), painter.font())
+        author_size = author_text.size()
+        painter.save()
+        painter.setClipRect(rects["author"])
+        painter.drawStaticText(QPointF(rects["author"].center().x() - author_size.width() / 2,
+                                       rects["author"].center().y() - author_size.height() / 2), author_text)
+        painter.restore()
+        link_font = self._font(option.font, 12)
+        link_font.setUnderline(True)
+        self._draw_text(painter, rects["link"], self.t("mod_card.go_to_gb"), link_font, "#00a2d4")
+
+        painter.setPen(QPen(QColor("#4a3a6a"), 1))
+        painter.setBrush(QColor("#1a0f2d"))
+        painter.drawRoundedRect(QRectF(rects["image"]).adjusted(0.5, 0.5, -0.5, -0.5), 5, 5)
+        pixmap = index.data(MOD_IMAGE_ROLE)
+        if pixmap is not None and not pixmap.isNull():
+            target = QRect(QPoint(0, 0), pixmap.size().scaled(rects["image"].size(), Qt.AspectRatioMode.KeepAspectRatio))
+            target.moveCenter(rects["image"].center())
+            painter.drawPixmap(target, pixmap)
+        elif pixmap is not None or not mod_info['image_url']:
+            placeholder = "mod_card.image_load_error" if mod_info['image_url'] else "mod_card.no_image"
+            self._draw_text(painter, rects["image"], self.t(placeholder), self._font(option.font, 12), "#6a5a8a")
+
+        self._draw_text(painter, rects["stats"], f"👁️ {mod_info['views']}    ❤️ {mod_info['likes']}", self._font(option.font, 12), "#e0d8f0")
+        is_update = mod_info['_tsDateModified'] != mod_info['_tsDateAdded']
+        status_text = self.t("mod_card.date_updated") if is_update else self.t("mod_card.date_published")
+        timestamp = mod_info['_tsDateModified'] if is_update else mod_info['_tsDateAdded']
+        self._draw_text(painter, rects["date"], f"{status_text}: {format_timestamp(timestamp, self.translator)}",
+                        self._font(option.font, 11), "#b0a0d0")
+
+        state = index.data(DOWNLOAD_STATE_ROLE)
+        enabled = state in DOWNLOAD_BUTTON_ENABLED_STATES
+        painter.setPen(QPen(QColor("#00d1c1" if enabled else "#4a3a6a"), 1))
+        painter.setBrush(QColor(("#00b2e4" if hovered else "#00a2d4") if enabled else "#3a2a5a"))
+        painter.drawRoundedRect(QRectF(rects["button"]).adjusted(0.5, 0.5, -0.5, -0.5), 4, 4)
+        self._draw_text(painter, rects["button"], self.t(DOWNLOAD_BUTTON_TEXTS[state]), self._font(option.font, 13, bold=True),
+                        "#ffffff" if enabled else "#6a5a8a")
+        painter.restore()
+
+    def editorEvent(self, event, model, option, index):
+        if event.type() == QEvent.Type.MouseButtonRelease and event.button() == Qt.MouseButton.LeftButton:
+            rects = self._section_rects(option.rect)
+            position = event.position().toPoint()
+            mod_info = index.data(MOD_INFO_ROLE)
+            if rects["button"].contains(position) and index.data(DOWNLOAD_STATE_ROLE) in DOWNLOAD_BUTTON_ENABLED_STATES:
+                self.download_clicked.emit(mod_info['_idRow'])
+                return True
+            if rects["link"].contains(position) and mod_info['_sProfileUrl']:
+                self.profile_clicked.emit(mod_info['_sProfileUrl'])
+                return True
+        return super().editorEvent(event, model, option, index)
+
+
+class ModGridView(QListView):
+    load_more_requested = pyqtSignal()
+    visible_range_changed = pyqtSignal()
+
+    def __init__(self, card_delegate, parent=None):
+        super().__init__(parent)
+        self.card_delegate = card_delegate
+        self.setItemDelegate(card_delegate)
+        self.setViewMode(QListView.ViewMode.IconMode)
+        self.setFlow(QListView.Flow.LeftToRight)
+        self.setWrapping(True)
+        self.setResizeMode(QListView.ResizeMode.Adjust)
+        self.setMovement(QListView.Movement.Static)
+        self.setUniformItemSizes(True)
+        self.setSpacing(CARD_SPACING // 2)
+        self.setSelectionMode(QListView.SelectionMode.NoSelection)
+        self.setVerticalScrollMode(QListView.ScrollMode.ScrollPerPixel)
+        self.verticalScrollBar().setSingleStep(40)
+        self.setMouseTracking(True)
+        self.setObjectName("ModCardScrollArea")
+        self.verticalScrollBar().valueChanged.connect(self._check_near_end)
+        self.verticalScrollBar().valueChanged.connect(self.visible_range_changed)
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        available_width = self.viewport().width() - self.spacing() - 1
+        columns = max(1, available_width // (CARD_MIN_WIDTH + self.spacing()))
+        card_width = max(CARD_MIN_WIDTH, available_width // columns - self.spacing())
+        if card_width != self.card_delegate.card_width:
+            self.card_delegate.card_width = card_width
+            self.doItemsLayout()
+
+    def updateGeometries(self):
+        super().updateGeometries()
+        self._check_near_end()
+        self.visible_range_changed.emit()
+
+    def visible_rows(self):
+        model = self.model()
+        if model is None: return range(0)
+        area = self.viewport().rect()
+        first, count = 0, model.rowCount()
+        high = count
+        while first < high:
+            middle = (first + high) // 2
+            if self.visualRect(model.index(middle, 0)).bottom() < area.top(): first = middle + 1
+            else: high = middle
+        last = first
+        while last < count and self.visualRect(model.index(last, 0)).top() <= area.bottom():
+            last += 1
+        return range(first, last)
+
+    def _check_near_end(self):
+        scroll_bar = self.verticalScrollBar()
+        if self.model() is not None and self.model().rowCount() and scroll_bar.maximum() - scroll_bar.value() <= CARD_HEIGHT:
+            self.load_more_requested.emit()
+
 
 class DownloadTab(QWidget):
-    mod_downloaded = pyqtSignal(str, str, bool, dict)
-    show_file_dialog_signal = pyqtSignal(list, ModCard)
+    mod_downloaded = pyqtSignal(str, str, bool, dict, object)
+    show_file_dialog_signal = pyqtSignal(list, dict)
+    card_download_failed = pyqtSignal(int, str)
     show_error_message_signal = pyqtSignal(str, str)
     update_categories_signal = pyqtSignal(list)
-    update_gamebanana_logo_signal = pyqtSignal(QPixmap)
-    mod_image_loaded_signal = pyqtSignal(int, QPixmap)
-    create_mod_card_ui_signal = pyqtSignal(dict)
+    update_gamebanana_logo_signal = pyqtSignal(QImage)
+    mod_image_loaded_signal = pyqtSignal(int, QImage)
     update_main_status = pyqtSignal(str, int)
     show_main_message_box = pyqtSignal(str, str, int)
-    _one_click_info_ready = pyqtSignal(str, str, str, dict)
+    _one_click_info_ready = pyqtSignal(str, str, str, dict, str)
+    browse_cache_refreshed = pyqtSignal()
+    browse_page_ready = pyqtSignal(int, int, str)
+    catalog_synced = pyqtSignal()
+    catalog_sync_paused = pyqtSignal()
 
     def __init__(self, translator: Translator, parent=None):
         super().__init__(parent)
@@ -310,34 +837,71 @@ class DownloadTab(QWidget):
         self.t = self.translator.get 
         self.mods_loaded = False
         self.setStyleSheet("background: transparent;")
-        self.current_page = 1
         self.current_sort = "new"
         self.current_category, self.current_search = None, ""
         self.show_nsfw = False
         self.current_status_message = ""
-        self.active_downloaders = set() 
-
-        self._accumulated_filtered_mods_cache = []
-        self._last_api_page_scanned = 0
-        self._all_api_mods_scanned = False
-        self.CARD_MIN_WIDTH, self.CARD_SPACING, self.num_columns = 280, 15, 1
+        self.download_manager = DownloadManager(parent=self)
+
+        self._listing = self._new_listing()
+        self._browse_listings = OrderedDict()
+        self._loading_more = False
+        self._replace_on_ready = False
+        self.search_index = ModSearchIndex()
+        self.catalog = ModCatalog()
+        self._catalog_sync_lock = threading.Lock()
+        self._browse_generation = 0
+        self._browse_lock = threading.Lock()
+        self._browse_cancel_token = CancelToken()
+        self._scan_lock = threading.Lock()
+        self._prefetch_requests = {}
+        self._image_requests = {}
+        self._thumbnail_lock = threading.Lock()
+        self.mod_model = ModListModel(self)
+        self.mod_model.image_requested.connect(self._on_image_requested, Qt.ConnectionType.QueuedConnection)
+        self.image_cancel_timer = QTimer(self)
+        self.image_cancel_timer.setSingleShot(True)
+        self.image_cancel_timer.setInterval(IMAGE_CANCEL_DELAY_MS)
+        self.image_cancel_timer.timeout.connect(self._cancel_offscreen_image_requests)
+        self.image_request_timer = QTimer(self)
+        self.image_request_timer.setSingleShot(True)
+        self.image_request_timer.setInterval(0)
+        self.image_request_timer.timeout.connect(lambda: self.mod_model.request_images(self.mod_list_view.visible_rows()))
 
         self.show_file_dialog_signal.connect(self.show_file_selection_dialog)
+        self.card_download_failed.connect(self._on_card_download_error)
         self.show_error_message_signal.connect(lambda title, msg: QMessageBox.critical(self, title, msg))
         self.update_categories_signal.connect(self.populate_categories_combobox)
         self.update_gamebanana_logo_signal.connect(self.set_gamebanana_logo)
         self.mod_image_loaded_signal.connect(self._update_mod_card_image)
-        self.create_mod_card_ui_signal.connect(self._create_and_add_mod_card_to_layout)
         self._one_click_info_ready.connect(self._start_download_from_worker)
+        self.browse_refresh_timer = QTimer(self)
+        self.browse_refresh_timer.setSingleShot(True)
+        self.browse_refresh_timer.setInterval(300)
+        self.browse_refresh_timer.timeout.connect(self._reload_current_page)
+        self.browse_cache_refreshed.connect(self.browse_refresh_timer.start)
+        self.browse_page_ready.connect(self._on_browse_page_ready)
+        self.search_debounce_timer = QTimer(self)
+        self.search_debounce_timer.setSingleShot(True)
+        self.search_debounce_timer.setInterval(SEARCH_DEBOUNCE_MS)
+        self.search_debounce_timer.timeout.connect(self.trigger_reload)
+        self.catalog_synced.connect(self._on_catalog_synced)
+        self.catalog_sync_paused.connect(lambda: QTimer.singleShot(CATALOG_SYNC_CONTINUE_MS, self.start_catalog_sync))
+        self.catalog_sync_timer = QTimer(self)
+        self.catalog_sync_timer.setInterval(CATALOG_SYNC_INTERVAL_MS)
+        self.catalog_sync_timer.timeout.connect(self.start_catalog_sync)
         self.setup_ui()
         self.retranslate_ui()
-        threading.Thread(target=self._fetch_gamebanana_logo_thread, daemon=True).start()
+        image_loader.load(GAMEBANANA_LOGO_URL, self._on_gamebanana_logo_data, size=GAMEBANANA_LOGO_SIZE)
 
     def retranslate_ui(self):
         self.sort_label.setText(self.t("download_tab.sort_by"))
         self.sort_combo.setItemText(0, self.t("download_tab.sort_newest"))
         self.sort_combo.setItemText(1, self.t("download_tab.sort_last_updated"))
         self.sort_combo.setItemText(2, self.t("download_tab.sort_default"))
+        self.sort_combo.setItemText(3, self.t("download_tab.sort_most_liked"))
+        self.sort_combo.setItemText(4, self.t("download_tab.sort_most_viewed"))
+        self._update_sort_options()
         
         self.category_label.setText(self.t("download_tab.section"))
         if self.category_combo.count() == 0 or self.category_combo.itemData(0) is not None:
@@ -348,10 +912,7 @@ class DownloadTab(QWidget):
         self.search_label.setText(self.t("download_tab.by_name"))
         self.search_bar.setPlaceholderText(self.t("download_tab.search_placeholder"))
         self.nsfw_checkbox.setText(self.t("download_tab.allow_nsfw"))
-        
-        self.prev_button.setText(self.t("download_tab.prev_page"))
-        self.next_button.setText(self.t("download_tab.next_page"))
-        self.page_label.setText(self.t("download_tab.page").format(page=self.current_page))
+        self.mod_list_view.viewport().update()
         
         if self.current_status_message:
             self.show_status_message(self.current_status_message) 
@@ -377,6 +938,8 @@ class DownloadTab(QWidget):
         self.sort_combo.addItem("", "new") 
         self.sort_combo.addItem("", "updated")
         self.sort_combo.addItem("", "default")
+        self.sort_combo.addItem("", "likes")
+        self.sort_combo.addItem("", "views")
         self.sort_combo.activated.connect(self.trigger_reload)
         top_bar_layout.addWidget(self.sort_combo)
 
@@ -391,6 +954,7 @@ class DownloadTab(QWidget):
         top_bar_layout.addWidget(self.search_label)
         self.search_bar = QLineEdit()
         self.search_bar.returnPressed.connect(self.trigger_reload)
+        self.search_bar.textChanged.connect(lambda: self.search_debounce_timer.start())
         top_bar_layout.addWidget(self.search_bar)
 
         self.nsfw_checkbox = QCheckBox()
@@ -399,39 +963,22 @@ class DownloadTab(QWidget):
         top_bar_layout.addSpacerItem(QSpacerItem(0, 0, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum))
         main_layout.addWidget(top_bar_frame)
         
-        scroll_area = QScrollArea()
-        scroll_area.setWidgetResizable(True)
-        scroll_area.setObjectName("ModCardScrollArea")
-        self.mod_cards_widget = QWidget()
-        self.mod_cards_layout = QGridLayout(self.mod_cards_widget)
-        self.mod_cards_layout.setAlignment(Qt.AlignmentFlag.AlignTop | Qt.AlignmentFlag.AlignLeft)
-        self.mod_cards_layout.setContentsMargins(10, 10, 10, 10)
-        self.mod_cards_layout.setSpacing(self.CARD_SPACING)
         self.status_label = QLabel("")
         self.status_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.status_label.setObjectName("StatusMessageLabel")
         self.status_label.hide()
-        self.mod_cards_layout.addWidget(self.status_label, 0, 0, 1, self.num_columns)
-        scroll_area.setWidget(self.mod_cards_widget)
-        main_layout.addWidget(scroll_area)
-        
-        pagination_layout = QHBoxLayout()
-        self.prev_button = QPushButton()
-        self.prev_button.clicked.connect(self.prev_page)
-        self.page_label = QLabel()
-        self.next_button = QPushButton()
-        self.next_button.clicked.connect(self.next_page)
-        pagination_layout.addStretch()
-        pagination_layout.addWidget(self.prev_button)
-        pagination_layout.addWidget(self.page_label)
-        pagination_layout.addWidget(self.next_button)
-        pagination_layout.addStretch()
-        main_layout.addLayout(pagination_layout)
+        main_layout.addWidget(self.status_label)
+
+        self.card_delegate = ModCardDelegate(self.translator, self)
+        self.card_delegate.download_clicked.connect(self._on_card_download_clicked)
+        self.card_delegate.profile_clicked.connect(lambda url: QDesktopServices.openUrl(QUrl(url)))
+        self.mod_list_view = ModGridView(self.card_delegate)
+        self.mod_list_view.setModel(self.mod_model)
+        self.mod_list_view.load_more_requested.connect(self._load_more)
+        self.mod_list_view.visible_range_changed.connect(self.image_request_timer.start)
+        self.mod_list_view.verticalScrollBar().valueChanged.connect(lambda: self.image_cancel_timer.start())
+        main_layout.addWidget(self.mod_list_view)
 
-    def resizeEvent(self, event):
-        super().resizeEvent(event)
-        self._update_grid_layout()
-    
     def start_one_click_download(self, url):
         t = self.t 
         try:
@@ -464,21 +1011,13 @@ class DownloadTab(QWidget):
     def _fetch_info_and_download(self, mod_id, file_id_to_find, download_url):
         t = self.t
         try:
-            files_api_url = f"https://gamebanana.com/apiv11/Mod/{mod_id}/Files"
-            headers = {'User-Agent': 'ZeroModManager/1.0'}
-            files_response = requests.get(files_api_url, headers=headers, timeout=15)
-            files_response.raise_for_status()
-            files_data = files_response.json()
+            files_data = api_client.mod_files(mod_id)
             target_file = next((f for f in files_data if f.get('_idRow') == file_id_to_find), None)
 
             if not target_file:
                 raise ValueError(f"No se encontró un archivo con ID {file_id_to_find} en la respuesta de la API.")
 
-            mod_api_url = f"https://gamebanana.com/apiv11/Mod/{mod_id}"
-            params = {'_csvProperties': '@gbprofile'}
-            mod_response = requests.get(mod_api_url, params=params, headers=headers, timeout=10)
-            mod_response.raise_for_status()
-            raw_mod_metadata = mod_response.json()
+            raw_mod_metadata = api_client.mod_profile(mod_id)
 
             mod_name_for_display = raw_mod_metadata.get('_sName', target_file.get('_sFile'))
 
@@ -486,7 +1025,8 @@ class DownloadTab(QWidget):
                 download_url,
                 target_file['_sFile'],
                 mod_name_for_display,
-                raw_mod_metadata
+                raw_mod_metadata,
+                target_file.get('_sMd5Checksum', '')
             )
 
         except Exception as e:
@@ -495,37 +1035,14 @@ class DownloadTab(QWidget):
             print(f"!!! Error detallado en _fetch_info_and_download: {e}")
 
 
-    def _update_grid_layout(self):
-        margin_left = self.mod_cards_layout.contentsMargins().left()
-        margin_right = self.mod_cards_layout.contentsMargins().right()
-        available_width = self.mod_cards_widget.width() - margin_left - margin_right
-        if available_width <= 0: return
-        card_total_width = self.CARD_MIN_WIDTH + self.CARD_SPACING
-        new_num_columns = max(1, (available_width + self.CARD_SPACING) // card_total_width)
-        if new_num_columns != self.num_columns:
-            self.num_columns = new_num_columns
-            self._rebuild_mod_card_layout_from_cache()
-        if self.current_status_message and not self._get_mod_cards_in_layout():
-            self.mod_cards_layout.removeWidget(self.status_label)
-            self.mod_cards_layout.addWidget(self.status_label, 0, 0, 1, self.num_columns)
-            self.status_label.setText(self.t(self.current_status_message))
-            self.status_label.show()
-
-    def _fetch_gamebanana_logo_thread(self):
-        try:
-            response = requests.get("https://images.gamebanana.com/static/img/logo.png", timeout=5)
-            response.raise_for_status()
-            pixmap = QPixmap()
-            pixmap.loadFromData(response.content)
-            self.update_gamebanana_logo_signal.emit(pixmap)
-        except Exception as e:
-            print(f"Error cargando el logo de GameBanana: {e}")
-            self.update_gamebanana_logo_signal.emit(QPixmap())
+    def _on_gamebanana_logo_data(self, image):
+        if image is None:
+            print("Error cargando el logo de GameBanana")
+        self.update_gamebanana_logo_signal.emit(image if image is not None else QImage())
 
-    def set_gamebanana_logo(self, pixmap):
-        if not pixmap.isNull():
-            scaled_pixmap = pixmap.scaled(self.gamebanana_logo_label.size(), Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
-            self.gamebanana_logo_label.setPixmap(scaled_pixmap)
+    def set_gamebanana_logo(self, image):
+        if not image.isNull():
+            self.gamebanana_logo_label.setPixmap(QPixmap.fromImage(image))
         else:
             self.gamebanana_logo_label.setText("GameBanana")
         self.gamebanana_logo_label.show()
@@ -534,15 +1051,37 @@ class DownloadTab(QWidget):
         if self.mods_loaded: return
         self.mods_loaded = True
         threading.Thread(target=self._load_initial_categories_thread, daemon=True).start()
-        self.load_mods()
+        self.trigger_reload()
+        self.start_catalog_sync()
+        self.catalog_sync_timer.start()
+
+    def start_catalog_sync(self):
+        threading.Thread(target=self._sync_catalog_thread, daemon=True).start()
+
+    def _sync_catalog_thread(self):
+        if not self._catalog_sync_lock.acquire(blocking=False): return
+        try:
+            if self.catalog.sync(SPARKING_ZERO_GAMEBANANA_ID, on_progress=self._on_catalog_sync_progress):
+                self.catalog_synced.emit()
+            if self.catalog.sync_pending():
+                self.catalog_sync_paused.emit()
+        except Exception as e:
+            print(f"Catalog sync failed: {e}")
+        finally:
+            self._catalog_sync_lock.release()
+
+    def _on_catalog_sync_progress(self, synced, total):
+        self.update_main_status.emit(self.t("download_tab.catalog_sync_progress").format(synced=synced, total=total), 4000)
+
+    def _on_catalog_synced(self):
+        with self._browse_lock:
+            self._browse_listings.clear()
+        self._update_sort_options()
+        self.browse_refresh_timer.start()
 
     def _load_initial_categories_thread(self):
         try:
-            api_url = f"https://gamebanana.com/apiv11/Mod/Categories"
-            params = {"_idGameRow": SPARKING_ZERO_GAMEBANANA_ID, "_sSort": "a_to_z"}
-            response = requests.get(api_url, params=params, timeout=15)
-            response.raise_for_status()
-            self.update_categories_signal.emit(response.json())
+            self.update_categories_signal.emit(api_client.mod_categories(SPARKING_ZERO_GAMEBANANA_ID, on_revalidated=self.update_categories_signal.emit))
         except Exception as e:
             print(f"Error al cargar categorías: {e}")
             self.update_categories_signal.emit([])
@@ -558,179 +1097,291 @@ class DownloadTab(QWidget):
         self.category_combo.setCurrentIndex(index_to_set if index_to_set != -1 else 0)
         self.category_combo.setEnabled(True)
 
+    def _catalog_serves(self, category):
+        return self.catalog.is_ready() and (category is None or self.catalog.has_category(category))
+
+    def _update_sort_options(self):
+        available = self._catalog_serves(self.category_combo.currentData())
+        tooltip = "" if available else self.t("download_tab.sort_needs_catalog")
+        for row in range(self.sort_combo.count()):
+            if self.sort_combo.itemData(row) in MOD_INDEX_SORTS: continue
+            self.sort_combo.model().item(row).setEnabled(available)
+            self.sort_combo.setItemData(row, tooltip, Qt.ItemDataRole.ToolTipRole)
+        if not available and self.sort_combo.currentData() not in MOD_INDEX_SORTS:
+            self.sort_combo.setCurrentIndex(self.sort_combo.findData("default"))
+            self.update_main_status.emit(tooltip, 5000)
+
     def trigger_reload(self):
-        self.current_page = 1
-        self._accumulated_filtered_mods_cache = []
-        self._last_api_page_scanned = 0
-        self._all_api_mods_scanned = False
+        self.search_debounce_timer.stop()
+        self._update_sort_options()
+        self._activate_listing(reuse=True)
         self.load_mods()
 
-    def next_page(self):
-        self.current_page += 1
-        self.load_mods()
+    def _reload_current_page(self):
+        self._activate_listing(reuse=False)
+        self.load_mods(keep_current=True)
 
-    def prev_page(self):
-        if self.current_page > 1:
-            self.current_page -= 1
-            self.load_mods()
+    @staticmethod
+    def _new_listing():
+        return {"mods": [], "seen": set(), "last_page": 0, "exhausted": False, "from_catalog": False}
 
-    def load_mods(self):
+    def _activate_listing(self, reuse):
         self.current_sort = self.sort_combo.currentData()
         self.current_category = self.category_combo.currentData()
         self.current_search = self.search_bar.text().strip()
         self.show_nsfw = self.nsfw_checkbox.isChecked()
-        self.page_label.setText(self.t("download_tab.page").format(page=self.current_page))
-        self.prev_button.setEnabled(self.current_page > 1)
-        self.show_status_message("download_tab.searching_mods")
-        self._update_grid_layout()
-        threading.Thread(target=self._fetch_mods_thread, daemon=True).start()
-
-    def _fetch_mods_thread(self):
+        key = (self.current_sort, self.current_category, self.current_search, self.show_nsfw)
+        with self._browse_lock:
+            self._browse_generation += 1
+            self._browse_cancel_token.cancel()
+            self._browse_cancel_token = CancelToken()
+            listing = self._browse_listings.pop(key, None) if reuse else None
+            self._cancel_prefetch_requests()
+            if listing is None:
+                listing = self._new_listing()
+                if self.current_search and not self.catalog.is_ready():
+                    listing["mods"] = self.search_index.search(self.current_search, self.current_category, self.show_nsfw, self.current_sort)
+                    listing["seen"].update(mod['_idRow'] for mod in listing["mods"])
+            self._listing = listing
+            self._browse_listings[key] = listing
+            while len(self._browse_listings) > BROWSE_LISTINGS_LIMIT:
+                self._browse_listings.popitem(last=False)
+
+    def load_mods(self, keep_current=False):
+        if keep_current:
+            self._replace_on_ready = True
+            self._request_mods(max(self.mod_model.rowCount(), MODS_PER_PAGE))
+            return
+        self._replace_on_ready = False
+        with self._browse_lock:
+            mods = list(self._listing["mods"])
+        for request in self._image_requests.values():
+            image_loader.cancel(request)
+        self._image_requests.clear()
+        self.mod_model.set_mods(mods)
+        self.mod_list_view.scrollToTop()
+        self.show_status_message("" if mods else "download_tab.searching_mods")
+        self._request_mods(max(len(mods), MODS_PER_PAGE))
+
+    def _load_more(self):
+        if self._loading_more: return
+        with self._browse_lock:
+            if self._listing["exhausted"] and len(self._listing["mods"]) <= self.mod_model.rowCount(): return
+        self._request_mods(self.mod_model.rowCount() + MODS_PER_PAGE)
+
+    def _request_mods(self, count):
+        self._loading_more = True
+        threading.Thread(target=self._fetch_mods_thread, args=(self._browse_generation, count, device_pixel_ratio()), daemon=True).start()
+
+    def _fetch_mods_thread(self, generation, count, ratio):
         try:
-            api_url = f"https://gamebanana.com/apiv11/Game/{SPARKING_ZERO_GAMEBANANA_ID}/Subfeed"
-            start_index_for_display = (self.current_page - 1) * MODS_PER_PAGE
-            end_index_for_current_page = start_index_for_display + MODS_PER_PAGE
-            api_page = self._last_api_page_scanned + 1 if self._last_api_page_scanned > 0 else 1
-
-            while len(self._accumulated_filtered_mods_cache) < end_index_for_current_page + 1 and not self._all_api_mods_scanned:
-                params = {'_csvModelInclusions': 'Mod', '_nPage': api_page, '_sSort': self.current_sort}
-                if self.current_search: params['_sName'] = self.current_search
-                
-                response = requests.get(api_url, params=params, timeout=15)
-                response.raise_for_status()
-                data = response.json()
-                records = data.get('_aRecords', [])
-                self._last_api_page_scanned = api_page
-                if not records:
-                    self._all_api_mods_scanned = True
-                    break
-                
-                for mod in records:
-                    cat_match = self.current_category is None or _extract_category_id_from_url(mod.get('_aRootCategory', {}).get('_sProfileUrl')) == self.current_category
-                    nsfw_match = self.show_nsfw or not mod.get('_bHasContentRatings', False)
-                    if cat_match and nsfw_match: self._accumulated_filtered_mods_cache.append(mod)
-                
-                api_page += 1
-            
-            self.show_status_message("") 
-            self._rebuild_mod_card_layout_from_cache()
-
+            if not self._scan_api_pages_until(count + 1, generation): return
+        except RequestCancelled:
+            return
         except Exception as e:
-            error_msg = self.t("download_tab.load_mods_error").format(error=e)
-            self.show_status_message(error_msg, is_key=False) 
-
-    def _clear_mod_card_widgets_only(self):
-        for widget in self._get_mod_cards_in_layout():
-            self.mod_cards_layout.removeWidget(widget)
-            widget.deleteLater()
-
-    def _rebuild_mod_card_layout_from_cache(self):
-        self._clear_mod_card_widgets_only()
-        for i in range(self.mod_cards_layout.columnCount()): self.mod_cards_layout.setColumnStretch(i, 0)
-        for i in range(self.num_columns): self.mod_cards_layout.setColumnStretch(i, 1)
-
-        start = (self.current_page - 1) * MODS_PER_PAGE
-        end = start + MODS_PER_PAGE
-        mods_to_display = self._accumulated_filtered_mods_cache[start:end]
-
-        if not mods_to_display:
-            msg_key = "download_tab.no_mods_found" if self.current_page == 1 else "download_tab.no_more_mods"
-            self.show_status_message(msg_key, page=self.current_page)
-            self.next_button.setEnabled(False)
+            self.browse_page_ready.emit(generation, count, self.t("download_tab.load_mods_error").format(error=e))
             return
-
-        self.status_label.hide()
-        self.current_status_message = ""
-        
-        for mod_record in mods_to_display:
-            image_url = mod_record.get('_sPreviewUrl')
-            if not image_url and '_aPreviewMedia' in mod_record and '_aImages' in mod_record['_aPreviewMedia']:
-                images = mod_record['_aPreviewMedia']['_aImages']
-                if images: image_url = f"{images[0].get('_sBaseUrl', '')}/{images[0].get('_sFile530', '')}"
-            
-            mod_info = {
-                'id': mod_record.get('_idRow'), 'name': mod_record.get('_sName'),
-                'author': mod_record.get('_aSubmitter', {}).get('_sName'), 'image_url': image_url,
-                'views': mod_record.get('_nViewCount', 0), 'likes': mod_record.get('_nLikeCount', 0),
-                'created': mod_record.get('_tsDateAdded'), 'last_updated': mod_record.get('_tsDateModified'),
-                'profile_url': mod_record.get('_sProfileUrl', '')
-            }
-            self.create_mod_card_ui_signal.emit(mod_info)
-
-        should_enable_next = len(self._accumulated_filtered_mods_cache) > end
-        self.next_button.setEnabled(should_enable_next or not self._all_api_mods_scanned)
-        self.prev_button.setEnabled(self.current_page > 1)
-        self.page_label.setText(self.t("download_tab.page").format(page=self.current_page))
-
-    def _get_mod_cards_in_layout(self):
-        return [self.mod_cards_layout.itemAt(i).widget() for i in range(self.mod_cards_layout.count()) if isinstance(self.mod_cards_layout.itemAt(i).widget(), ModCard)]
+        self.browse_page_ready.emit(generation, count, "")
+        self._prefetch_next_page(count, generation, ratio)
+
+    def _on_browse_page_ready(self, generation, count, error_msg):
+        if generation != self._browse_generation: return
+        self._loading_more = False
+        if error_msg:
+            self.show_status_message(error_msg, is_key=False)
+            return
+        with self._browse_lock:
+            mods = list(self._listing["mods"])
+        if self._replace_on_ready:
+            self._replace_on_ready = False
+            scroll_value = self.mod_list_view.verticalScrollBar().value()
+            self.mod_model.set_mods(mods)
+            self.mod_list_view.doItemsLayout()
+            self.mod_list_view.verticalScrollBar().setValue(scroll_value)
+        else:
+            self.mod_model.append_mods(mods[self.mod_model.rowCount():])
+        self.show_status_message("" if mods else "download_tab.no_mods_found")
+
+    def _scan_api_pages_until(self, needed_count, generation):
+        with self._scan_lock:
+            while True:
+                with self._browse_lock:
+                    if generation != self._browse_generation: return False
+                    listing = self._listing
+                    if listing["last_page"] and (len(listing["mods"]) >= needed_count or listing["exhausted"]): return True
+                    api_page = listing["last_page"] + 1
+                    sort, category, search, show_nsfw = self.current_sort, self.current_category, self.current_search, self.show_nsfw
+                    cancel_token = self._browse_cancel_token
+                    if api_page == 1:
+                        listing["from_catalog"] = (search or sort != "new") and self._catalog_serves(category)
+                    from_catalog = listing["from_catalog"]
+
+                if not from_catalog:
+                    on_revalidated = lambda _: self.browse_cache_refreshed.emit()
+                    api_sort = sort if sort in MOD_INDEX_SORTS else "default"
+                    try:
+                        if category is None:
+                            params = {'_csvModelInclusions': 'Mod', '_nPage': api_page, '_sSort': api_sort}
+                            if search: params['_sName'] = search
+                            data = api_client.subfeed(SPARKING_ZERO_GAMEBANANA_ID, params, on_revalidated=on_revalidated, cancel_token=cancel_token)
+                        else:
+                            params = {'_nPage': api_page, '_nPerpage': API_MODS_PER_CALL, '_sSort': MOD_INDEX_SORTS[api_sort],
+                                      '_aFilters[Generic_Game]': SPARKING_ZERO_GAMEBANANA_ID, '_aFilters[Generic_Category]': category}
+                            if search: params['_aFilters[Generic_Name]'] = search
+                            data = api_client.mod_index(params, on_revalidated=on_revalidated, cancel_token=cancel_token)
+                    except requests.RequestException as e:
+                        if api_page != 1 or not self._catalog_serves(category): raise
+                        print(f"GameBanana unavailable, browsing the local catalog instead: {e}")
+                        from_catalog = True
+                        with self._browse_lock:
+                            listing["from_catalog"] = True
+                    else:
+                        records = data.get('_aRecords', [])
+                        is_complete = data.get('_aMetadata', {}).get('_bIsComplete')
+                        self.search_index.add_records(records, category_id=category)
+
+                if from_catalog:
+                    records = self.catalog.query(search, category, show_nsfw, sort, limit=API_MODS_PER_CALL, offset=(api_page - 1) * API_MODS_PER_CALL)
+                    is_complete = len(records) < API_MODS_PER_CALL
+
+                with self._browse_lock:
+                    if generation != self._browse_generation: return False
+                    listing["last_page"] = api_page
+                    new_records = [mod for mod in records if mod.get('_idRow') not in listing["seen"]
+                                   and (show_nsfw or not mod.get('_bHasContentRatings', False))]
+                    listing["seen"].update(mod.get('_idRow') for mod in new_records)
+                    listing["mods"].extend(new_records)
+                    if not records or is_complete:
+                        listing["exhausted"] = True
+
+    def _prefetch_next_page(self, start_index, generation, ratio):
+        try:
+            if not self._scan_api_pages_until(start_index + MODS_PER_PAGE + 1, generation): return
+        except RequestCancelled:
+            return
+        except Exception as e:
+            print(f"Prefetch of the next page failed: {e}")
+            return
+        with self._browse_lock:
+            if generation != self._browse_generation: return
+            next_page_mods = self._listing["mods"][start_index:start_index + MODS_PER_PAGE]
+        for mod_record in next_page_mods:
+            image_url = preview_image_url(mod_record, CARD_THUMBNAIL_SIZE, ratio)
+            with self._thumbnail_lock:
+                if not image_url or image_url in self._prefetch_requests: continue
+                self._prefetch_requests[image_url] = (mod_record.get('_idRow'), image_loader.load(
+                    image_url, lambda data, url=image_url: self._finish_prefetch(url), IMAGE_PRIORITY_PREFETCH, device_size(CARD_THUMBNAIL_SIZE, ratio)))
+
+    def _finish_prefetch(self, url):
+        with self._thumbnail_lock:
+            self._prefetch_requests.pop(url, None)
+
+    def _cancel_prefetch_requests(self, keep=None):
+        with self._thumbnail_lock:
+            cancelled = [url for url, (mod_id, _) in self._prefetch_requests.items() if keep is None or not keep(mod_id)]
+            requests = [self._prefetch_requests.pop(url)[1] for url in cancelled]
+        for request in requests:
+            image_loader.cancel(request)
 
     def show_status_message(self, message_key_or_text, is_key=True, **kwargs):
-        self._clear_mod_card_widgets_only()
         self.current_status_message = message_key_or_text if is_key else ""
-        
         message = self.t(message_key_or_text).format(**kwargs) if is_key and message_key_or_text else message_key_or_text
+        self.status_label.setText(message or "")
+        self.status_label.setVisible(bool(message))
+
+    def _on_image_requested(self, mod_id, url):
+        self._image_requests[mod_id] = image_loader.load(url, lambda data: self._on_card_image_data(mod_id, data),
+                                                         size=device_size(CARD_THUMBNAIL_SIZE))
+
+    def _on_card_image_data(self, mod_id, image):
+        self.mod_image_loaded_signal.emit(mod_id, image if image is not None else QImage())
+
+    def _cancel_offscreen_image_requests(self):
+        visible_area = self.mod_list_view.viewport().rect().adjusted(0, -CARD_HEIGHT, 0, CARD_HEIGHT)
+        for mod_id, request in list(self._image_requests.items()):
+            row = self.mod_model.row_for_id(mod_id)
+            if row is not None and self.mod_list_view.visualRect(self.mod_model.index(row)).intersects(visible_area): continue
+            image_loader.cancel(request)
+            del self._image_requests[mod_id]
+            self.mod_model.forget_image_request(mod_id)
+
+        def below_visible_area(mod_id):
+            row = self.mod_model.row_for_id(mod_id)
+            return row is None or self.mod_list_view.visualRect(self.mod_model.index(row)).bottom() >= visible_area.top()
+        self._cancel_prefetch_requests(keep=below_visible_area)
+
+    def _update_mod_card_image(self, mod_id, image):
+        self._image_requests.pop(mod_id, None)
+        self.mod_model.set_image(mod_id, QPixmap.fromImage(image))
+
+    def _on_card_download_clicked(self, mod_id):
+        mod_info = self.mod_model.mod_info(mod_id)
+        if mod_info is None: return
+        self.mod_model.set_download_state(mod_id, "searching")
+        threading.Thread(target=self._fetch_files_and_show_dialog, args=(dict(mod_info),), daemon=True).start()
+
+    def _fetch_files_and_show_dialog(self, mod_info):
+        try:
+            files_data = api_client.mod_files(mod_info['_idRow'])
+            if not files_data: raise ValueError("No files found for this mod.")
+            self.show_file_dialog_signal.emit(files_data, mod_info)
+        except Exception as e:
+            self.card_download_failed.emit(mod_info['_idRow'], self.t("mod_card.get_files_error").format(error=e))
 
-        if message:
-            self.status_label.setText(message)
-            if self.mod_cards_layout.indexOf(self.status_label) != -1: self.mod_cards_layout.removeWidget(self.status_label)
-            self.mod_cards_layout.addWidget(self.status_label, 0, 0, 1, self.num_columns)
-            self.status_label.show()
-        else:
-            self.status_label.hide()
-
-    def _create_and_add_mod_card_to_layout(self, mod_info):
-        self.status_label.hide()
-        card = ModCard(mod_info, self, self.translator)
-        card.mod_ready_to_install.connect(lambda path, name, info: self.mod_downloaded.emit(path, name, True, info))
-        current_card_count = len(self._get_mod_cards_in_layout())
-        row, col = current_card_count // self.num_columns, current_card_count % self.num_columns
-        self.mod_cards_layout.addWidget(card, row, col)
-
-    def _update_mod_card_image(self, mod_id, pixmap):
-        for card in self._get_mod_cards_in_layout():
-            if card.mod_info['_idRow'] == mod_id:
-                if pixmap and not pixmap.isNull():
-                    scaled_pixmap = pixmap.scaled(card.image_label.size(), Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
-                    card.image_label.setPixmap(scaled_pixmap)
-                else:
-                    card.image_label.setText(self.t("mod_card.image_load_error"))
-                return
-
-    def show_file_selection_dialog(self, files_data, card_instance):
+    def show_file_selection_dialog(self, files_data, mod_info):
         dialog = FileSelectionDialog(files_data, self.translator, self)
         if dialog.exec() == QDialog.DialogCode.Accepted:
             selected_file = dialog.selected_file_info
             if selected_file:
-                card_instance.start_download(selected_file)
+                self._start_card_download(mod_info, selected_file)
             else:
-                card_instance.on_download_error(self.t("file_dialog.no_file_selected"))
+                self._on_card_download_error(mod_info['_idRow'], self.t("file_dialog.no_file_selected"))
         else:
-            card_instance.on_download_error(self.t("file_dialog.selection_cancelled"))
-
-
-    def _start_download_from_worker(self, download_url, file_name, mod_name, mod_metadata):
-        downloader = Downloader(download_url, file_name, mod_name, mod_metadata)
-        downloader.setParent(self) 
+            self._on_card_download_error(mod_info['_idRow'], self.t("file_dialog.selection_cancelled"))
+
+    def _start_card_download(self, mod_info, file_info):
+        mod_id = mod_info['_idRow']
+        self.mod_model.set_download_state(mod_id, "downloading")
+        self.download_manager.submit(file_info['_sDownloadUrl'], file_info['_sFile'], mod_info['_sName'], mod_info,
+                                     expected_md5=file_info.get('_sMd5Checksum'),
+                                     on_finished=lambda file_path, mod_name, info: self._on_card_download_finished(mod_id, file_path, mod_name, info),
+                                     on_error=lambda error_msg: self._on_card_download_error(mod_id, error_msg))
+
+    def _on_card_download_finished(self, mod_id, file_path, mod_name, mod_info):
+        self.mod_model.set_download_state(mod_id, "installing")
+        self.mod_downloaded.emit(file_path, mod_name, True, mod_info, lambda final_mod_name, outcome: self._on_card_install_done(mod_id, outcome))
+
+    def _on_card_install_done(self, mod_id, outcome):
+        self.mod_model.set_download_state(mod_id, {"installed": "installed", "cancelled": None}.get(outcome, "retry"))
+
+    def _on_card_download_error(self, mod_id, error_msg):
+        self.mod_model.set_download_state(mod_id, "retry")
+        if error_msg:
+            self.show_error_message_signal.emit(
+                self.t("mod_card.download_error_dialog_title"),
+                self.t("mod_card.download_error_dialog_text").format(error=error_msg)
+            )
 
-        downloader.progress_updated.connect(self._on_download_progress)
-        downloader.finished.connect(self._on_download_finished_for_1_click)
-        downloader.error.connect(self._on_download_error_for_1_click)
-        
-        downloader.finished.connect(downloader.deleteLater)
-        downloader.error.connect(downloader.deleteLater)
+    def _start_download_from_worker(self, download_url, file_name, mod_name, mod_metadata, expected_md5):
+        self.download_manager.submit(download_url, file_name, mod_name, mod_metadata, expected_md5=expected_md5,
+                                     priority=DOWNLOAD_PRIORITY_HIGH,
+                                     on_finished=self._on_download_finished_for_1_click,
+                                     on_error=self._on_download_error_for_1_click,
+                                     on_progress=self._on_download_progress)
         
-        threading.Thread(target=downloader.run, daemon=True).start()
-        
-    def _on_download_progress(self, mod_name, percentage):
-            message = self.t("download_tab_downloading_progress").format(mod_name=mod_name, progress=percentage)
+    def _on_download_progress(self, mod_name, percentage, speed, eta):
+            if speed > 0 and eta >= 0:
+                message = self.t("download_tab_downloading_progress_speed").format(
+                    mod_name=mod_name, progress=percentage, speed=format_size(speed), eta=format_duration(eta))
+            else:
+                message = self.t("download_tab_downloading_progress").format(mod_name=mod_name, progress=percentage)
             self.update_main_status.emit(message, 0) 
 
     def _on_download_finished_for_1_click(self, file_path, mod_name, mod_info):
         install_starting_msg = self.t("status_starting_install").format(mod_name=mod_name)
         self.update_main_status.emit(install_starting_msg, 4000)
 
-        self.mod_downloaded.emit(file_path, mod_name, True, mod_info)
+        self.mod_downloaded.emit(file_path, mod_name, True, mod_info, None)
 
     def _on_download_error_for_1_click(self, error_msg):
         self.update_main_status.emit(self.t("download_error_status"), 5000)
@@ -0,0 +1,348 @@
+import os
+import re
+import json
+import time
+import hashlib
+import threading
+from collections import OrderedDict
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+API_BASE_URL = "https://gamebanana.com/apiv11"
+USER_AGENT = "ZeroModManager/1.0"
+API_TIMEOUT = 15
+IMAGE_TIMEOUT = 10
+CONNECTION_POOL_SIZE = 16
+API_REQUESTS_PER_SECOND = 5
+API_BURST_SIZE = 10
+API_MAX_RETRIES = 3
+API_BACKOFF_FACTOR = 0.5
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+CACHE_DIR = os.path.join("cache", "api")
+CACHE_MAX_BYTES = 32 * 1024 * 1024
+CACHE_MEMORY_ENTRIES = 128
+CACHE_TTLS = {
+    "Game/{id}/Subfeed": 10 * 60,
+    "Mod/Categories": 24 * 3600,
+    "Mod/Index": 10 * 60,
+}
+CANCEL_CHECK_CHUNK_SIZE = 16 * 1024
+
+
+class RequestCancelled(Exception):
+    pass
+
+
+class CancelToken:
+    def __init__(self):
+        self.cancelled = False
+        self._responses = set()
+        self._lock = threading.Lock()
+
+    def cancel(self):
+        with self._lock:
+            self.cancelled = True
+            responses = list(self._responses)
+            self._responses.clear()
+        for response in responses:
+            self._abort(response)
+
+    @staticmethod
+    def _abort(response):
+        shutdown = getattr(response.raw, "shutdown", None)
+        if shutdown is not None:
+            try: shutdown()
+            except (OSError, ValueError, RuntimeError): pass
+        response.close()
+
+    def raise_if_cancelled(self):
+        if self.cancelled:
+            raise RequestCancelled()
+
+    def track(self, response):
+        with self._lock:
+            if not self.cancelled:
+                self._responses.add(response)
+                return
+        response.close()
+        raise RequestCancelled()
+
+    def untrack(self, response):
+        with self._lock:
+            self._responses.discard(response)
+
+
+class RateLimiter:
+    def __init__(self, rate, burst):
+        self.rate = rate
+        self.capacity = burst
+        self.tokens = float(burst)
+        self.last_refill = time.monotonic()
+        self.lock = threading.Lock()
+
+    def set_rate(self, rate, burst):
+        with self.lock:
+            self.rate = rate
+            self.capacity = burst
+            self.tokens = min(self.tokens, burst)
+
+    def acquire(self, tokens=1):
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.rate)
+                self.last_refill = now
+                needed = min(tokens, self.capacity)
+                if self.tokens >= needed:
+                    self.tokens -= tokens
+                    return
+                wait_time = (needed - self.tokens) / self.rate
+            time.sleep(wait_time)
+
+
+class ResponseCache:
+    def __init__(self, directory, max_bytes, max_memory_entries=CACHE_MEMORY_ENTRIES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.max_memory_entries = max_memory_entries
+        self.lock = threading.Lock()
+        self.entries = OrderedDict()
+        self._sizes = None
+
+    def _path(self, key):
+        return os.path.join(self.directory, f"{key}.json")
+
+    def _index(self):
+        if self._sizes is None:
+            files = []
+            if os.path.isdir(self.directory):
+                files = [entry for entry in os.scandir(self.directory) if entry.name.endswith(".json")]
+            files.sort(key=lambda entry: entry.stat().st_mtime)
+            self._sizes = OrderedDict((entry.name[:-5], entry.stat().st_size) for entry in files)
+        return self._sizes
+
+    def get(self, key):
+        with self.lock:
+            if key in self._index():
+                self._sizes.move_to_end(key)
+            if key in self.entries:
+                self.entries.move_to_end(key)
+                return self.entries[key]
+        try:
+            with open(self._path(key), 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        with self.lock:
+            self._remember(key, entry)
+        return entry
+
+    def _remember(self, key, entry):
+        self.entries[key] = entry
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_memory_entries:
+            self.entries.popitem(last=False)
+
+    def put(self, key, entry):
+        payload = json.dumps(entry, ensure_ascii=False).encode('utf-8')
+        with self.lock:
+            self._remember(key, entry)
+            try:
+                os.makedirs(self.directory, exist_ok=True)
+                temp_path = self._path(key) + ".tmp"
+                with open(temp_path, 'wb') as f:
+                    f.write(payload)
+                os.replace(temp_path, self._path(key))
+            except OSError as e:
+                print(f"Could not write API cache entry {key}: {e}")
+                return
+            sizes = self._index()
+            sizes[key] = len(payload)
+            sizes.move_to_end(key)
+            total = sum(sizes.values())
+            while total > self.max_bytes and len(sizes) > 1:
+                old_key, old_size = sizes.popitem(last=False)
+                self.entries.pop(old_key, None)
+                total -= old_size
+                try: os.remove(self._path(old_key))
+                except OSError: pass
+
+
+class GameBananaClient:
+    def __init__(self):
+        self.session = self._create_session(Retry(total=API_MAX_RETRIES, backoff_factor=API_BACKOFF_FACTOR,
+                                                  status_forcelist=RETRY_STATUS_CODES, allowed_methods=frozenset(['GET', 'HEAD']),
+                                                  respect_retry_after_header=True, raise_on_status=False))
+        self.download_session = self._create_session(Retry(total=0, redirect=10, raise_on_status=False))
+        self.rate_limiter = RateLimiter(API_REQUESTS_PER_SECOND, API_BURST_SIZE)
+        self._stats = {}
+        self._stats_lock = threading.Lock()
+        self.cache = ResponseCache(CACHE_DIR, CACHE_MAX_BYTES)
+        self._revalidating = set()
+        self._revalidating_lock = threading.Lock()
+
+    @staticmethod
+    def _create_session(retry):
+        session = requests.Session()
+        session.headers['User-Agent'] = USER_AGENT
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=CONNECTION_POOL_SIZE, max_retries=retry)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return session
+
+    def get_json(self, endpoint, params=None, timeout=API_TIMEOUT, max_age=None, on_revalidated=None, cancel_token=None, cached=True):
+        stats_key = self._stats_key(endpoint)
+        if max_age is None:
+            max_age = CACHE_TTLS.get(stats_key)
+        if max_age is None or not cached:
+            self.rate_limiter.acquire()
+            response, body = self._get(f"{API_BASE_URL}/{endpoint}", stats_key, cancel_token, params=params, timeout=timeout)
+            return json.loads(body)
+
+        cache_key = hashlib.sha1(json.dumps([endpoint, sorted((params or {}).items())]).encode('utf-8')).hexdigest()
+        entry = self.cache.get(cache_key)
+        if entry and time.time() - entry["fetched_at"] < max_age:
+            self._count(stats_key, "cache_hits")
+            return entry["data"]
+
+        if entry and on_revalidated:
+            self._count(stats_key, "stale_hits")
+            with self._revalidating_lock:
+                already_running = cache_key in self._revalidating
+                self._revalidating.add(cache_key)
+            if not already_running:
+                threading.Thread(target=self._revalidate_in_background,
+                                 args=(endpoint, params, timeout, cache_key, entry, on_revalidated), daemon=True).start()
+            return entry["data"]
+
+        try:
+            return self._revalidate(endpoint, params, timeout, cache_key, entry, cancel_token)
+        except requests.RequestException as e:
+            if entry is None:
+                raise
+            print(f"Using stale cached response for {endpoint}: {e}")
+            return entry["data"]
+
+    def _revalidate_in_background(self, endpoint, params, timeout, cache_key, entry, on_revalidated):
+        try:
+            data = self._revalidate(endpoint, params, timeout, cache_key, entry)
+        except Exception as e:
+            print(f"Background refresh of {endpoint} failed: {e}")
+            return
+        finally:
+            with self._revalidating_lock:
+                self._revalidating.discard(cache_key)
+        if data != entry["data"]:
+            on_revalidated(data)
+
+    def _revalidate(self, endpoint, params, timeout, cache_key, entry, cancel_token=None):
+        stats_key = self._stats_key(endpoint)
+        headers = {}
+        if entry and entry["etag"]: headers['If-None-Match'] = entry["etag"]
+        if entry and entry["last_modified"]: headers['If-Modified-Since'] = entry["last_modified"]
+        self.rate_limiter.acquire()
+        response, body = self._get(f"{API_BASE_URL}/{endpoint}", stats_key, cancel_token, params=params, headers=headers, timeout=timeout)
+        if response.status_code == 304 and entry:
+            self._count(stats_key, "not_modified")
+            data = entry["data"]
+        else:
+            entry = None
+            data = json.loads(body)
+
+        self.cache.put(cache_key, {
+            "endpoint": endpoint,
+            "data": data,
+            "etag": response.headers.get('ETag', entry["etag"] if entry else None),
+            "last_modified": response.headers.get('Last-Modified', entry["last_modified"] if entry else None),
+            "fetched_at": time.time(),
+        })
+        return data
+
+    def get_bytes(self, url, timeout=IMAGE_TIMEOUT, cancel_token=None):
+        self.rate_limiter.acquire()
+        return self._get(url, "images", cancel_token, timeout=timeout)[1]
+
+    def get_image(self, url, etag=None, last_modified=None, timeout=IMAGE_TIMEOUT, cancel_token=None):
+        headers = {}
+        if etag: headers['If-None-Match'] = etag
+        if last_modified: headers['If-Modified-Since'] = last_modified
+        self.rate_limiter.acquire()
+        response, body = self._get(url, "images", cancel_token, headers=headers, timeout=timeout)
+        if response.status_code == 304 and headers:
+            self._count("images", "not_modified")
+            body = None
+        return body, response.headers.get('ETag', etag), response.headers.get('Last-Modified', last_modified)
+
+    def subfeed(self, game_id, params, on_revalidated=None, cancel_token=None):
+        return self.get_json(f"Game/{game_id}/Subfeed", params=params, on_revalidated=on_revalidated, cancel_token=cancel_token)
+
+    def mod_categories(self, game_id, on_revalidated=None):
+        return self.get_json("Mod/Categories", params={"_idGameRow": game_id, "_sSort": "a_to_z"}, on_revalidated=on_revalidated)
+
+    def mod_index(self, params, on_revalidated=None, cancel_token=None, cached=True):
+        return self.get_json("Mod/Index", params=params, on_revalidated=on_revalidated, cancel_token=cancel_token, cached=cached)
+
+    def mod_files(self, mod_id):
+        return self.get_json(f"Mod/{mod_id}/Files")
+
+    def mod_profile(self, mod_id, properties="@gbprofile", max_age=None, cancel_token=None, cached=True):
+        return self.get_json(f"Mod/{mod_id}", params={'_csvProperties': properties}, max_age=max_age, cancel_token=cancel_token,
+                             cached=cached)
+
+    def _get(self, url, stats_key, cancel_token=None, **kwargs):
+        if cancel_token is None:
+            cancel_token = CancelToken()
+        cancel_token.raise_if_cancelled()
+        started = time.perf_counter()
+        failed = True
+        try:
+            response = self.session.get(url, stream=True, **kwargs)
+            cancel_token.track(response)
+            try:
+                response.raise_for_status()
+                chunks = []
+                for chunk in response.iter_content(CANCEL_CHECK_CHUNK_SIZE):
+                    cancel_token.raise_if_cancelled()
+                    chunks.append(chunk)
+            except Exception:
+                response.close()
+                cancel_token.raise_if_cancelled()
+                raise
+            finally:
+                cancel_token.untrack(response)
+            cancel_token.raise_if_cancelled()
+            failed = False
+            return response, b''.join(chunks)
+        finally:
+            self._record_latency(stats_key, time.perf_counter() - started, failed)
+
+    @staticmethod
+    def _stats_key(endpoint):
+        return re.sub(r'/\d+', '/{id}', endpoint)
+
+    def _record_latency(self, stats_key, elapsed, failed):
+        with self._stats_lock:
+            stats = self._stats_entry(stats_key)
+            stats["count"] += 1
+            stats["errors"] += int(failed)
+            stats["total_ms"] += elapsed * 1000
+            stats["max_ms"] = max(stats["max_ms"], elapsed * 1000)
+
+    def _count(self, stats_key, field):
+        with self._stats_lock:
+            self._stats_entry(stats_key)[field] += 1
+
+    def _stats_entry(self, stats_key):
+        return self._stats.setdefault(stats_key, {"count": 0, "errors": 0, "cache_hits": 0, "stale_hits": 0, "not_modified": 0,
+                                                  "total_ms": 0.0, "max_ms": 0.0})
+
+    def latency_stats(self):
+        with self._stats_lock:
+            return {key: {"count": s["count"], "errors": s["errors"], "cache_hits": s["cache_hits"],
+                          "stale_hits": s["stale_hits"], "not_modified": s["not_modified"],
+                          "avg_ms": round(s["total_ms"] / s["count"], 1) if s["count"] else 0.0, "max_ms": round(s["max_ms"], 1)}
+                    for key, s in self._stats.items()}
+
+
+client = GameBananaClient()
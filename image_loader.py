@@ -0,0 +1,262 @@
+import os
+import time
+import heapq
+import hashlib
+import itertools
+import threading
+from collections import OrderedDict
+import requests
+from PyQt6.QtCore import Qt, QBuffer, QByteArray, QIODevice
+from PyQt6.QtGui import QImage, QGuiApplication
+from gamebanana_api import client as api_client, CancelToken, RequestCancelled
+
+IMAGE_LOADER_WORKERS = 6
+IMAGE_PRIORITY_SELECTED = 0
+IMAGE_PRIORITY_VISIBLE = 1
+IMAGE_PRIORITY_PREFETCH = 2
+IMAGE_CACHE_DIR = os.path.join("cache", "images")
+DEFAULT_IMAGE_CACHE_SIZE_MB = 200
+IMAGE_CACHE_MAX_AGE = 7 * 24 * 3600
+IMAGE_CACHE_JPEG_QUALITY = 90
+PREVIEW_IMAGE_VARIANTS = ((100, '_sFile100'), (220, '_sFile220'), (530, '_sFile530'), (800, '_sFile800'))
+
+
+def device_pixel_ratio():
+    app = QGuiApplication.instance()
+    return app.devicePixelRatio() if app is not None else 1.0
+
+
+def device_size(size, ratio=None):
+    if ratio is None: ratio = device_pixel_ratio()
+    return (round(size[0] * ratio), round(size[1] * ratio))
+
+
+def preview_image_url(record, target_size=None, ratio=None):
+    images = (record.get('_aPreviewMedia') or {}).get('_aImages') or []
+    if not images: return record.get('_sPreviewUrl')
+    image = images[0]
+    base_url = image.get('_sBaseUrl', '')
+    if target_size is not None:
+        target_width, target_height = device_size(target_size, ratio)
+        for nominal_width, key in PREVIEW_IMAGE_VARIANTS:
+            if not image.get(key): continue
+            suffix = key[len('_sFile'):]
+            width, height = image.get(f'_wFile{suffix}') or nominal_width, image.get(f'_hFile{suffix}')
+            needed_width = min(target_width, target_height * width / height) if height else target_width
+            if width >= needed_width:
+                return f"{base_url}/{image[key]}"
+    file_name = image.get('_sFile') or next((image[key] for _, key in reversed(PREVIEW_IMAGE_VARIANTS) if image.get(key)), None)
+    return f"{base_url}/{file_name}" if file_name else record.get('_sPreviewUrl')
+
+
+def _decode_image(data, size=None):
+    image = QImage.fromData(data)
+    if image.isNull() or size is None or (image.width() <= size[0] and image.height() <= size[1]):
+        return image, False
+    return image.scaled(size[0], size[1], Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation), True
+
+
+def _encode_image(image):
+    encoded = QByteArray()
+    buffer = QBuffer(encoded)
+    buffer.open(QIODevice.OpenModeFlag.WriteOnly)
+    if image.hasAlphaChannel():
+        image.save(buffer, "PNG")
+    else:
+        image.save(buffer, "JPG", IMAGE_CACHE_JPEG_QUALITY)
+    buffer.close()
+    return bytes(encoded)
+
+
+class ThumbnailCache:
+    def __init__(self, directory, max_bytes):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.lock = threading.Lock()
+        self._sizes = None
+
+    @staticmethod
+    def key(url, size=None):
+        source = f"{url}|{size[0]}x{size[1]}" if size else url
+        return hashlib.sha1(source.encode('utf-8')).hexdigest()
+
+    def _paths(self, key):
+        base = os.path.join(self.directory, key)
+        return base + ".img", base + ".meta"
+
+    def _index(self):
+        if self._sizes is None:
+            files = []
+            if os.path.isdir(self.directory):
+                files = [entry for entry in os.scandir(self.directory) if entry.name.endswith(".img")]
+            files.sort(key=lambda entry: entry.stat().st_mtime)
+            self._sizes = OrderedDict((entry.name[:-4], entry.stat().st_size) for entry in files)
+        return self._sizes
+
+    def get(self, key):
+        image_path, meta_path = self._paths(key)
+        with self.lock:
+            if key not in self._index(): return None
+            self._sizes.move_to_end(key)
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                lines = f.read().split("\n")
+            with open(image_path, 'rb') as f:
+                data = f.read()
+            os.utime(image_path)
+        except OSError:
+            return None
+        if len(lines) < 3: return None
+        return {"data": data, "etag": lines[0] or None, "last_modified": lines[1] or None, "fetched_at": float(lines[2])}
+
+    def put(self, key, data, etag, last_modified):
+        image_path, meta_path = self._paths(key)
+        with self.lock:
+            try:
+                os.makedirs(self.directory, exist_ok=True)
+                with open(meta_path, 'w', encoding='utf-8') as f:
+                    f.write(f"{etag or ''}\n{last_modified or ''}\n{time.time()}")
+                with open(image_path + ".tmp", 'wb') as f:
+                    f.write(data)
+                os.replace(image_path + ".tmp", image_path)
+            except OSError as e:
+                print(f"Could not write image cache entry {key}: {e}")
+                return
+            sizes = self._index()
+            sizes[key] = len(data)
+            sizes.move_to_end(key)
+            self._evict()
+
+    def set_max_bytes(self, max_bytes):
+        with self.lock:
+            self.max_bytes = max_bytes
+            self._evict()
+
+    def _evict(self):
+        sizes = self._index()
+        total = sum(sizes.values())
+        while total > self.max_bytes and sizes:
+            old_key, old_size = sizes.popitem(last=False)
+            total -= old_size
+            for path in self._paths(old_key):
+                try: os.remove(path)
+                except OSError: pass
+
+
+class ImageRequest:
+    def __init__(self, job, callback):
+        self.job = job
+        self.callback = callback
+        self.cancelled = False
+
+
+class _ImageJob:
+    def __init__(self, url, size, priority):
+        self.url = url
+        self.size = size
+        self.priority = priority
+        self.requests = []
+        self.cancel_token = CancelToken()
+        self.started = False
+        self.cancelled = False
+
+
+class ImageLoader:
+    def __init__(self, workers=IMAGE_LOADER_WORKERS, cache_dir=IMAGE_CACHE_DIR, cache_bytes=DEFAULT_IMAGE_CACHE_SIZE_MB * 1024 * 1024):
+        self.workers = workers
+        self.cache = ThumbnailCache(cache_dir, cache_bytes)
+        self._condition = threading.Condition()
+        self._queue = []
+        self._jobs = {}
+        self._sequence = itertools.count()
+        self._threads = []
+
+    def load(self, url, callback, priority=IMAGE_PRIORITY_VISIBLE, size=None):
+        key = (url, size)
+        with self._condition:
+            self._ensure_workers()
+            job = self._jobs.get(key)
+            if job is None:
+                job = self._jobs[key] = _ImageJob(url, size, priority)
+                heapq.heappush(self._queue, (priority, next(self._sequence), job))
+            elif priority < job.priority and not job.started:
+                job.priority = priority
+                heapq.heappush(self._queue, (priority, next(self._sequence), job))
+            request = ImageRequest(job, callback)
+            job.requests.append(request)
+            self._condition.notify()
+        return request
+
+    def cancel(self, request):
+        with self._condition:
+            if request.cancelled: return
+            request.cancelled = True
+            job = request.job
+            if request in job.requests:
+                job.requests.remove(request)
+            if job.requests or job.cancelled: return
+            job.cancelled = True
+            if self._jobs.get((job.url, job.size)) is job:
+                del self._jobs[(job.url, job.size)]
+        job.cancel_token.cancel()
+
+    def _ensure_workers(self):
+        while len(self._threads) < self.workers:
+            thread = threading.Thread(target=self._worker, daemon=True)
+            self._threads.append(thread)
+            thread.start()
+
+    def _next_job(self):
+        with self._condition:
+            while True:
+                while not self._queue:
+                    self._condition.wait()
+                priority, _, job = heapq.heappop(self._queue)
+                if job.cancelled or job.started or priority != job.priority: continue
+                job.started = True
+                return job
+
+    def _fetch(self, job):
+        cache_key = self.cache.key(job.url, job.size)
+        entry = self.cache.get(cache_key)
+        if entry and time.time() - entry["fetched_at"] < IMAGE_CACHE_MAX_AGE:
+            return _decode_image(entry["data"], job.size)[0]
+        try:
+            body, etag, last_modified = api_client.get_image(job.url, entry["etag"] if entry else None,
+                                                             entry["last_modified"] if entry else None, cancel_token=job.cancel_token)
+        except requests.RequestException as e:
+            if entry is None:
+                raise
+            print(f"Using stale cached image for {job.url}: {e}")
+            return _decode_image(entry["data"], job.size)[0]
+        data = entry["data"] if body is None else body
+        image, scaled = _decode_image(data, job.size)
+        if image.isNull():
+            raise ValueError("unsupported image data")
+        self.cache.put(cache_key, _encode_image(image) if scaled else data, etag, last_modified)
+        return image
+
+    def _worker(self):
+        while True:
+            job = self._next_job()
+            try:
+                image = self._fetch(job)
+            except RequestCancelled:
+                continue
+            except Exception as e:
+                print(f"Error loading image {job.url}: {e}")
+                image = None
+            if image is not None and image.isNull():
+                image = None
+            with self._condition:
+                if self._jobs.get((job.url, job.size)) is job:
+                    del self._jobs[(job.url, job.size)]
+                pending = [request for request in job.requests if not request.cancelled]
+            for request in pending:
+                try:
+                    request.callback(image)
+                except Exception as e:
+                    print(f"Image callback failed for {job.url}: {e}")
+
+
+image_loader = ImageLoader()
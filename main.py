@@ -12,12 +12,13 @@ import patoolib
 import random
 import time
 import threading
-import requests
 import locale
 import zipfile
 import subprocess
 import psutil
 import urllib.parse
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 
 try:
     import winreg
@@ -28,9 +29,10 @@ from PyQt6.QtWidgets import (QApplication, QMainWindow, QPushButton, QVBoxLayout
                              QLabel, QHBoxLayout, QListWidget, QListWidgetItem,
                              QMessageBox, QFileDialog, QFrame, QStatusBar, QTabWidget,
                              QSpacerItem, QSizePolicy, QComboBox, QInputDialog, QStackedWidget,
-                             QDialog, QScrollArea, QCheckBox, QGridLayout, QLineEdit)
-from PyQt6.QtCore import Qt, QTimer, pyqtSignal, QObject, QUrl, QThread, QEventLoop, QPointF, QSize, QEvent, QCommandLineParser, QCommandLineOption
-from PyQt6.QtGui import QPixmap, QPainter, QColor, QFontMetrics, QDesktopServices, QIcon, QPen
+                             QDialog, QScrollArea, QCheckBox, QGridLayout, QLineEdit, QListView, QStyledItemDelegate, QStyle)
+from PyQt6.QtCore import (Qt, QTimer, pyqtSignal, QObject, QUrl, QThread, QEventLoop, QPointF, QSize, QEvent, QCommandLineParser, QCommandLineOption,
+                          QAbstractListModel, QModelIndex, QPersistentModelIndex, QRect, QRectF, QPoint)
+from PyQt6.QtGui import QPixmap, QImage, QPainter, QColor, QFont, QFontMetrics, QDesktopServices, QIcon, QPen, QCursor
 from PyQt6.QtNetwork import QLocalServer, QLocalSocket
 
 IS_WINDOWS = sys.platform == 'win32'
@@ -45,7 +47,12 @@ if IS_WINDOWS:
         IS_WINDOWS = False 
 
 from translation import Translator
-from download_tab import DownloadTab, format_timestamp, FileSelectionDialog
+from download_tab import DownloadTab, format_timestamp, format_size, FileSelectionDialog, DEFAULT_MAX_CONCURRENT_DOWNLOADS, DEFAULT_DOWNLOAD_SEGMENTS
+from gamebanana_api import client as api_client, CancelToken
+from image_loader import image_loader, preview_image_url, device_pixel_ratio, device_size, IMAGE_PRIORITY_SELECTED, DEFAULT_IMAGE_CACHE_SIZE_MB
+from pixmap_cache import pixmap_cache, file_source
+from search_index import LocalModIndex
+from disk_usage import DiskUsageScanner
 from settings_tab import SettingsTab
 from info_tab import InfoTab
 
@@ -59,7 +66,26 @@ MODPACKS_DATA_DIR = "modpacks_data"
 MODPACKS_LIBRARY_DIR = "modpacks_library"
 MOD_IMAGES_DIR = "mod_images"
 
+UPDATE_CHECK_WORKERS = 8
+UPDATE_CHECK_PROPERTIES = "_idRow,_sName,_tsDateModified,_nLikeCount"
+UPDATE_CHECK_MAX_AGE = 300
+UPDATE_CHECK_CANCEL_POLL = 0.25
+DEFAULT_UPDATE_CHECK_INTERVAL_MINUTES = 60
+STARTUP_UPDATE_CHECK_DELAY_MS = 5000
+RECENT_UPDATE_STALENESS = 2 * 3600
+ACTIVE_MOD_STALENESS = 6 * 3600
+DEFAULT_STALENESS = 24 * 3600
+POPULAR_MOD_LIKES = 100
+DETAILS_IMAGE_SIZE = (640, 480)
+DISK_USAGE_SCAN_DELAY_MS = 500
+STORAGE_LOCATIONS = ("mods", "modpacks", "downloads", "backup", "deployed")
+STORAGE_TOP_ITEMS = 20
+
 NUM_STARS = 350
+HOME_MOD_ROW_HEIGHT = 55
+HOME_MOD_BUTTON_HEIGHT = 32
+HOME_MOD_NAME_ROLE = Qt.ItemDataRole.UserRole
+HOME_MOD_ACTIVE_ROLE = Qt.ItemDataRole.UserRole + 1
 ANIMATION_INTERVAL = 12
 
 POWER_BUTTON_INACTIVE_STYLE = """
@@ -118,7 +144,24 @@ class _PopenWrapper(object):
 
     def __getattr__(self, name):
         return getattr(self._process, name)
-    
+
+_popen_patch_lock = threading.Lock()
+_popen_patch_users = 0
+
+@contextmanager
+def _hidden_console_popen():
+    global _popen_patch_users
+    with _popen_patch_lock:
+        _popen_patch_users += 1
+        subprocess.Popen = _PopenWrapper
+    try:
+        yield
+    finally:
+        with _popen_patch_lock:
+            _popen_patch_users -= 1
+            if _popen_patch_users == 0:
+                subprocess.Popen = _original_popen
+
 class ClickableLabel(QLabel):
     clicked = pyqtSignal()
 
@@ -131,22 +174,262 @@ class ClickableLabel(QLabel):
             self.clicked.emit()
         super().mousePressEvent(event)
 
-class ModStatusIndicator(QLabel):
-    def __init__(self, is_active=False):
-        super().__init__()
-        self.setFixedSize(20, 20)
-        self.set_status(is_active)
-
-    def set_status(self, is_active):
-        pixmap = QPixmap(self.size())
-        pixmap.fill(Qt.GlobalColor.transparent)
-        painter = QPainter(pixmap)
-        color = QColor("#00d1c1") if is_active else QColor("#5a5a5a")
-        painter.setBrush(color)
+class HomeModListModel(QAbstractListModel):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.mods = []
+        self._rows = {}
+        self.toggles_enabled = True
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.mods)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid(): return None
+        mod_row = self.mods[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole: return mod_row["display_name"]
+        if role == HOME_MOD_NAME_ROLE: return mod_row["name"]
+        if role == HOME_MOD_ACTIVE_ROLE: return mod_row["active"]
+        return None
+
+    def set_mods(self, mod_rows):
+        new_names = [mod_row["name"] for mod_row in mod_rows]
+        new_name_set = set(new_names)
+        for row in reversed(range(len(self.mods))):
+            if self.mods[row]["name"] not in new_name_set:
+                self.beginRemoveRows(QModelIndex(), row, row)
+                del self.mods[row]
+                self.endRemoveRows()
+        current_names = [mod_row["name"] for mod_row in self.mods]
+        current_name_set = set(current_names)
+        if not current_names or [name for name in new_names if name in current_name_set] != current_names:
+            self.beginResetModel()
+            self.mods = [dict(mod_row) for mod_row in mod_rows]
+            self._rows = {name: row for row, name in enumerate(new_names)}
+            self.endResetModel()
+            return
+        for row, mod_row in enumerate(mod_rows):
+            if row < len(self.mods) and self.mods[row]["name"] == mod_row["name"]:
+                if self.mods[row] != mod_row:
+                    self.mods[row] = dict(mod_row)
+                    self.dataChanged.emit(self.index(row), self.index(row))
+                continue
+            self.beginInsertRows(QModelIndex(), row, row)
+            self.mods.insert(row, dict(mod_row))
+            self.endInsertRows()
+        self._rows = {name: row for row, name in enumerate(new_names)}
+
+    def row_for_name(self, mod_name):
+        return self._rows.get(mod_name)
+
+    def set_active(self, mod_name, active):
+        row = self._rows.get(mod_name)
+        if row is None or self.mods[row]["active"] == active: return
+        self.mods[row]["active"] = active
+        self.dataChanged.emit(self.index(row), self.index(row))
+
+    def set_toggles_enabled(self, enabled):
+        if enabled == self.toggles_enabled: return
+        self.toggles_enabled = enabled
+        if self.mods:
+            self.dataChanged.emit(self.index(0), self.index(len(self.mods) - 1))
+
+
+class HomeModDelegate(QStyledItemDelegate):
+    toggle_clicked = pyqtSignal(str, bool)
+    delete_clicked = pyqtSignal(str)
+
+    def __init__(self, translator, parent=None):
+        super().__init__(parent)
+        self.translator = translator
+
+    def sizeHint(self, option, index):
+        return QSize(0, HOME_MOD_ROW_HEIGHT)
+
+    @staticmethod
+    def _font(base, pixel_size):
+        font = QFont(base)
+        font.setPixelSize(pixel_size)
+        return font
+
+    def _rects(self, option):
+        t = self.translator.get
+        inner = option.rect.adjusted(15, 10, -15, -10)
+        center_y = inner.center().y()
+        metrics = QFontMetrics(self._font(option.font, 12))
+        toggle_width = max(90, max(metrics.horizontalAdvance(t("btn_activate")), metrics.horizontalAdvance(t("btn_deactivate"))) + 18)
+        delete_width = max(80, metrics.horizontalAdvance(t("btn_delete")) + 18)
+        delete_rect = QRect(inner.right() - delete_width + 1, center_y - HOME_MOD_BUTTON_HEIGHT // 2, delete_width, HOME_MOD_BUTTON_HEIGHT)
+        toggle_rect = QRect(delete_rect.left() - 15 - toggle_width, delete_rect.top(), toggle_width, HOME_MOD_BUTTON_HEIGHT)
+        indicator_rect = QRect(inner.left(), center_y - 10, 20, 20)
+        label_rect = QRect(indicator_rect.right() + 16, inner.top(), toggle_rect.left() - indicator_rect.right() - 31, inner.height())
+        return {"indicator": indicator_rect, "label": label_rect, "toggle": toggle_rect, "delete": delete_rect}
+
+    def _draw_button(self, painter, rect, text, font, hovered, enabled, colors):
+        border, text_color, hover_background, hover_border = colors
+        if not enabled:
+            border, text_color = "#4a3a6a", "#6a5a8a"
+        elif hovered:
+            painter.setBrush(QColor(hover_background))
+            border, text_color = hover_border, "#ffffff"
+        painter.setPen(QPen(QColor(border), 1))
+        if not (enabled and hovered):
+            painter.setBrush(Qt.BrushStyle.NoBrush)
+        painter.drawRoundedRect(QRectF(rect).adjusted(0.5, 0.5, -0.5, -0.5), 5, 5)
+        painter.setFont(font)
+        painter.setPen(QColor(text_color))
+        painter.drawText(rect, Qt.AlignmentFlag.AlignCenter, text)
+
+    def paint(self, painter, option, index):
+        t = self.translator.get
+        rects = self._rects(option)
+        active = index.data(HOME_MOD_ACTIVE_ROLE)
+        toggles_enabled = index.model().toggles_enabled
+        row_hovered = bool(option.state & QStyle.StateFlag.State_MouseOver)
+        cursor = option.widget.viewport().mapFromGlobal(QCursor.pos()) if row_hovered and option.widget else QPoint(-1, -1)
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+
+        if option.state & QStyle.StateFlag.State_Selected:
+            painter.setPen(QPen(QColor("#ffc900"), 2))
+            painter.setBrush(QColor(67, 51, 99))
+            painter.drawRoundedRect(QRectF(option.rect).adjusted(1, 1, -1, -1), 8, 8)
+        elif row_hovered:
+            painter.setPen(Qt.PenStyle.NoPen)
+            painter.setBrush(QColor(67, 51, 99, 153))
+            painter.drawRoundedRect(QRectF(option.rect), 8, 8)
+
         painter.setPen(Qt.PenStyle.NoPen)
-        painter.drawEllipse(0, 0, 20, 20)
-        painter.end()
-        self.setPixmap(pixmap)
+        painter.setBrush(QColor("#00d1c1") if active else QColor("#5a5a5a"))
+        painter.drawEllipse(rects["indicator"])
+
+        label_font = self._font(option.font, 18)
+        painter.setFont(label_font)
+        painter.setPen(QColor("#f0f0f0"))
+        text = QFontMetrics(label_font).elidedText(index.data(Qt.ItemDataRole.DisplayRole), Qt.TextElideMode.ElideRight, rects["label"].width())
+        painter.drawText(rects["label"], Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignLeft, text)
+
+        button_font = self._font(option.font, 12)
+        self._draw_button(painter, rects["toggle"], t("btn_deactivate") if active else t("btn_activate"), button_font,
+                          rects["toggle"].contains(cursor), toggles_enabled, ("#856ec4", "#a090c0", "#433363", "#856ec4"))
+        self._draw_button(painter, rects["delete"], t("btn_delete"), button_font,
+                          rects["delete"].contains(cursor), True, ("#c0392b", "#e74c3c", "#c0392b", "#e74c3c"))
+        painter.restore()
+
+    def editorEvent(self, event, model, option, index):
+        if event.type() in (QEvent.Type.MouseButtonPress, QEvent.Type.MouseButtonRelease, QEvent.Type.MouseButtonDblClick) \
+                and event.button() == Qt.MouseButton.LeftButton:
+            rects = self._rects(option)
+            position = event.position().toPoint()
+            mod_name = index.data(HOME_MOD_NAME_ROLE)
+            if rects["toggle"].contains(position):
+                if event.type() == QEvent.Type.MouseButtonRelease and model.toggles_enabled:
+                    self.toggle_clicked.emit(mod_name, not index.data(HOME_MOD_ACTIVE_ROLE))
+                return True
+            if rects["delete"].contains(position):
+                if event.type() == QEvent.Type.MouseButtonRelease:
+                    self.delete_clicked.emit(mod_name)
+                return True
+        return super().editorEvent(event, model, option, index)
+
+
+class HomeModListView(QListView):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.empty_text = ""
+        self.setMouseTracking(True)
+        self.setUniformItemSizes(True)
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.setVerticalScrollMode(QListView.ScrollMode.ScrollPerPixel)
+        self._hovered_index = QPersistentModelIndex()
+
+    def set_empty_text(self, text):
+        if text != self.empty_text:
+            self.empty_text = text
+            self.viewport().update()
+
+    def mouseMoveEvent(self, event):
+        super().mouseMoveEvent(event)
+        self._set_hovered_index(self.indexAt(event.position().toPoint()))
+
+    def leaveEvent(self, event):
+        super().leaveEvent(event)
+        self._set_hovered_index(QModelIndex())
+
+    def _set_hovered_index(self, index):
+        previous = self._hovered_index
+        if previous.isValid() and previous != index:
+            self.viewport().update(self.visualRect(self.model().index(previous.row(), 0)))
+        if index.isValid():
+            self.viewport().update(self.visualRect(index))
+        self._hovered_index = QPersistentModelIndex(index)
+
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        if self.model() is not None and self.model().rowCount() == 0 and self.empty_text:
+            painter = QPainter(self.viewport())
+            font = QFont(self.font())
+            font.setItalic(True)
+            painter.setFont(font)
+            painter.setPen(QColor("#a090c0"))
+            painter.drawText(self.viewport().rect().adjusted(40, 40, -40, -40),
+                             Qt.AlignmentFlag.AlignHCenter | Qt.AlignmentFlag.AlignTop | Qt.TextFlag.TextWordWrap, self.empty_text)
+            painter.end()
+
+class StorageSummaryDialog(QDialog):
+    def __init__(self, translator, display_names, parent=None):
+        super().__init__(parent)
+        self.translator = translator
+        self.display_names = display_names
+        t = translator.get
+        self.setWindowTitle(t("storage_dialog_title"))
+        self.setMinimumSize(520, 600)
+        self.layout = QVBoxLayout(self)
+
+        totals_layout = QGridLayout()
+        self.total_labels = {}
+        for row, key in enumerate(STORAGE_LOCATIONS + ("total",)):
+            name_label = QLabel(t(f"storage_location_{key}"))
+            value_label = QLabel(t("details_size_calculating"))
+            value_label.setAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
+            if key == "total":
+                name_label.setStyleSheet("font-weight: bold;")
+                value_label.setStyleSheet("font-weight: bold;")
+            totals_layout.addWidget(name_label, row, 0)
+            totals_layout.addWidget(value_label, row, 1)
+            self.total_labels[key] = value_label
+        self.layout.addLayout(totals_layout)
+
+        self.layout.addWidget(QLabel(t("storage_largest_mods")))
+        self.largest_mods_list = QListWidget()
+        self.layout.addWidget(self.largest_mods_list, 2)
+        self.layout.addWidget(QLabel(t("storage_largest_modpacks")))
+        self.largest_packs_list = QListWidget()
+        self.layout.addWidget(self.largest_packs_list, 1)
+
+        button_box = QHBoxLayout()
+        button_box.addStretch()
+        self.close_button = QPushButton(t("btn_close"))
+        self.close_button.clicked.connect(self.accept)
+        button_box.addWidget(self.close_button)
+        self.layout.addLayout(button_box)
+
+    def _format_usage(self, usage):
+        return self.translator.get("details_size_value").format(size=format_size(usage["size"]), files=usage["files"])
+
+    def set_usage(self, disk_usage):
+        totals = disk_usage["totals"]
+        if not totals: return
+        for key in STORAGE_LOCATIONS:
+            self.total_labels[key].setText(self._format_usage(totals[key]))
+        self.total_labels["total"].setText(self._format_usage({"size": sum(totals[key]["size"] for key in STORAGE_LOCATIONS),
+                                                              "files": sum(totals[key]["files"] for key in STORAGE_LOCATIONS)}))
+        for list_widget, items, names in ((self.largest_mods_list, disk_usage["items"]["mods"], self.display_names),
+                                          (self.largest_packs_list, disk_usage["items"]["modpacks"], {})):
+            list_widget.clear()
+            for name, usage in sorted(items.items(), key=lambda item: -item[1]["size"])[:STORAGE_TOP_ITEMS]:
+                list_widget.addItem(f"{names.get(name, name)} — {self._format_usage(usage)}")
+
 
 class ProfileEditDialog(QDialog):
     def __init__(self, translator, all_mods, profile_name="", selected_mods=None, parent=None):
@@ -251,31 +534,25 @@ class ProfileEditDialog(QDialog):
             "deleted": self.delete_confirmed
         }
 
-class ElidedLabel(QLabel):
-    def __init__(self, text, parent=None):
-        super().__init__(text, parent)
-        self.original_text = text
-
-    def paintEvent(self, event):
-        painter = QPainter(self)
-        metrics = QFontMetrics(self.font())
-        elided_text = metrics.elidedText(self.original_text, Qt.TextElideMode.ElideRight, self.width())
-        painter.drawText(self.rect(), self.alignment(), elided_text)
-
 class UpdateWorkerSignals(QObject):
     update_status_bar = pyqtSignal(str, int)
     show_message_box = pyqtSignal(str, str, int)
     enable_main_update_button = pyqtSignal(bool)
     set_cursor = pyqtSignal(Qt.CursorShape)
     update_process_finished = pyqtSignal(str)
+    mod_update_checked = pyqtSignal(str, object, bool)
+    update_check_finished = pyqtSignal(int, bool, object)
 
 class ImageLoaderSignals(QObject):
-    image_loaded = pyqtSignal(QLabel, QPixmap)
-    image_error = pyqtSignal(QLabel)
+    image_loaded = pyqtSignal(QLabel, QImage, str)
+    image_error = pyqtSignal(QLabel, str)
 
 class ModUpdateUISignals(QObject):
     update_mod_details_status = pyqtSignal(str)
 
+class DiskUsageSignals(QObject):
+    scan_finished = pyqtSignal(object)
+
 class UpdateFileSelectionHandler(QObject):
     show_dialog_request = pyqtSignal(list, object)
 
@@ -286,6 +563,112 @@ class UpdateFileSelectionHandler(QObject):
         else:
             result_list_holder.append(None)
 
+class MainThreadInvoker(QObject):
+    call_requested = pyqtSignal(object, object)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.call_requested.connect(self._run_call, Qt.ConnectionType.BlockingQueuedConnection)
+
+    def _run_call(self, func, result_holder):
+        try:
+            result_holder.append(func())
+        except Exception as e:
+            result_holder.append(e)
+
+    def call(self, func):
+        if QThread.currentThread() is self.thread():
+            return func()
+        result_holder = []
+        self.call_requested.emit(func, result_holder)
+        result = result_holder[0] if result_holder else None
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+class ModInstaller(QObject):
+    stage_changed = pyqtSignal(str, str)
+    finished = pyqtSignal(str)
+    cancelled = pyqtSignal(str)
+    error = pyqtSignal(str, str)
+
+    def __init__(self, manager, file_path, mod_name_initial, is_download=False, mod_gamebanana_info=None, manual_image_path=None, activate=False):
+        super().__init__()
+        self.manager = manager
+        self.file_path = file_path
+        self.clean_mod_name = re.sub(r'[/:*?"<>|]', '', mod_name_initial)
+        self.is_download = is_download
+        self.mod_gamebanana_info = mod_gamebanana_info
+        self.manual_image_path = manual_image_path
+        self.activate = activate
+
+    def run(self):
+        temp_extract_path = os.path.join(MODS_DIR, f"temp_{self.clean_mod_name}_{int(time.time())}")
+        invoker = self.manager.main_thread_invoker
+        try:
+            self.stage_changed.emit(self.clean_mod_name, "inspect")
+            if not os.path.isfile(self.file_path):
+                raise FileNotFoundError(self.file_path)
+            patoolib.get_archive_format(self.file_path)
+
+            self.stage_changed.emit(self.clean_mod_name, "extract")
+            with _hidden_console_popen():
+                patoolib.extract_archive(self.file_path, outdir=temp_extract_path, verbosity=-1)
+
+            self.stage_changed.emit(self.clean_mod_name, "normalize")
+            final_mod_name, source_to_move = self._find_mod_root(temp_extract_path)
+
+            if not invoker.call(lambda: self.manager._confirm_mod_replace(final_mod_name)):
+                self.cancelled.emit(final_mod_name)
+                return
+
+            self.stage_changed.emit(final_mod_name, "register")
+            final_dest_path = os.path.join(MODS_DIR, final_mod_name)
+            if source_to_move == temp_extract_path: os.rename(temp_extract_path, final_dest_path)
+            else: shutil.move(source_to_move, final_dest_path)
+            saved_image_path = self._copy_manual_image(final_mod_name)
+            invoker.call(lambda: self.manager._register_installed_mod(final_mod_name, self.mod_gamebanana_info, saved_image_path))
+
+            if self.activate:
+                self.stage_changed.emit(final_mod_name, "activate")
+                invoker.call(lambda: self.manager._activate_installed_mod(final_mod_name))
+
+            self.finished.emit(final_mod_name)
+
+        except Exception as e:
+            self.error.emit(self.clean_mod_name, str(e))
+
+        finally:
+            if os.path.exists(temp_extract_path): shutil.rmtree(temp_extract_path, ignore_errors=True)
+            if self.is_download and os.path.exists(self.file_path): os.remove(self.file_path)
+
+    def _find_mod_root(self, temp_extract_path):
+        items_in_temp = os.listdir(temp_extract_path)
+        final_mod_name = self.clean_mod_name
+        source_to_move = temp_extract_path
+
+        if len(items_in_temp) == 1 and os.path.isdir(os.path.join(temp_extract_path, items_in_temp[0])):
+            final_mod_name = items_in_temp[0]
+            source_to_move = os.path.join(temp_extract_path, final_mod_name)
+        elif len(items_in_temp) > 1 and any(os.path.isdir(os.path.join(temp_extract_path, item)) for item in items_in_temp):
+            potential_mod_dirs = [d for d in items_in_temp if os.path.isdir(os.path.join(temp_extract_path, d))]
+            if len(potential_mod_dirs) == 1:
+                final_mod_name = potential_mod_dirs[0]
+                source_to_move = os.path.join(temp_extract_path, final_mod_name)
+        return final_mod_name, source_to_move
+
+    def _copy_manual_image(self, final_mod_name):
+        if not self.manual_image_path or not os.path.exists(self.manual_image_path):
+            return None
+        try:
+            image_filename = f"{final_mod_name}{os.path.splitext(self.manual_image_path)[1]}"
+            dest_image_path = os.path.join(MOD_IMAGES_DIR, image_filename)
+            shutil.copy(self.manual_image_path, dest_image_path)
+            return dest_image_path
+        except Exception as e:
+            print(f"Error al copiar la imagen manual: {e}")
+            return None
+
 class ModpackCreationDialog(QDialog):
     def __init__(self, available_mods_data, translator, parent=None, modpack_data=None, profiles_data=None):
         super().__init__(parent)
@@ -459,19 +842,39 @@ class ZeroManager(QMainWindow):
         self.is_applying_profile = False
         self.translator = Translator()
         self.image_loader_signals = ImageLoaderSignals()
-        self.image_loader_signals.image_loaded.connect(self._set_detail_image)
-        self.image_loader_signals.image_error.connect(self._set_detail_image_error)
+        self.image_loader_signals.image_loaded.connect(self._on_details_image_loaded)
+        self.image_loader_signals.image_error.connect(self._on_details_image_error)
+        self._details_image_url = None
+        self._details_image_request = None
         self.mod_update_ui_signals = ModUpdateUISignals()
         self.mod_update_ui_signals.update_mod_details_status.connect(self._update_mod_details_ui_slot)
         self.update_mod_details_ui_signal.connect(self._update_mod_details_ui_slot)
         self.update_worker_signals = UpdateWorkerSignals()
-        self.update_worker_signals.update_status_bar.connect(self.statusBar().showMessage)
         self.update_worker_signals.show_message_box.connect(self._show_message_box_slot)
         self.update_worker_signals.enable_main_update_button.connect(self._set_main_update_button_enabled_slot)
         self.update_worker_signals.set_cursor.connect(QApplication.setOverrideCursor)
         self.update_worker_signals.update_process_finished.connect(self._on_update_process_finished)
+        self.update_worker_signals.mod_update_checked.connect(self._apply_mod_update_result)
+        self.update_worker_signals.update_check_finished.connect(self._on_update_check_finished)
+        self.update_check_cancel_event = None
+        self.update_check_timer = QTimer(self)
+        self.update_check_timer.timeout.connect(self.run_scheduled_update_check)
         self.update_file_selection_handler = UpdateFileSelectionHandler()
         self.update_file_selection_handler.show_dialog_request.connect(self.update_file_selection_handler.show_dialog)
+        self.main_thread_invoker = MainThreadInvoker(self)
+        self.active_installers = set()
+        self.local_mod_index = LocalModIndex()
+        self.disk_usage_scanner = DiskUsageScanner()
+        self.disk_usage = {"totals": {}, "items": {"mods": {}, "modpacks": {}}}
+        self.disk_usage_signals = DiskUsageSignals()
+        self.disk_usage_signals.scan_finished.connect(self._on_disk_usage_scanned)
+        self.disk_usage_scan_running = False
+        self.disk_usage_scan_pending = False
+        self.disk_usage_timer = QTimer(self)
+        self.disk_usage_timer.setSingleShot(True)
+        self.disk_usage_timer.setInterval(DISK_USAGE_SCAN_DELAY_MS)
+        self.disk_usage_timer.timeout.connect(self._start_disk_usage_scan)
+        self.storage_dialog = None
         
         
         self.current_mod_for_update = None
@@ -480,6 +883,7 @@ class ZeroManager(QMainWindow):
         self.setup_ui()
 
         self.download_tab.update_main_status.connect(self.statusBar().showMessage)
+        self.update_worker_signals.update_status_bar.connect(self.statusBar().showMessage)
         self.download_tab.show_main_message_box.connect(self._show_message_box_slot)
 
         self.load_config_and_init()
@@ -650,6 +1054,10 @@ class ZeroManager(QMainWindow):
         self.game_path_label = QLabel("...")
         self.game_path_label.setObjectName("PathLabel")
         path_layout.addWidget(self.game_path_label, 1)
+        self.storage_button = QPushButton("...")
+        self.storage_button.setObjectName("ChangePathButton")
+        self.storage_button.clicked.connect(self.show_storage_summary)
+        path_layout.addWidget(self.storage_button)
         self.change_path_button = QPushButton("...")
         self.change_path_button.setObjectName("ChangePathButton")
         self.change_path_button.clicked.connect(self.change_game_path)
@@ -670,11 +1078,15 @@ class ZeroManager(QMainWindow):
         self.home_stack.addWidget(self.modpack_view_widget)
         self.tabs.addTab(self.home_tab_widget, "...")
         self.download_tab = DownloadTab(translator=self.translator)
-        self.download_tab.mod_downloaded.connect(self.install_mod_from_path)
+        self.download_tab.mod_downloaded.connect(lambda file_path, mod_name, is_download, mod_info, on_done: self.install_mod_from_path(
+            file_path, mod_name, is_download=is_download, mod_gamebanana_info=mod_info, on_done=on_done))
         self.tabs.addTab(self.download_tab, "...")
         self.settings_tab = SettingsTab(self)
         self.settings_tab.particle_animation_toggled.connect(self._handle_particle_animation_toggle)
         self.settings_tab.language_changed.connect(self._on_language_changed)
+        self.settings_tab.download_settings_changed.connect(self._apply_download_settings)
+        self.settings_tab.update_check_settings_changed.connect(self._apply_update_check_settings)
+        self.settings_tab.cache_settings_changed.connect(self._apply_cache_settings)
         self.tabs.addTab(self.settings_tab, "...")
         self.info_tab = InfoTab(self)
         info_icon_path = resource_path("img/info_icon.png")
@@ -717,10 +1129,39 @@ class ZeroManager(QMainWindow):
         self.switch_to_modpacks_button.clicked.connect(self.switch_view_mode)
         profile_layout.addWidget(self.switch_to_modpacks_button)
         mod_list_column_layout.addWidget(top_panel_frame)
-        self.mod_list = QListWidget()
+        mod_filter_frame = QFrame()
+        mod_filter_frame.setObjectName("TopBarFrame")
+        mod_filter_layout = QHBoxLayout(mod_filter_frame)
+        mod_filter_layout.setContentsMargins(10, 5, 10, 5)
+        mod_filter_layout.setSpacing(8)
+        self.mod_search_bar = QLineEdit()
+        self.mod_search_bar.setClearButtonEnabled(True)
+        self.mod_search_bar.textChanged.connect(lambda: self.update_mod_list())
+        mod_filter_layout.addWidget(self.mod_search_bar, 1)
+        self.mod_status_filter = QComboBox()
+        for status in (None, "active", "inactive"): self.mod_status_filter.addItem("", status)
+        self.mod_type_filter = QComboBox()
+        for mod_type in (None, "paks", "json", "general"): self.mod_type_filter.addItem("", mod_type)
+        self.mod_sort_combo = QComboBox()
+        for sort in ("name", "installed", "size", "updated"): self.mod_sort_combo.addItem("", sort)
+        for combo in (self.mod_status_filter, self.mod_type_filter, self.mod_sort_combo):
+            combo.setSizeAdjustPolicy(QComboBox.SizeAdjustPolicy.AdjustToContents)
+            combo.currentIndexChanged.connect(lambda: self.update_mod_list())
+            mod_filter_layout.addWidget(combo)
+        self.mod_updates_filter = QCheckBox()
+        self.mod_updates_filter.toggled.connect(lambda: self.update_mod_list())
+        mod_filter_layout.addWidget(self.mod_updates_filter)
+        mod_list_column_layout.addWidget(mod_filter_frame)
+        self.mod_list = HomeModListView()
         self.mod_list.setObjectName("ModList")
         self.mod_list.setFocusPolicy(Qt.FocusPolicy.NoFocus)
-        self.mod_list.currentItemChanged.connect(self.display_mod_details)
+        self.mod_list_model = HomeModListModel(self)
+        self.mod_list_delegate = HomeModDelegate(self.translator, self.mod_list)
+        self.mod_list_delegate.toggle_clicked.connect(self.toggle_mod)
+        self.mod_list_delegate.delete_clicked.connect(self.delete_mod)
+        self.mod_list.setItemDelegate(self.mod_list_delegate)
+        self.mod_list.setModel(self.mod_list_model)
+        self.mod_list.selectionModel().currentChanged.connect(self.display_mod_details)
         mod_list_column_layout.addWidget(self.mod_list)
         home_controls_frame = QFrame()
         home_controls_frame.setStyleSheet("background: transparent;")
@@ -741,6 +1182,11 @@ class ZeroManager(QMainWindow):
         self.update_mods_button.setObjectName("UpdateButton")
         self.update_mods_button.clicked.connect(self.check_for_mod_updates)
         home_controls_layout.addWidget(self.update_mods_button)
+        self.cancel_update_check_button = QPushButton("...")
+        self.cancel_update_check_button.setObjectName("UpdateButton")
+        self.cancel_update_check_button.clicked.connect(self.cancel_mod_update_check)
+        self.cancel_update_check_button.hide()
+        home_controls_layout.addWidget(self.cancel_update_check_button)
         mod_list_column_layout.addWidget(home_controls_frame)
         main_layout.addLayout(mod_list_column_layout, 2)
         self.mod_details_frame = QFrame()
@@ -771,6 +1217,9 @@ class ZeroManager(QMainWindow):
         self.mod_details_url_label.setObjectName("ModDetailInfoLabel")
         self.mod_details_url_label.setOpenExternalLinks(True)
         mod_details_layout.addWidget(self.mod_details_url_label)
+        self.mod_details_size_label = QLabel("")
+        self.mod_details_size_label.setObjectName("ModDetailInfoLabel")
+        mod_details_layout.addWidget(self.mod_details_size_label)
         mod_details_layout.addStretch(1)
         self.mod_details_update_status_label = QLabel("")
         self.mod_details_update_status_label.setObjectName("ModDetailUpdateStatus")
@@ -899,6 +1348,7 @@ class ZeroManager(QMainWindow):
         self.modding_power_button.setText(t("transformation_mode"))
         self.game_path_label.setText(t("finding_game_path"))
         self.change_path_button.setText(t("change_path"))
+        self.storage_button.setText(t("storage_button"))
         self.tabs.setTabText(self.tabs.indexOf(self.home_tab_widget), t("tab_my_mods"))
         self.tabs.setTabText(self.tabs.indexOf(self.download_tab), t("tab_download_mods"))
         self.tabs.setTabText(self.tabs.indexOf(self.settings_tab), t("tab_settings"))
@@ -912,7 +1362,12 @@ class ZeroManager(QMainWindow):
         self.disable_all_button.setText(t("home_deactivate_all"))
         self.manual_install_button.setText(t("home_install_manual"))
         self.update_mods_button.setText(t("home_update_mods"))
+        self.cancel_update_check_button.setText(t("home_cancel_update_check"))
         self.switch_to_modpacks_button.setText(t("switch_to_modpacks"))
+        self.mod_search_bar.setPlaceholderText(t("mod_filter_search_placeholder"))
+        for combo, prefix in ((self.mod_status_filter, "mod_filter_status_"), (self.mod_type_filter, "mod_filter_type_"), (self.mod_sort_combo, "mod_sort_")):
+            for i in range(combo.count()): combo.setItemText(i, t(prefix + (combo.itemData(i) or "all")))
+        self.mod_updates_filter.setText(t("mod_filter_updates_only"))
         self.create_modpack_button.setText(t("modpack_create"))
         self.import_modpack_button.setText(t("modpack_import"))
         self.switch_to_profiles_button.setText(t("switch_to_profiles"))
@@ -933,8 +1388,8 @@ class ZeroManager(QMainWindow):
         if self.tabs.widget(index) == self.download_tab: self.download_tab.load_mods_if_needed()
         elif self.tabs.widget(index) == self.home_tab_widget:
             self.sync_mods_folder()
-            if self.home_stack.currentIndex() == 0 and self.mod_list.currentItem():
-                self.display_mod_details(self.mod_list.currentItem(), None)
+            if self.home_stack.currentIndex() == 0 and self.mod_list.currentIndex().isValid():
+                self.display_mod_details(self.mod_list.currentIndex(), None)
         elif self.tabs.widget(index) == self.settings_tab: self.settings_tab.load_settings()
 
     def load_config_and_init(self):
@@ -976,6 +1431,12 @@ class ZeroManager(QMainWindow):
         self.config.setdefault("modpacks", {})
         self.config.setdefault("active_modpack", None)
         self.config.setdefault("mod_management_mode", "profiles")
+        self.config.setdefault("max_concurrent_downloads", DEFAULT_MAX_CONCURRENT_DOWNLOADS)
+        self.config.setdefault("download_speed_limit_kbps", 0)
+        self.config.setdefault("update_check_interval_minutes", DEFAULT_UPDATE_CHECK_INTERVAL_MINUTES)
+        self.config.setdefault("image_cache_size_mb", DEFAULT_IMAGE_CACHE_SIZE_MB)
+        self._apply_download_settings()
+        self._apply_cache_settings()
 
         profiles_migrated = False
         for profile_name, profile_data in self.config.get("profiles", {}).items():
@@ -1010,6 +1471,24 @@ class ZeroManager(QMainWindow):
                     break 
         self.update_ui_state()
         self.save_config()
+        self._apply_update_check_settings()
+        if self.update_check_timer.isActive():
+            QTimer.singleShot(STARTUP_UPDATE_CHECK_DELAY_MS, self.run_scheduled_update_check)
+
+    def _apply_update_check_settings(self):
+        interval_minutes = self.config.get("update_check_interval_minutes", DEFAULT_UPDATE_CHECK_INTERVAL_MINUTES)
+        if interval_minutes > 0:
+            self.update_check_timer.start(interval_minutes * 60 * 1000)
+        else:
+            self.update_check_timer.stop()
+
+    def _apply_download_settings(self):
+        self.download_tab.download_manager.configure(self.config.get("max_concurrent_downloads", DEFAULT_MAX_CONCURRENT_DOWNLOADS),
+                                                     self.config.get("download_speed_limit_kbps", 0),
+                                                     self.config.get("download_segments", DEFAULT_DOWNLOAD_SEGMENTS))
+
+    def _apply_cache_settings(self):
+        image_loader.cache.set_max_bytes(self.config.get("image_cache_size_mb", DEFAULT_IMAGE_CACHE_SIZE_MB) * 1024 * 1024)
 
     def _handle_particle_animation_toggle(self, enabled):
         self.config["particle_animation_enabled"] = enabled
@@ -1031,92 +1510,89 @@ class ZeroManager(QMainWindow):
         mod_name_initial = os.path.splitext(os.path.basename(file_path))[0]
         self.install_mod_from_path(file_path, mod_name_initial, is_download=False, mod_gamebanana_info=None, manual_image_path=image_path)
 
-    def install_mod_from_path(self, file_path, mod_name_initial, is_download=False, mod_gamebanana_info=None, manual_image_path=None):
+    def install_mod_from_path(self, file_path, mod_name_initial, is_download=False, mod_gamebanana_info=None, manual_image_path=None, on_done=None):
+        if QThread.currentThread() is not self.thread():
+            self.main_thread_invoker.call(lambda: self.install_mod_from_path(file_path, mod_name_initial, is_download, mod_gamebanana_info, manual_image_path, on_done))
+            return
+        activate = self.config.get("mod_management_mode") == "profiles" and self.game_path_is_valid and self.modding_power_button.isChecked()
+        installer = ModInstaller(self, file_path, mod_name_initial, is_download=is_download, mod_gamebanana_info=mod_gamebanana_info,
+                                 manual_image_path=manual_image_path, activate=activate)
+        installer.stage_changed.connect(self._on_install_stage_changed)
+        installer.finished.connect(lambda final_mod_name: self._on_install_finished(installer, final_mod_name, on_done))
+        installer.cancelled.connect(lambda final_mod_name: self._on_install_cancelled(installer, final_mod_name, on_done))
+        installer.error.connect(lambda mod_name, error: self._on_install_error(installer, mod_name, error, on_done))
+        self.active_installers.add(installer)
+        threading.Thread(target=installer.run, daemon=True).start()
+
+    def _on_install_stage_changed(self, mod_name, stage):
         t = self.translator.get
-        clean_mod_name = re.sub(r'[/:*?"<>|]', '', mod_name_initial)
-        temp_extract_path = os.path.join(MODS_DIR, f"temp_{clean_mod_name}_{int(time.time())}")
-        
-        subprocess.Popen = _PopenWrapper
+        stage_keys = {
+            "inspect": "status_inspecting_archive",
+            "extract": "status_extracting",
+            "normalize": "status_normalizing_mod",
+            "register": "status_registering_mod",
+            "activate": "status_activating_installed_mod",
+        }
+        self.statusBar().showMessage(t(stage_keys[stage]).format(mod_name=mod_name), 0)
 
-        try:
-            self.update_worker_signals.update_status_bar.emit(t("status_extracting").format(mod_name=clean_mod_name), 5000)
-            
-            patoolib.extract_archive(file_path, outdir=temp_extract_path, verbosity=-1)
+    def _confirm_mod_replace(self, final_mod_name):
+        t = self.translator.get
+        if final_mod_name not in self.config["mods"]:
+            return True
+        if QMessageBox.question(self, t("dialog_mod_exists_title"), t("dialog_mod_exists_text").format(mod_name=final_mod_name), QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No) != QMessageBox.StandardButton.Yes:
+            return False
+        self.statusBar().showMessage(t("status_replacing_mod").format(mod_name=final_mod_name), 3000)
+        self._delete_mod_files_and_paths(final_mod_name, keep_config_entry=True)
+        return True
 
-            items_in_temp = os.listdir(temp_extract_path)
-            final_mod_name = clean_mod_name
-            source_to_move = temp_extract_path
-            
-            if len(items_in_temp) == 1 and os.path.isdir(os.path.join(temp_extract_path, items_in_temp[0])):
-                final_mod_name = items_in_temp[0]
-                source_to_move = os.path.join(temp_extract_path, final_mod_name)
-            elif len(items_in_temp) > 1 and any(os.path.isdir(os.path.join(temp_extract_path, item)) for item in items_in_temp):
-                potential_mod_dirs = [d for d in items_in_temp if os.path.isdir(os.path.join(temp_extract_path, d))]
-                if len(potential_mod_dirs) == 1:
-                    final_mod_name = potential_mod_dirs[0]
-                    source_to_move = os.path.join(temp_extract_path, final_mod_name)
-            
-            final_dest_path = os.path.join(MODS_DIR, final_mod_name)
+    def _register_installed_mod(self, final_mod_name, mod_gamebanana_info, saved_image_path):
+        mod_entry = self.config["mods"].setdefault(final_mod_name, {"active": False, "deployed_paths": [], "gamebanana_info": None})
+        mod_entry["installed_at"] = time.time()
 
-            if final_mod_name in self.config["mods"]:
-                if QMessageBox.question(self, t("dialog_mod_exists_title"), t("dialog_mod_exists_text").format(mod_name=final_mod_name), QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No) == QMessageBox.StandardButton.Yes:
-                    self.update_worker_signals.update_status_bar.emit(t("status_replacing_mod").format(mod_name=final_mod_name), 3000)
-                    self._delete_mod_files_and_paths(final_mod_name, keep_config_entry=True)
-                else:
-                    self.update_worker_signals.update_status_bar.emit(t("status_replace_cancelled").format(mod_name=final_mod_name), 3000)
-                    return
-            
-            if source_to_move == temp_extract_path: os.rename(temp_extract_path, final_dest_path)
-            else:
-                shutil.move(source_to_move, final_dest_path)
-                if os.path.exists(temp_extract_path): shutil.rmtree(temp_extract_path)
+        if saved_image_path:
+            mod_entry["manual_image_path"] = saved_image_path
 
-            saved_image_path = None
-            if manual_image_path and os.path.exists(manual_image_path):
-                try:
-                    image_filename = f"{final_mod_name}{os.path.splitext(manual_image_path)[1]}"
-                    dest_image_path = os.path.join(MOD_IMAGES_DIR, image_filename)
-                    shutil.copy(manual_image_path, dest_image_path)
-                    saved_image_path = dest_image_path
-                except Exception as e:
-                    print(f"Error al copiar la imagen manual: {e}")
-
-            mod_entry = self.config["mods"].setdefault(final_mod_name, {"active": False, "deployed_paths": [], "gamebanana_info": None})
-
-            if saved_image_path:
-                mod_entry["manual_image_path"] = saved_image_path
-
-            mod_entry["active"] = mod_entry.get("active", False)
-            if mod_gamebanana_info:
-                mod_entry["gamebanana_info"] = mod_gamebanana_info
-                mod_entry["gamebanana_info"]["update_available"] = False
-            
-            current_profile_name = self.config.get("current_profile")
-            if self.config.get("mod_management_mode") == "profiles" and current_profile_name:
-                if current_profile_name in self.config["profiles"]:
-                    self.config["profiles"][current_profile_name][final_mod_name] = {"active": True}
-                    self.save_config()
-                    self.update_mod_list()
+        mod_entry["active"] = mod_entry.get("active", False)
+        if mod_gamebanana_info:
+            mod_entry["gamebanana_info"] = mod_gamebanana_info
+            mod_entry["gamebanana_info"]["update_available"] = False
 
-            self.save_config()
-            self.update_worker_signals.update_status_bar.emit(t("status_mod_installed_success").format(mod_name=final_mod_name), 5000)
-            if is_download: 
-                self.update_worker_signals.show_message_box.emit(
-                    t("download_complete_title"),
-                    t("download_complete_text").format(mod_name=final_mod_name),
-                    QMessageBox.Icon.Information.value
-                )
+        current_profile_name = self.config.get("current_profile")
+        if self.config.get("mod_management_mode") == "profiles" and current_profile_name:
+            if current_profile_name in self.config["profiles"]:
+                self.config["profiles"][current_profile_name][final_mod_name] = {"active": True}
 
-        except Exception as e:
-            self.update_worker_signals.show_message_box.emit(t("dialog_install_error_title"), t("dialog_generic_install_error_text").format(mod_name=clean_mod_name, error=e), QMessageBox.Icon.Critical.value)
-        
-        finally:
-            subprocess.Popen = _original_popen
-            
-            if os.path.exists(temp_extract_path): shutil.rmtree(temp_extract_path, ignore_errors=True)
-            if is_download and os.path.exists(file_path): os.remove(file_path)
-            self.sync_mods_folder()
+        self.save_config()
+        self._index_mod(final_mod_name)
+        self.update_mod_list()
+        self.schedule_disk_usage_scan()
+
+    def _activate_installed_mod(self, final_mod_name):
+        if self.config["mods"].get(final_mod_name, {}).get("active", False):
+            return
+        self._apply_mod_state(final_mod_name, True)
+
+    def _on_install_finished(self, installer, final_mod_name, on_done):
+        t = self.translator.get
+        self.statusBar().showMessage(t("status_mod_installed_success").format(mod_name=final_mod_name), 5000)
+        if installer.is_download:
+            self._show_message_box_slot(t("download_complete_title"), t("download_complete_text").format(mod_name=final_mod_name), QMessageBox.Icon.Information.value)
+        self._release_installer(installer, final_mod_name, "installed", on_done)
 
+    def _on_install_cancelled(self, installer, final_mod_name, on_done):
+        self.statusBar().showMessage(self.translator.get("status_replace_cancelled").format(mod_name=final_mod_name), 3000)
+        self._release_installer(installer, final_mod_name, "cancelled", on_done)
+
+    def _on_install_error(self, installer, mod_name, error, on_done):
+        t = self.translator.get
+        self._show_message_box_slot(t("dialog_install_error_title"), t("dialog_generic_install_error_text").format(mod_name=mod_name, error=error), QMessageBox.Icon.Critical.value)
+        self._release_installer(installer, mod_name, "failed", on_done)
+
+    def _release_installer(self, installer, mod_name, outcome, on_done):
+        self.active_installers.discard(installer)
+        self.sync_mods_folder()
+        if on_done:
+            on_done(mod_name, outcome)
 
     def eventFilter(self, obj, event):
         if obj is self.modding_power_button:
@@ -1222,16 +1698,13 @@ class ZeroManager(QMainWindow):
                 else: found_mod_paths.extend(self._find_actual_mod_folders(path))
         return found_mod_paths
 
-    def toggle_mod(self, mod_name, checked, button, indicator):
+    def toggle_mod(self, mod_name, checked):
         if self.is_applying_profile or self.config.get("mod_management_mode") != "profiles":
             return
         
         t = self.translator.get
         if not self.game_path_is_valid or not self.modding_power_button.isChecked():
             QMessageBox.warning(self, t("dialog_modding_deactivated_title"), t("dialog_modding_deactivated_text"))
-            button.blockSignals(True)
-            button.setChecked(not checked)
-            button.blockSignals(False)
             return
 
         current_profile = self.config["current_profile"]
@@ -1239,9 +1712,9 @@ class ZeroManager(QMainWindow):
             self.config["profiles"][current_profile][mod_name]["active"] = checked
             self.save_config()
 
-        self._apply_mod_state(mod_name, checked, button, indicator)
+        self._apply_mod_state(mod_name, checked)
 
-    def _apply_mod_state(self, mod_name, checked, button, indicator, base_path=None):
+    def _apply_mod_state(self, mod_name, checked, base_path=None):
         t = self.translator.get
         if base_path is None:
             base_path = MODS_DIR
@@ -1322,9 +1795,9 @@ class ZeroManager(QMainWindow):
                 self.config["mods"][mod_name]["active"] = checked
                 self.config["mods"][mod_name]["deployed_paths"] = mod_data["deployed_paths"]
                 self.save_config()
-                if button: button.setText(t("btn_deactivate") if checked else t("btn_activate"))
-                if indicator: indicator.set_status(checked)
+                self.mod_list_model.set_active(mod_name, checked)
                 self.update_mod_details_ui_signal.emit(mod_name)
+            self.schedule_disk_usage_scan()
         except Exception as e:
             QMessageBox.critical(self, t("dialog_manage_mod_error_title"), t("dialog_manage_mod_error_text").format(mod_name=mod_name, error=e))
             if mod_name in self.config["mods"]:
@@ -1336,7 +1809,9 @@ class ZeroManager(QMainWindow):
         if not os.path.exists(MODS_DIR): os.makedirs(MODS_DIR)
         mods_in_app_folder = {d for d in os.listdir(MODS_DIR) if os.path.isdir(os.path.join(MODS_DIR, d))}
         mods_in_config = set(self.config['mods'].keys())
-        for mod_name in mods_in_app_folder - mods_in_config: self.config['mods'][mod_name] = {"active": False, "deployed_paths": [], "gamebanana_info": None}
+        for mod_name in mods_in_app_folder - mods_in_config:
+            self.config['mods'][mod_name] = {"active": False, "deployed_paths": [], "gamebanana_info": None,
+                                             "installed_at": os.path.getmtime(os.path.join(MODS_DIR, mod_name))}
         for mod_name in mods_in_config - mods_in_app_folder:
             for profile in self.config["profiles"]:
                 if mod_name in self.config["profiles"][profile]:
@@ -1344,7 +1819,8 @@ class ZeroManager(QMainWindow):
             if mod_name in self.config['mods']: del self.config['mods'][mod_name]
         self.save_config()
         self.update_mod_list()
-        if self.mod_list.currentItem() is None: self._clear_mod_details_ui()
+        self.schedule_disk_usage_scan()
+        if not self.mod_list.currentIndex().isValid(): self._clear_mod_details_ui()
 
     def update_ui_state(self):
         is_modding_enabled = self.game_path_is_valid and self.modding_power_button.isChecked()
@@ -1355,11 +1831,7 @@ class ZeroManager(QMainWindow):
         self.update_mods_button.setEnabled(self.game_path_is_valid)
         self.add_profile_button.setEnabled(self.game_path_is_valid and is_profile_mode)
         self.edit_profile_button.setEnabled(self.game_path_is_valid and is_profile_mode)
-        for i in range(self.mod_list.count()):
-            widget = self.mod_list.itemWidget(self.mod_list.item(i))
-            if isinstance(widget, QWidget) and hasattr(widget, 'findChild'):
-                toggle_button = widget.findChild(QPushButton, "ToggleButton")
-                if toggle_button: toggle_button.setEnabled(is_modding_enabled and is_profile_mode)
+        self.mod_list_model.set_toggles_enabled(is_modding_enabled and is_profile_mode)
 
     def initialize_game_path(self):
         t = self.translator.get
@@ -1435,8 +1907,6 @@ class ZeroManager(QMainWindow):
         return False
 
     def update_mod_list(self):
-        self.mod_list.clear()
-        
         current_profile = self.config.get("current_profile", "Default")
         
         if current_profile not in self.config["profiles"]:
@@ -1446,63 +1916,97 @@ class ZeroManager(QMainWindow):
             self.load_profiles()
         
         mods_in_profile_data = self.config["profiles"].get(current_profile, {})
-        
-        sorted_mod_names = sorted(mods_in_profile_data.keys())
+        self._sync_local_mod_index()
+        active_by_name = {mod_name: mod_data.get("active", False) for mod_name, mod_data in mods_in_profile_data.items()}
+        mod_names = self.local_mod_index.query(active_by_name, self.mod_search_bar.text(), self.mod_status_filter.currentData(),
+                                               self.mod_type_filter.currentData(), self.mod_updates_filter.isChecked(),
+                                               self.mod_sort_combo.currentData())
+        mod_rows = [{"name": mod_name, "display_name": self.local_mod_index.entries[mod_name]["display_name"],
+                     "active": active_by_name[mod_name]} for mod_name in mod_names]
+
+        if any(mod_name in self.local_mod_index.entries for mod_name in active_by_name): message_key = "misc_no_mods_match_filter"
+        else: message_key = "misc_no_mods_installed" if current_profile == "Default" else "misc_no_mods_in_profile"
+        self.mod_list.set_empty_text(self.translator.get(message_key))
+        self.mod_list_model.set_mods(mod_rows)
+        self.update_ui_state()
 
-        if not sorted_mod_names:
-            item = QListWidgetItem(self.mod_list)
-            
-            message_key = "misc_no_mods_installed" if current_profile == "Default" else "misc_no_mods_in_profile"
-            label = QLabel(self.translator.get(message_key))
+    def _sync_local_mod_index(self):
+        indexed = self.local_mod_index.entries.keys()
+        for mod_name in [mod_name for mod_name in indexed if mod_name not in self.config["mods"]]:
+            self.local_mod_index.remove(mod_name)
+        for mod_name in [mod_name for mod_name in self.config["mods"] if mod_name not in indexed]:
+            self._index_mod(mod_name)
 
-            label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            label.setStyleSheet("padding: 40px; color: #a090c0; font-style: italic; background: transparent;")
-            item.setSizeHint(label.sizeHint())
-            self.mod_list.addItem(item)
-            self.mod_list.setItemWidget(item, label)
-        else:
-            for mod_name in sorted_mod_names:
-                mod_profile_info = mods_in_profile_data[mod_name]
-                is_active = mod_profile_info.get("active", False)
-                
-                item = QListWidgetItem(self.mod_list)
-                item.setData(Qt.ItemDataRole.UserRole, mod_name)
-                widget = self.create_mod_widget(mod_name, is_active)
-                item.setSizeHint(widget.sizeHint())
-                self.mod_list.addItem(item)
-                self.mod_list.setItemWidget(item, widget)
-        
-        self.update_ui_state()
+    def _index_mod(self, mod_name):
+        mod_data = self.config["mods"].get(mod_name)
+        if mod_data is None: return
+        mod_path = os.path.join(MODS_DIR, mod_name)
+        try: mod_types = {self._determine_mod_type(path) for path in self._find_actual_mod_folders(mod_path)}
+        except OSError: mod_types = set()
+        if "installed_at" not in mod_data and os.path.isdir(mod_path): mod_data["installed_at"] = os.path.getmtime(mod_path)
+        gb_info = mod_data.get("gamebanana_info") or {}
+        author = (gb_info.get('_aSubmitter') or {}).get('_sName') or gb_info.get('author_name') or ""
+        self.local_mod_index.update(mod_name, self._mod_display_name(mod_name), author, mod_types, mod_data.get("installed_at"),
+                                    gb_info.get('_tsDateModified'), gb_info.get('update_available', False),
+                                    (self._mod_disk_usage(mod_name) or {}).get("size"))
+
+    def _mod_disk_usage(self, mod_name):
+        return self.disk_usage["items"]["mods"].get(mod_name)
+
+    def schedule_disk_usage_scan(self):
+        self.disk_usage_timer.start()
+
+    def _disk_usage_roots(self):
+        roots = {"mods": [MODS_DIR], "modpacks": [MODPACKS_LIBRARY_DIR], "downloads": [DOWNLOADS_DIR],
+                 "backup": [ACTIVE_MODS_BACKUP_DIR], "deployed": []}
+        game_path = self.config.get("game_path")
+        if game_path and self.game_path_is_valid:
+            roots["deployed"] = [os.path.join(game_path, "SparkingZERO", "Content", "Paks", "~mods"),
+                                 os.path.join(game_path, "SparkingZERO", "Mods")]
+        return roots
+
+    def _start_disk_usage_scan(self):
+        if self.disk_usage_scan_running:
+            self.disk_usage_scan_pending = True
+            return
+        self.disk_usage_scan_running = True
+        threading.Thread(target=self._run_disk_usage_scan, args=(self._disk_usage_roots(),), daemon=True).start()
 
-    def create_mod_widget(self, mod_name, is_active):
-        widget = QWidget()
-        widget.setMinimumHeight(55)
-        layout = QHBoxLayout(widget)
-        layout.setContentsMargins(15, 10, 15, 10)
-        layout.setSpacing(15)
-        status_indicator = ModStatusIndicator(is_active)
-        layout.addWidget(status_indicator)
-        display_name = mod_name
+    def _run_disk_usage_scan(self, roots):
+        try:
+            result = self.disk_usage_scanner.scan(roots, itemized=("mods", "modpacks"))
+        except Exception as e:
+            print(f"Error calculando el uso de disco: {e}")
+            result = None
+        self.disk_usage_signals.scan_finished.emit(result)
+
+    def _on_disk_usage_scanned(self, result):
+        self.disk_usage_scan_running = False
+        if self.disk_usage_scan_pending:
+            self.disk_usage_scan_pending = False
+            self._start_disk_usage_scan()
+        if result is None: return
+        self.disk_usage = result
+        for mod_name, usage in result["items"]["mods"].items():
+            self.local_mod_index.set_size(mod_name, usage["size"])
+        if self.mod_sort_combo.currentData() == "size": self.update_mod_list()
+        self._update_mod_details_size()
+        if self.storage_dialog is not None: self.storage_dialog.set_usage(result)
+
+    def show_storage_summary(self):
+        display_names = {mod_name: self._mod_display_name(mod_name) for mod_name in self.config["mods"]}
+        self.storage_dialog = StorageSummaryDialog(self.translator, display_names, self)
+        self.storage_dialog.set_usage(self.disk_usage)
+        self._start_disk_usage_scan()
+        self.storage_dialog.exec()
+        self.storage_dialog = None
+
+    def _mod_display_name(self, mod_name):
         mod_data = self.config["mods"].get(mod_name)
         if mod_data and mod_data.get("gamebanana_info"):
             gb_name = mod_data["gamebanana_info"].get('_sName')
-            if gb_name: display_name = gb_name
-        label = ElidedLabel(display_name, self)
-        label.setObjectName("ModLabel")
-        layout.addWidget(label, 1)
-        toggle_button = QPushButton(self.translator.get("btn_deactivate") if is_active else self.translator.get("btn_activate"))
-        toggle_button.setObjectName("ToggleButton")
-        toggle_button.setCheckable(True)
-        toggle_button.setChecked(is_active)
-        toggle_button.setMinimumWidth(90)
-        toggle_button.toggled.connect(lambda chk, n=mod_name, b=toggle_button, i=status_indicator: self.toggle_mod(n, chk, b, i))
-        layout.addWidget(toggle_button)
-        delete_button = QPushButton(self.translator.get("btn_delete"))
-        delete_button.setObjectName("DeleteButton")
-        delete_button.setMinimumWidth(80)
-        delete_button.clicked.connect(lambda _, n=mod_name: self.delete_mod(n))
-        layout.addWidget(delete_button)
-        return widget
+            if gb_name: return gb_name
+        return mod_name
 
     def delete_mod(self, mod_name):
         t = self.translator.get
@@ -1527,7 +2031,7 @@ class ZeroManager(QMainWindow):
     def _delete_mod_files_and_paths(self, mod_name, keep_config_entry=False):
         mod_data = self.config["mods"].get(mod_name, {})
         if mod_data.get("active"):
-            self._apply_mod_state(mod_name, False, None, None)
+            self._apply_mod_state(mod_name, False)
 
         manual_image_path = mod_data.get("manual_image_path")
         if manual_image_path and os.path.exists(manual_image_path):
@@ -1574,7 +2078,7 @@ class ZeroManager(QMainWindow):
         for mod_name in mods_in_profile.keys():
             self.config["profiles"][current_profile][mod_name]["active"] = activate
             if self.config["mods"][mod_name].get("active", False) != activate:
-                self._apply_mod_state(mod_name, activate, None, None)
+                self._apply_mod_state(mod_name, activate)
 
         self.save_config()
         self.is_applying_profile = False
@@ -1594,11 +2098,15 @@ class ZeroManager(QMainWindow):
         self.mod_details_image_label.setText(t("details_no_image"))
         self.mod_details_date_label.setText("")
         self.mod_details_url_label.setText("")
+        self.mod_details_size_label.setText("")
         self.mod_details_update_status_label.setText("")
         self.update_single_mod_button.hide()
         try: self.update_single_mod_button.clicked.disconnect()
         except TypeError: pass
         self.current_mod_for_update = None
+        if self._details_image_request is not None:
+            image_loader.cancel(self._details_image_request)
+        self._details_image_url = self._details_image_request = None
 
     def change_manual_mod_image(self):
         t = self.translator.get
@@ -1624,7 +2132,7 @@ class ZeroManager(QMainWindow):
                 self.config["mods"][mod_name]["manual_image_path"] = dest_image_path
                 self.save_config()
                 
-                self.display_mod_details(self.mod_list.currentItem(), None)
+                self.display_mod_details(self.mod_list.currentIndex(), None)
             except Exception as e:
                 QMessageBox.critical(self, "Error", f"No se pudo guardar la imagen: {e}")
     
@@ -1642,14 +2150,15 @@ class ZeroManager(QMainWindow):
         
         self.mod_details_image_label.setCursor(Qt.CursorShape.ArrowCursor)
 
-        if current_item is None or current_item.data(Qt.ItemDataRole.UserRole) is None:
+        if current_item is None or current_item.data(HOME_MOD_NAME_ROLE) is None:
             return
-        mod_name = current_item.data(Qt.ItemDataRole.UserRole)
+        mod_name = current_item.data(HOME_MOD_NAME_ROLE)
         mod_data = self.config["mods"].get(mod_name)
         if not mod_data:
             return
 
         self.current_mod_for_update = mod_name
+        self._update_mod_details_size()
         
         gamebanana_info = mod_data.get("gamebanana_info")
         
@@ -1660,16 +2169,7 @@ class ZeroManager(QMainWindow):
 
         image_url = None
         if gamebanana_info:
-            if gamebanana_info.get('_aPreviewMedia', {}).get('_aImages'):
-                images = gamebanana_info['_aPreviewMedia']['_aImages']
-                if images:
-                    base_url = images[0].get('_sBaseUrl', '')
-                    file_530 = images[0].get('_sFile530', '')
-                    if base_url and file_530:
-                        image_url = f"{base_url}/{file_530}"
-            
-            if not image_url:
-                image_url = gamebanana_info.get('image_url')
+            image_url = preview_image_url(gamebanana_info, DETAILS_IMAGE_SIZE) or gamebanana_info.get('image_url')
 
         author_name = t("details_unknown_author")
         if gamebanana_info:
@@ -1681,14 +2181,21 @@ class ZeroManager(QMainWindow):
         
         self.mod_details_author_label.setText(t("details_author_prefix").format(author=author_name))
 
-        if image_url:
+        cached_pixmap = pixmap_cache.get(image_url, self.mod_details_image_label.size()) if image_url else None
+        if cached_pixmap is not None:
+            self._details_image_url = image_url
+            self.mod_details_image_label.setPixmap(cached_pixmap)
+        elif image_url:
             self.mod_details_image_label.setText(t("details_loading_image"))
-            threading.Thread(target=self._fetch_image_for_details, args=(self.mod_details_image_label, image_url), daemon=True).start()
+            self._details_image_url = image_url
+            label, label_size, ratio = self.mod_details_image_label, self.mod_details_image_label.size(), device_pixel_ratio()
+            self._details_image_request = image_loader.load(
+                image_url, lambda image: self._on_details_image_data(label, label_size, ratio, image_url, image), IMAGE_PRIORITY_SELECTED,
+                device_size(DETAILS_IMAGE_SIZE, ratio))
         else:
             manual_image_path = mod_data.get("manual_image_path")
             if manual_image_path and os.path.exists(manual_image_path):
-                pixmap = QPixmap(manual_image_path)
-                self._set_detail_image(self.mod_details_image_label, pixmap)
+                self._set_detail_image(self.mod_details_image_label, lambda: QPixmap(manual_image_path), file_source(manual_image_path))
             else:
                 self.mod_details_image_label.setText(t("details_click_to_add_image") if not gamebanana_info else t("details_no_image"))
                 if not gamebanana_info:
@@ -1715,7 +2222,10 @@ class ZeroManager(QMainWindow):
                 self.update_single_mod_button.clicked.connect(lambda: self.update_mod_action(mod_name))
                 self.update_single_mod_button.setEnabled(self.update_mods_button.isEnabled())
             else:
-                self.mod_details_update_status_label.setText(t("details_mod_is_up_to_date"))
+                up_to_date_text = t("details_mod_is_up_to_date")
+                if gamebanana_info.get("last_checked"):
+                    up_to_date_text += " " + t("details_last_checked").format(when=format_timestamp(gamebanana_info["last_checked"], self.translator))
+                self.mod_details_update_status_label.setText(up_to_date_text)
                 self.update_single_mod_button.hide()
         else:
             self.mod_details_author_label.setText(t("details_no_gb_data"))
@@ -1724,18 +2234,33 @@ class ZeroManager(QMainWindow):
             self.mod_details_update_status_label.setText(t("details_cannot_check_updates"))
             self.update_single_mod_button.hide()
 
-    def _fetch_image_for_details(self, image_label, url):
-        try:
-            response = requests.get(url, timeout=10)
-            response.raise_for_status()
-            pixmap = QPixmap()
-            pixmap.loadFromData(response.content)
-            self.image_loader_signals.image_loaded.emit(image_label, pixmap)
-        except Exception: self.image_loader_signals.image_error.emit(image_label)
+    def _on_details_image_data(self, image_label, label_size, ratio, url, image):
+        if image is None:
+            self.image_loader_signals.image_error.emit(image_label, url)
+        else:
+            image = image.scaled(label_size * ratio, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
+            image.setDevicePixelRatio(ratio)
+            self.image_loader_signals.image_loaded.emit(image_label, image, url)
+
+    def _on_details_image_loaded(self, image_label, image, url):
+        if url == self._details_image_url:
+            pixmap = QPixmap.fromImage(image)
+            pixmap_cache.put(url, image_label.size(), pixmap)
+            image_label.setPixmap(pixmap)
+
+    def _on_details_image_error(self, image_label, url):
+        if url == self._details_image_url:
+            self._set_detail_image_error(image_label)
+
+    def _update_mod_details_size(self):
+        t = self.translator.get
+        if not self.current_mod_for_update: return
+        usage = self._mod_disk_usage(self.current_mod_for_update)
+        value = t("details_size_value").format(size=format_size(usage["size"]), files=usage["files"]) if usage else t("details_size_calculating")
+        self.mod_details_size_label.setText(f"<b>{t('details_size_label')}:</b> {value}")
 
-    def _set_detail_image(self, image_label, pixmap):
-        scaled_pixmap = pixmap.scaled(image_label.size(), Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
-        image_label.setPixmap(scaled_pixmap)
+    def _set_detail_image(self, image_label, load_pixmap, source):
+        image_label.setPixmap(pixmap_cache.scaled(source, image_label.size(), load_pixmap, device_pixel_ratio()))
 
     def _set_detail_image_error(self, image_label):
         image_label.setPixmap(QPixmap())
@@ -1753,58 +2278,115 @@ class ZeroManager(QMainWindow):
         self.update_worker_signals.update_status_bar.emit(t("status_checking_for_updates"), 0)
         self.update_worker_signals.set_cursor.emit(Qt.CursorShape.WaitCursor)
         self.update_worker_signals.enable_main_update_button.emit(False)
-        threading.Thread(target=self._run_update_check_thread, args=(gb_mods_to_check,), daemon=True).start()
-
-    def _run_update_check_thread(self, gb_mods_to_check):
+        self.cancel_update_check_button.setEnabled(True)
+        self.cancel_update_check_button.show()
+        self._start_update_check(gb_mods_to_check, quiet=False)
+
+    def run_scheduled_update_check(self):
+        if self.update_check_cancel_event or not self.game_path_is_valid: return
+        now = time.time()
+        stale_mods = {}
+        for name, data in self.config["mods"].items():
+            gb_info = data.get("gamebanana_info")
+            if gb_info and gb_info.get('_idRow') and now - gb_info.get("last_checked", 0) >= self._update_check_staleness(gb_info, now):
+                stale_mods[name] = data
+        if stale_mods:
+            print(f"Comprobación programada de actualizaciones: {len(stale_mods)} mods pendientes.")
+            self._start_update_check(stale_mods, quiet=True)
+
+    def _update_check_staleness(self, gb_info, now):
+        days_since_update = (now - gb_info.get('_tsDateModified', 0)) / 86400
+        if days_since_update < 7: staleness = RECENT_UPDATE_STALENESS
+        elif days_since_update < 30: staleness = ACTIVE_MOD_STALENESS
+        else: staleness = DEFAULT_STALENESS
+        if gb_info.get('likes', gb_info.get('_nLikeCount', 0)) >= POPULAR_MOD_LIKES:
+            staleness //= 2
+        return staleness
+
+    def _start_update_check(self, mods_to_check, quiet):
+        if self.update_check_cancel_event: self.update_check_cancel_event.set()
+        self.update_check_cancel_event = threading.Event()
+        threading.Thread(target=self._run_update_check_thread, args=(mods_to_check, self.update_check_cancel_event, quiet), daemon=True).start()
+
+    def cancel_mod_update_check(self):
+        if self.update_check_cancel_event:
+            self.update_check_cancel_event.set()
+            self.cancel_update_check_button.setEnabled(False)
+            self.statusBar().showMessage(self.translator.get("status_update_check_cancelling"))
+
+    def _run_update_check_thread(self, gb_mods_to_check, cancel_event, quiet=False):
         t = self.translator.get
         updated_mods_count = 0
         total_mods = len(gb_mods_to_check)
+        cancel_token = CancelToken()
+        pool = ThreadPoolExecutor(max_workers=UPDATE_CHECK_WORKERS)
         try:
-            for i, (mod_name, mod_data) in enumerate(gb_mods_to_check.items()):
-                self.update_worker_signals.update_status_bar.emit(t("status_checking_mod_progress").format(mod_name=mod_name, current=i+1, total=total_mods), 0)
-                try:
-                    if self._check_single_mod_for_update(mod_name, mod_data): updated_mods_count += 1
-                except Exception as e: print(f"Error al verificar actualización para {mod_name}: {e}")
-                self.mod_update_ui_signals.update_mod_details_status.emit(mod_name)
+            futures = {pool.submit(self._fetch_latest_mod_record, mod_data["gamebanana_info"], cancel_token): mod_name
+                       for mod_name, mod_data in gb_mods_to_check.items()}
+            pending, completed = set(futures), 0
+            while pending and not cancel_event.is_set():
+                done, pending = wait(pending, timeout=UPDATE_CHECK_CANCEL_POLL, return_when=FIRST_COMPLETED)
+                for future in done:
+                    if cancel_event.is_set(): break
+                    completed += 1
+                    mod_name = futures[future]
+                    try:
+                        latest_mod_record = future.result()
+                    except Exception as e:
+                        print(f"Error al verificar actualización para {mod_name}: {e}")
+                        latest_mod_record = None
+                    current_ts_modified = gb_mods_to_check[mod_name]["gamebanana_info"].get('_tsDateModified', 0)
+                    has_update = bool(latest_mod_record) and latest_mod_record.get('_tsDateModified', 0) > current_ts_modified
+                    if has_update: updated_mods_count += 1
+                    self.update_worker_signals.mod_update_checked.emit(mod_name, latest_mod_record, has_update)
+                    if not quiet:
+                        self.update_worker_signals.update_status_bar.emit(t("status_checking_mod_progress").format(mod_name=mod_name, current=completed, total=total_mods), 0)
+        finally:
+            cancel_token.cancel()
+            pool.shutdown(wait=False, cancel_futures=True)
+            self.update_worker_signals.update_check_finished.emit(updated_mods_count, quiet, cancel_event)
+
+    def _fetch_latest_mod_record(self, gb_info, cancel_token=None):
+        return api_client.mod_profile(gb_info['_idRow'], properties=UPDATE_CHECK_PROPERTIES, max_age=UPDATE_CHECK_MAX_AGE,
+                                      cancel_token=cancel_token)
+
+    def _apply_mod_update_result(self, mod_name, latest_mod_record, has_update):
+        gb_info = self.config["mods"].get(mod_name, {}).get("gamebanana_info")
+        if not gb_info or not latest_mod_record: return
+        gb_info['update_available'] = has_update
+        gb_info['last_checked'] = time.time()
+        if '_nLikeCount' in latest_mod_record: gb_info['likes'] = latest_mod_record['_nLikeCount']
+        if has_update:
+            current_info = {k: v for k, v in gb_info.items() if k not in ("update_available", "latest_full_info")}
+            gb_info['latest_full_info'] = {**current_info, **latest_mod_record}
+        self.local_mod_index.set_update_available(mod_name, has_update)
+        if self.mod_updates_filter.isChecked(): self.update_mod_list()
+        self._update_mod_details_ui_slot(mod_name)
+
+    def _on_update_check_finished(self, updated_mods_count, quiet, cancel_event):
+        t = self.translator.get
+        self.save_config()
+        if cancel_event is not self.update_check_cancel_event: return
+        self.update_check_cancel_event = None
+        if quiet:
             if updated_mods_count > 0:
                 self.update_worker_signals.update_status_bar.emit(t("status_updates_found").format(count=updated_mods_count), 5000)
-                self.update_worker_signals.show_message_box.emit(t("dialog_updates_title"), t("dialog_updates_found_text").format(count=updated_mods_count), QMessageBox.Icon.Information.value)
-            else:
-                self.update_worker_signals.update_status_bar.emit(t("status_all_mods_up_to_date"), 5000)
-                self.update_worker_signals.show_message_box.emit(t("dialog_updates_title"), t("dialog_all_mods_up_to_date_text"), QMessageBox.Icon.Information.value)
-        finally: self.update_worker_signals.update_process_finished.emit("")
-
-    def _check_single_mod_for_update(self, mod_name, mod_data):
-        gb_info = mod_data.get("gamebanana_info")
-        if not gb_info or not gb_info.get('_idRow') or not gb_info.get('_sName'): return False
-        mod_id, mod_s_name, current_ts_modified = gb_info['_idRow'], gb_info['_sName'], gb_info.get('_tsDateModified', 0)
-        try:
-            api_url = f"https://gamebanana.com/apiv11/Game/{SPARKING_ZERO_STEAM_APPID}/Subfeed"
-            params = {'_nPage': 1, '_sSort': 'new', '_sName': mod_s_name}
-            response = requests.get(api_url, params=params, timeout=15)
-            response.raise_for_status()
-            data = response.json()
-            records = data.get('_aRecords', [])
-            latest_mod_record = next((r for r in records if r.get('_idRow') == mod_id), None)
-            if latest_mod_record:
-                latest_ts_modified = latest_mod_record.get('_tsDateModified', 0)
-                if latest_ts_modified > current_ts_modified:
-                    gb_info['latest_full_info'] = latest_mod_record
-                    gb_info['update_available'] = True
-                    self.save_config()
-                    return True
-            gb_info['update_available'] = False
-            self.save_config()
-        except Exception as e:
-            print(f"Error al verificar actualización para {mod_name}: {e}")
-            gb_info['update_available'] = False
-            self.save_config()
-        return False
+            return
+        self.cancel_update_check_button.hide()
+        if cancel_event.is_set():
+            self.update_worker_signals.update_status_bar.emit(t("status_update_check_cancelled").format(count=updated_mods_count), 5000)
+        elif updated_mods_count > 0:
+            self.update_worker_signals.update_status_bar.emit(t("status_updates_found").format(count=updated_mods_count), 5000)
+            self.update_worker_signals.show_message_box.emit(t("dialog_updates_title"), t("dialog_updates_found_text").format(count=updated_mods_count), QMessageBox.Icon.Information.value)
+        else:
+            self.update_worker_signals.update_status_bar.emit(t("status_all_mods_up_to_date"), 5000)
+            self.update_worker_signals.show_message_box.emit(t("dialog_updates_title"), t("dialog_all_mods_up_to_date_text"), QMessageBox.Icon.Information.value)
+        self.update_worker_signals.update_process_finished.emit("")
 
     def _update_mod_details_ui_slot(self, mod_name_to_update):
-        current_selected_item = self.mod_list.currentItem()
-        if current_selected_item and current_selected_item.data(Qt.ItemDataRole.UserRole) == mod_name_to_update:
-            self.display_mod_details(current_selected_item, None)
+        current_index = self.mod_list.currentIndex()
+        if current_index.isValid() and current_index.data(HOME_MOD_NAME_ROLE) == mod_name_to_update:
+            self.display_mod_details(current_index, None)
 
     def update_mod_action(self, mod_name):
         t = self.translator.get
@@ -1829,18 +2411,15 @@ class ZeroManager(QMainWindow):
     def _fetch_update_files_and_install_thread(self, mod_id, mod_name_download, latest_full_info, original_mod_name):
         t = self.translator.get
         try:
-            api_url = f"https://gamebanana.com/apiv11/Mod/{mod_id}/Files"
-            response = requests.get(api_url, timeout=15)
-            response.raise_for_status()
-            files_data = response.json()
+            files_data = api_client.mod_files(mod_id)
             if not files_data: raise ValueError(t("error_no_files_found_for_update"))
             selected_file_info = files_data[0] if len(files_data) == 1 else self.select_file_for_download(files_data)
             if selected_file_info:
-                from download_tab import Downloader
-                downloader = Downloader(selected_file_info['_sDownloadUrl'], selected_file_info['_sFile'], mod_name_download, latest_full_info)
-                downloader.finished.connect(self._on_update_download_finished)
-                downloader.error.connect(lambda msg: self._on_update_download_error_with_mod_name(msg, original_mod_name))
-                downloader.run()
+                self.main_thread_invoker.call(lambda: self.download_tab.download_manager.submit(
+                    selected_file_info['_sDownloadUrl'], selected_file_info['_sFile'], mod_name_download, latest_full_info,
+                    expected_md5=selected_file_info.get('_sMd5Checksum'),
+                    on_finished=self._on_update_download_finished,
+                    on_error=lambda msg: self._on_update_download_error_with_mod_name(msg, original_mod_name)))
             else: raise Exception(t("error_could_not_select_file"))
         except Exception as e:
             self.update_worker_signals.show_message_box.emit(t("dialog_update_error_title"), t("dialog_prepare_update_error").format(mod_name=original_mod_name, error=e), QMessageBox.Icon.Critical.value)
@@ -1860,25 +2439,21 @@ class ZeroManager(QMainWindow):
     def _on_update_download_finished(self, file_path, mod_name_downloaded, mod_gamebanana_info):
         t = self.translator.get
         self.update_worker_signals.update_status_bar.emit(t("status_update_download_finished").format(mod_name=mod_name_downloaded), 0)
-        
-        original_mod_data_for_profile = {
-            "gamebanana_info": mod_gamebanana_info,
-            "manual_image_path": None
-        }
+        self.install_mod_from_path(file_path, mod_name_downloaded, is_download=True, mod_gamebanana_info=mod_gamebanana_info,
+                                   on_done=self._on_update_install_done)
 
-        self.install_mod_from_path(file_path, mod_name_downloaded, is_download=True, mod_gamebanana_info=mod_gamebanana_info)
-        
-        mod_data = self.config["mods"].get(mod_name_downloaded)
-        if mod_data and mod_gamebanana_info: 
-            mod_data.update({
-                "gamebanana_info": mod_gamebanana_info,
-                "gamebanana_info": {"update_available": False, "_tsDateModified": mod_gamebanana_info.get("_tsDateModified", 0)}
-            })
-            mod_data.pop("latest_full_info", None)
-            self.save_config()
-        
-        self.update_worker_signals.update_status_bar.emit(t("status_mod_updated_successfully").format(mod_name=mod_name_downloaded), 5000)
-        self.update_worker_signals.update_process_finished.emit(mod_name_downloaded)
+    def _on_update_install_done(self, final_mod_name, outcome):
+        t = self.translator.get
+        if outcome == "installed":
+            mod_data = self.config["mods"].get(final_mod_name)
+            if mod_data and mod_data.get("gamebanana_info"):
+                mod_data["gamebanana_info"]["update_available"] = False
+                mod_data["gamebanana_info"].pop("latest_full_info", None)
+                self.save_config()
+                self.local_mod_index.set_update_available(final_mod_name, False)
+                if self.mod_updates_filter.isChecked(): self.update_mod_list()
+            self.update_worker_signals.update_status_bar.emit(t("status_mod_updated_successfully").format(mod_name=final_mod_name), 5000)
+        self.update_worker_signals.update_process_finished.emit(final_mod_name)
 
     def _on_update_download_error_with_mod_name(self, error_msg, original_mod_name):
         t = self.translator.get
@@ -1981,13 +2556,13 @@ class ZeroManager(QMainWindow):
         for mod_name in currently_active_mods:
             should_be_active = mods_in_profile_data.get(mod_name, {}).get("active", False)
             if not should_be_active:
-                self._apply_mod_state(mod_name, False, None, None)
+                self._apply_mod_state(mod_name, False)
 
         for mod_name, mod_data in mods_in_profile_data.items():
             is_currently_active = self.config["mods"].get(mod_name, {}).get("active", False)
             should_be_active = mod_data.get("active", False)
             if should_be_active and not is_currently_active:
-                self._apply_mod_state(mod_name, True, None, None)
+                self._apply_mod_state(mod_name, True)
 
         self.is_applying_profile = False
         self.update_mod_list()
@@ -1997,7 +2572,7 @@ class ZeroManager(QMainWindow):
         active_mods_found = False
         for mod_name, mod_data in self.config["mods"].items():
             if mod_data.get("active", False):
-                self._apply_mod_state(mod_name, False, None, None)
+                self._apply_mod_state(mod_name, False)
                 active_mods_found = True
         
         if self.config.get("active_modpack"):
@@ -2030,6 +2605,7 @@ class ZeroManager(QMainWindow):
         self.populate_modpack_list()
 
     def populate_modpack_list(self):
+        self.schedule_disk_usage_scan()
         self.modpack_list.clear()
         t = self.translator.get
         modpacks = self.config.get("modpacks", {})
@@ -2054,6 +2630,14 @@ class ZeroManager(QMainWindow):
                 self.modpack_list.setItemWidget(item, widget)
 
 
+    def _create_elided_label(self, text, object_name, width):
+        label = QLabel(self)
+        label.setObjectName(object_name)
+        label.ensurePolished()
+        label.setText(QFontMetrics(label.font()).elidedText(text, Qt.TextElideMode.ElideRight, width))
+        label.setToolTip(text)
+        return label
+
     def create_modpack_widget(self, pack_name, pack_data):
         t = self.translator.get
         widget = QFrame()
@@ -2071,18 +2655,13 @@ class ZeroManager(QMainWindow):
         
         img_path = pack_data.get("image")
         if img_path and os.path.exists(img_path):
-            pixmap = QPixmap(img_path)
-            scaled_pixmap = pixmap.scaled(image_label.size(), Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
-            image_label.setPixmap(scaled_pixmap)
+            image_label.setPixmap(pixmap_cache.scaled(file_source(img_path), image_label.size(), lambda: QPixmap(img_path)))
         else:
             image_label.setText(t("modpack_no_image"))
         
-        name_label = ElidedLabel(pack_name, self)
-        name_label.setObjectName("ModpackNameLabel")
-        
+        name_label = self._create_elided_label(pack_name, "ModpackNameLabel", 215)
         author_text = f"{t('details_author_prefix_simple')} {pack_data.get('author', 'N/A')}"
-        author_label = ElidedLabel(author_text, self)
-        author_label.setObjectName("ModpackAuthorLabel")
+        author_label = self._create_elided_label(author_text, "ModpackAuthorLabel", 215)
 
         button_layout = QHBoxLayout()
         export_button = QPushButton(t("modpack_export"))
@@ -2143,7 +2722,7 @@ class ZeroManager(QMainWindow):
         for mod_info in mods_to_activate:
             mod_folder_name = mod_info['folder_name']
             if os.path.isdir(os.path.join(pack_mods_path, mod_folder_name)):
-                self._apply_mod_state(mod_folder_name, True, None, None, base_path=pack_mods_path)
+                self._apply_mod_state(mod_folder_name, True, base_path=pack_mods_path)
             else:
                 missing_mods.append(mod_info['display_name'])
         
@@ -2319,6 +2898,11 @@ class ZeroManager(QMainWindow):
         finally:
             if os.path.exists(temp_dir): shutil.rmtree(temp_dir)
 
+def log_api_stats():
+    for endpoint, stats in sorted(api_client.latency_stats().items()):
+        print(f"API {endpoint}: {stats['count']} requests, {stats['errors']} errors, {stats['cache_hits']} cache hits, "
+              f"{stats['stale_hits']} stale hits, {stats['not_modified']} not modified, avg {stats['avg_ms']} ms, max {stats['max_ms']} ms")
+
 if __name__ == "__main__":
     app = QApplication(sys.argv)
     app.setWindowIcon(QIcon(resource_path("img/icon.png")))
@@ -2336,6 +2920,7 @@ if __name__ == "__main__":
         socket.close()
         sys.exit(0)
     else:
+        app.aboutToQuit.connect(log_api_stats)
         window = ZeroManager()
         window.local_server = QLocalServer()
         QLocalServer.removeServer(app_guid)
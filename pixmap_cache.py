@@ -0,0 +1,55 @@
+import os
+from collections import OrderedDict
+from PyQt6.QtCore import Qt
+
+PIXMAP_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+
+def file_source(path):
+    try:
+        return (path, os.path.getmtime(path))
+    except OSError:
+        return None
+
+
+def _pixmap_bytes(pixmap):
+    return pixmap.width() * pixmap.height() * max(pixmap.depth(), 8) // 8
+
+
+class ScaledPixmapCache:
+    def __init__(self, max_bytes=PIXMAP_CACHE_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()
+        self.total_bytes = 0
+
+    def get(self, source, size):
+        key = (source, size.width(), size.height())
+        pixmap = self.entries.get(key)
+        if pixmap is not None:
+            self.entries.move_to_end(key)
+        return pixmap
+
+    def put(self, source, size, pixmap):
+        if source is None or pixmap.isNull(): return
+        key = (source, size.width(), size.height())
+        old_pixmap = self.entries.pop(key, None)
+        if old_pixmap is not None:
+            self.total_bytes -= _pixmap_bytes(old_pixmap)
+        self.entries[key] = pixmap
+        self.total_bytes += _pixmap_bytes(pixmap)
+        while self.total_bytes > self.max_bytes and len(self.entries) > 1:
+            _, evicted = self.entries.popitem(last=False)
+            self.total_bytes -= _pixmap_bytes(evicted)
+
+    def scaled(self, source, size, load, device_pixel_ratio=1.0):
+        pixmap = self.get(source, size)
+        if pixmap is None:
+            pixmap = load()
+            if pixmap.isNull(): return pixmap
+            pixmap = pixmap.scaled(size * device_pixel_ratio, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
+            pixmap.setDevicePixelRatio(device_pixel_ratio)
+            self.put(source, size, pixmap)
+        return pixmap
+
+
+pixmap_cache = ScaledPixmapCache()
@@ -0,0 +1,167 @@
+import re
+import bisect
+import threading
+
+TOKEN_PATTERN = re.compile(r'\w+')
+NAME_MATCH_WEIGHT = 2
+LOCAL_MOD_SORTS = {
+    "name": lambda entry: (entry["display_name"].casefold(),),
+    "installed": lambda entry: (-entry["installed_at"], entry["display_name"].casefold()),
+    "size": lambda entry: (-(entry["size"] or 0), entry["display_name"].casefold()),
+    "updated": lambda entry: (-entry["last_updated"], entry["display_name"].casefold()),
+}
+MOD_SEARCH_SORTS = {
+    "new": lambda record: -(record.get('_tsDateAdded') or 0),
+    "updated": lambda record: -(record.get('_tsDateModified') or 0),
+    "default": lambda record: -max(record.get('_tsDateAdded') or 0, record.get('_tsDateModified') or 0),
+    "likes": lambda record: -(record.get('_nLikeCount') or 0),
+    "views": lambda record: -(record.get('_nViewCount') or 0),
+}
+
+
+def tokenize(text):
+    return TOKEN_PATTERN.findall((text or "").lower())
+
+
+def record_category_id(record):
+    category = record.get('_aRootCategory') or {}
+    if category.get('_idRow'):
+        return category['_idRow']
+    match = re.search(r'/cats/(\d+)', category.get('_sProfileUrl', ''))
+    return int(match.group(1)) if match else None
+
+
+class ModSearchIndex:
+    def __init__(self):
+        self.records = {}
+        self.categories = {}
+        self.postings = {}
+        self.name_tokens = {}
+        self.record_tokens = {}
+        self._sorted_tokens = []
+        self._dirty = False
+        self.lock = threading.Lock()
+
+    def add_records(self, records, category_id=None):
+        with self.lock:
+            for record in records:
+                mod_id = record.get('_idRow')
+                if mod_id is None: continue
+                self._remove(mod_id)
+                self.records[mod_id] = record
+                self.categories[mod_id] = category_id or record_category_id(record)
+                name_tokens = set(tokenize(record.get('_sName')))
+                tokens = name_tokens | set(tokenize((record.get('_aSubmitter') or {}).get('_sName')))
+                tokens |= set(tokenize((record.get('_aRootCategory') or {}).get('_sName')))
+                self.name_tokens[mod_id] = name_tokens
+                self.record_tokens[mod_id] = tokens
+                for token in tokens:
+                    if token not in self.postings:
+                        self.postings[token] = set()
+                        self._dirty = True
+                    self.postings[token].add(mod_id)
+
+    def _remove(self, mod_id):
+        for token in self.record_tokens.pop(mod_id, ()):
+            ids = self.postings[token]
+            ids.discard(mod_id)
+            if not ids:
+                del self.postings[token]
+                self._dirty = True
+
+    def _matching_tokens(self, prefix):
+        if self._dirty:
+            self._sorted_tokens = sorted(self.postings)
+            self._dirty = False
+        start = bisect.bisect_left(self._sorted_tokens, prefix)
+        end = bisect.bisect_left(self._sorted_tokens, prefix + '\uffff')
+        return self._sorted_tokens[start:end]
+
+    def search(self, query, category_id=None, include_nsfw=False, sort=None):
+        query_tokens = tokenize(query)
+        if not query_tokens: return []
+        with self.lock:
+            candidates = None
+            scores = {}
+            for query_token in query_tokens:
+                best = {}
+                for token in self._matching_tokens(query_token):
+                    exact = token == query_token
+                    for mod_id in self.postings[token]:
+                        in_name = token in self.name_tokens[mod_id]
+                        score = (1 + exact) * (NAME_MATCH_WEIGHT if in_name else 1)
+                        if score > best.get(mod_id, 0):
+                            best[mod_id] = score
+                for mod_id, score in best.items():
+                    scores[mod_id] = scores.get(mod_id, 0) + score
+                candidates = set(best) if candidates is None else candidates & best.keys()
+                if not candidates: return []
+
+            results = [self.records[mod_id] for mod_id in candidates
+                       if (category_id is None or self.categories[mod_id] == category_id)
+                       and (include_nsfw or not self.records[mod_id].get('_bHasContentRatings', False))]
+        primary = MOD_SEARCH_SORTS.get(sort, lambda record: 0)
+        results.sort(key=lambda record: (primary(record), -scores[record['_idRow']], -(record.get('_tsDateModified') or 0)))
+        return results
+
+
+class LocalModIndex:
+    def __init__(self):
+        self.entries = {}
+        self.postings = {}
+        self.entry_tokens = {}
+        self._sorted_tokens = []
+        self._dirty = False
+
+    def update(self, mod_name, display_name, author, mod_types, installed_at, last_updated, update_available, size=None):
+        self.remove(mod_name)
+        self.entries[mod_name] = {"name": mod_name, "display_name": display_name, "author": author, "types": set(mod_types),
+                                  "installed_at": installed_at or 0, "last_updated": last_updated or 0,
+                                  "update_available": update_available, "size": size}
+        tokens = set(tokenize(mod_name)) | set(tokenize(display_name)) | set(tokenize(author))
+        self.entry_tokens[mod_name] = tokens
+        for token in tokens:
+            if token not in self.postings:
+                self.postings[token] = set()
+                self._dirty = True
+            self.postings[token].add(mod_name)
+
+    def remove(self, mod_name):
+        self.entries.pop(mod_name, None)
+        for token in self.entry_tokens.pop(mod_name, ()):
+            names = self.postings[token]
+            names.discard(mod_name)
+            if not names:
+                del self.postings[token]
+                self._dirty = True
+
+    def set_update_available(self, mod_name, update_available):
+        if mod_name in self.entries:
+            self.entries[mod_name]["update_available"] = update_available
+
+    def set_size(self, mod_name, size):
+        if mod_name in self.entries:
+            self.entries[mod_name]["size"] = size
+
+    def _matching_tokens(self, prefix):
+        if self._dirty:
+            self._sorted_tokens = sorted(self.postings)
+            self._dirty = False
+        start = bisect.bisect_left(self._sorted_tokens, prefix)
+        end = bisect.bisect_left(self._sorted_tokens, prefix + '\uffff')
+        return self._sorted_tokens[start:end]
+
+    def query(self, active_by_name, text="", status=None, mod_type=None, updates_only=False, sort="name"):
+        names = set(active_by_name) & self.entries.keys()
+        for query_token in tokenize(text):
+            matched = set()
+            for token in self._matching_tokens(query_token):
+                matched |= self.postings[token]
+            names &= matched
+            if not names: return []
+        entries = [self.entries[name] for name in names
+                   if (status is None or active_by_name[name] == (status == "active"))
+                   and (mod_type is None or mod_type in self.entries[name]["types"])
+                   and (not updates_only or self.entries[name]["update_available"])]
+        entries.sort(key=LOCAL_MOD_SORTS.get(sort, LOCAL_MOD_SORTS["name"]))
+        return [entry["name"] for entry in entries]
@@ -15,7 +15,7 @@ def resource_path(relative_path):
 import sys
 import os
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QLabel, QComboBox, 
-                             QCheckBox, QGroupBox)
+                             QCheckBox, QGroupBox, QSpinBox)
 from PyQt6.QtCore import pyqtSignal
 
 from translation import Translator 
@@ -23,6 +23,9 @@ from translation import Translator
 class SettingsTab(QWidget):
     particle_animation_toggled = pyqtSignal(bool)
     language_changed = pyqtSignal(str) 
+    download_settings_changed = pyqtSignal()
+    update_check_settings_changed = pyqtSignal()
+    cache_settings_changed = pyqtSignal()
 
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -69,6 +72,76 @@ class SettingsTab(QWidget):
         animation_layout.addWidget(self.particle_animation_checkbox)
         main_layout.addWidget(self.animation_group)
 
+        self.downloads_group = QGroupBox()
+        self.downloads_group.setObjectName("SettingsGroup")
+        downloads_layout = QVBoxLayout(self.downloads_group)
+
+        self.concurrent_downloads_label = QLabel()
+        self.concurrent_downloads_label.setObjectName("SettingsLabel")
+        self.concurrent_downloads_label.setWordWrap(True)
+        downloads_layout.addWidget(self.concurrent_downloads_label)
+
+        self.concurrent_downloads_spinbox = QSpinBox()
+        self.concurrent_downloads_spinbox.setRange(1, 8)
+        self.concurrent_downloads_spinbox.valueChanged.connect(self._on_download_settings_changed)
+        downloads_layout.addWidget(self.concurrent_downloads_spinbox)
+
+        self.speed_limit_label = QLabel()
+        self.speed_limit_label.setObjectName("SettingsLabel")
+        self.speed_limit_label.setWordWrap(True)
+        downloads_layout.addWidget(self.speed_limit_label)
+
+        self.speed_limit_spinbox = QSpinBox()
+        self.speed_limit_spinbox.setRange(0, 1024 * 1024)
+        self.speed_limit_spinbox.setSingleStep(256)
+        self.speed_limit_spinbox.setSuffix(" KB/s")
+        self.speed_limit_spinbox.valueChanged.connect(self._on_download_settings_changed)
+        downloads_layout.addWidget(self.speed_limit_spinbox)
+
+        self.download_segments_label = QLabel()
+        self.download_segments_label.setObjectName("SettingsLabel")
+        self.download_segments_label.setWordWrap(True)
+        downloads_layout.addWidget(self.download_segments_label)
+
+        self.download_segments_spinbox = QSpinBox()
+        self.download_segments_spinbox.setRange(1, 8)
+        self.download_segments_spinbox.valueChanged.connect(self._on_download_settings_changed)
+        downloads_layout.addWidget(self.download_segments_spinbox)
+        main_layout.addWidget(self.downloads_group)
+
+        self.updates_group = QGroupBox()
+        self.updates_group.setObjectName("SettingsGroup")
+        updates_layout = QVBoxLayout(self.updates_group)
+
+        self.update_interval_label = QLabel()
+        self.update_interval_label.setObjectName("SettingsLabel")
+        self.update_interval_label.setWordWrap(True)
+        updates_layout.addWidget(self.update_interval_label)
+
+        self.update_interval_spinbox = QSpinBox()
+        self.update_interval_spinbox.setRange(0, 24 * 60)
+        self.update_interval_spinbox.setSingleStep(15)
+        self.update_interval_spinbox.valueChanged.connect(self._on_update_interval_changed)
+        updates_layout.addWidget(self.update_interval_spinbox)
+        main_layout.addWidget(self.updates_group)
+
+        self.cache_group = QGroupBox()
+        self.cache_group.setObjectName("SettingsGroup")
+        cache_layout = QVBoxLayout(self.cache_group)
+
+        self.image_cache_label = QLabel()
+        self.image_cache_label.setObjectName("SettingsLabel")
+        self.image_cache_label.setWordWrap(True)
+        cache_layout.addWidget(self.image_cache_label)
+
+        self.image_cache_spinbox = QSpinBox()
+        self.image_cache_spinbox.setRange(16, 4096)
+        self.image_cache_spinbox.setSingleStep(50)
+        self.image_cache_spinbox.setSuffix(" MB")
+        self.image_cache_spinbox.valueChanged.connect(self._on_image_cache_size_changed)
+        cache_layout.addWidget(self.image_cache_spinbox)
+        main_layout.addWidget(self.cache_group)
+
         main_layout.addStretch(1)
         
         self.retranslate_ui()
@@ -83,6 +156,21 @@ class SettingsTab(QWidget):
         self.animation_label.setText(t("settings.animation_label"))
         self.particle_animation_checkbox.setText(t("settings.animation_checkbox"))
 
+        self.downloads_group.setTitle(t("settings.downloads_section_title"))
+        self.concurrent_downloads_label.setText(t("settings.concurrent_downloads_label"))
+        self.speed_limit_label.setText(t("settings.speed_limit_label"))
+        self.speed_limit_spinbox.setSpecialValueText(t("settings.speed_limit_unlimited"))
+        self.download_segments_label.setText(t("settings.download_segments_label"))
+        self.download_segments_spinbox.setSpecialValueText(t("settings.download_segments_off"))
+
+        self.updates_group.setTitle(t("settings.updates_section_title"))
+        self.update_interval_label.setText(t("settings.update_interval_label"))
+        self.update_interval_spinbox.setSuffix(" " + t("settings.update_interval_suffix"))
+        self.update_interval_spinbox.setSpecialValueText(t("settings.update_interval_disabled"))
+
+        self.cache_group.setTitle(t("settings.cache_section_title"))
+        self.image_cache_label.setText(t("settings.image_cache_size_label"))
+
         self.language_combo_box.blockSignals(True)
         current_code = self.language_combo_box.currentData()
         self.language_combo_box.clear()
@@ -110,6 +198,24 @@ class SettingsTab(QWidget):
             particle_enabled = config.get("particle_animation_enabled", False)
             self.particle_animation_checkbox.setChecked(particle_enabled)
 
+            self.concurrent_downloads_spinbox.blockSignals(True)
+            self.speed_limit_spinbox.blockSignals(True)
+            self.download_segments_spinbox.blockSignals(True)
+            self.concurrent_downloads_spinbox.setValue(config.get("max_concurrent_downloads", 2))
+            self.speed_limit_spinbox.setValue(config.get("download_speed_limit_kbps", 0))
+            self.download_segments_spinbox.setValue(config.get("download_segments", 1))
+            self.concurrent_downloads_spinbox.blockSignals(False)
+            self.speed_limit_spinbox.blockSignals(False)
+            self.download_segments_spinbox.blockSignals(False)
+
+            self.update_interval_spinbox.blockSignals(True)
+            self.update_interval_spinbox.setValue(config.get("update_check_interval_minutes", 60))
+            self.update_interval_spinbox.blockSignals(False)
+
+            self.image_cache_spinbox.blockSignals(True)
+            self.image_cache_spinbox.setValue(config.get("image_cache_size_mb", 200))
+            self.image_cache_spinbox.blockSignals(False)
+
     def _on_language_changed(self, index):
         if index == -1: return
         
@@ -121,4 +227,24 @@ class SettingsTab(QWidget):
                 self.language_changed.emit(selected_lang_code)
 
     def _on_particle_animation_toggled(self, checked):
-        self.particle_animation_toggled.emit(checked)
\ No newline at end of file
+        self.particle_animation_toggled.emit(checked)
+
+    def _on_download_settings_changed(self, value):
+        if self.main_window and hasattr(self.main_window, 'config'):
+            self.main_window.config["max_concurrent_downloads"] = self.concurrent_downloads_spinbox.value()
+            self.main_window.config["download_speed_limit_kbps"] = self.speed_limit_spinbox.value()
+            self.main_window.config["download_segments"] = self.download_segments_spinbox.value()
+            self.main_window.save_config()
+            self.download_settings_changed.emit()
+
+    def _on_update_interval_changed(self, value):
+        if self.main_window and hasattr(self.main_window, 'config'):
+            self.main_window.config["update_check_interval_minutes"] = value
+            self.main_window.save_config()
+            self.update_check_settings_changed.emit()
+
+    def _on_image_cache_size_changed(self, value):
+        if self.main_window and hasattr(self.main_window, 'config'):
+            self.main_window.config["image_cache_size_mb"] = value
+            self.main_window.save_config()
+            self.cache_settings_changed.emit()
\ No newline at end of file
@@ -0,0 +1,120 @@
+import hashlib
+import os
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+import download_tab
+from download_tab import Downloader
+
+SEGMENT_SIZE = 1024 * 1024
+SEGMENTS = 4
+DATA = os.urandom(SEGMENT_SIZE * SEGMENTS)
+DATA_MD5 = hashlib.md5(DATA).hexdigest()
+WRITE_PIECE = 16 * 1024
+
+
+class RangeHandler(BaseHTTPRequestHandler):
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        match = re.match(r'bytes=(\d+)-(\d*)', self.headers.get('Range', ''))
+        start = int(match.group(1)) if match else 0
+        end = int(match.group(2)) if match and match.group(2) else len(DATA) - 1
+        self.server.requests.append((start, end))
+        action = self.server.plan(start, end) if start != end else None
+        if action == "forbidden":
+            self.send_error(403)
+            return
+        self.send_response(206 if match else 200)
+        self.send_header('Content-Length', str(end + 1 - start))
+        self.send_header('Content-Range', f"bytes {start}-{end}/{len(DATA)}")
+        self.send_header('ETag', '"test-etag"')
+        self.end_headers()
+        body = DATA[start:end + 1]
+        limit = len(body) // 2 if action == "drop" else len(body)
+        delay = 0.05 if action == "slow" else 0.005 if action == "drop" else 0
+        try:
+            for offset in range(0, limit, WRITE_PIECE):
+                self.wfile.write(body[offset:min(offset + WRITE_PIECE, limit)])
+                self.wfile.flush()
+                if delay: time.sleep(delay)
+        except (BrokenPipeError, ConnectionResetError):
+            self.server.aborted.append(start)
+        if action == "drop":
+            self.close_connection = True
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), RangeHandler)
+    httpd.daemon_threads = True
+    httpd.requests = []
+    httpd.aborted = []
+    httpd.plan = lambda start, end: None
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+@pytest.fixture(autouse=True)
+def download_env(tmp_path, monkeypatch):
+    monkeypatch.setattr(download_tab, "DOWNLOADS_DIR", str(tmp_path))
+    monkeypatch.setattr(download_tab, "SEGMENTED_MIN_SIZE", 1)
+    monkeypatch.setattr(download_tab, "DOWNLOAD_BACKOFF_BASE", 0.0)
+    return tmp_path
+
+
+def run_download(server, segments=SEGMENTS):
+    url = f"http://127.0.0.1:{server.server_port}/mod.zip"
+    downloader = Downloader(url, "mod.zip", "Mod", {}, expected_md5=DATA_MD5, segments=segments)
+    results, errors = [], []
+    downloader.finished.connect(lambda path, name, info: results.append(path))
+    downloader.error.connect(errors.append)
+    downloader.run()
+    return results, errors
+
+
+def test_segmented_download_resumes_dropped_segment(server, download_env):
+    second_segment = SEGMENT_SIZE
+    dropped = []
+
+    def plan(start, end):
+        if start == second_segment and not dropped:
+            dropped.append(start)
+            return "drop"
+        return None
+    server.plan = plan
+
+    results, errors = run_download(server)
+
+    assert errors == []
+    with open(results[0], 'rb') as f:
+        assert hashlib.md5(f.read()).hexdigest() == DATA_MD5
+    retried = [start for start, end in server.requests if second_segment < start < second_segment + SEGMENT_SIZE]
+    assert retried, "the dropped segment should resume from its saved offset"
+    assert not os.path.exists(results[0] + download_tab.PART_SUFFIX)
+
+
+def test_single_stream_is_the_default(server):
+    results, errors = run_download(server, segments=download_tab.DEFAULT_DOWNLOAD_SEGMENTS)
+
+    assert errors == []
+    assert server.requests == [(0, len(DATA) - 1)]
+
+
+def test_failed_segment_cancels_its_siblings(server):
+    server.plan = lambda start, end: "forbidden" if start == SEGMENT_SIZE else "slow"
+
+    started = time.monotonic()
+    results, errors = run_download(server)
+    elapsed = time.monotonic() - started
+
+    assert results == [] and len(errors) == 1 and "403" in errors[0]
+    slow_transfer_time = SEGMENT_SIZE / WRITE_PIECE * 0.05
+    assert elapsed < slow_transfer_time / 2